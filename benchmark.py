@@ -0,0 +1,415 @@
+# Набор задач для замера производительности движков SimplexMethod.
+# Запуск: python benchmark.py --generators random klee_minty --sizes 10 20 --output results.json
+# (куб Кли-Минти размерности 20 останавливается по ограничению --max-iterations со статусом "iteration_limit")
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import simplex_method
+from simplex_method import SimplexMethod
+
+# Конфигурации движков: название -> (engine, sparse)
+ENGINES = {
+    "python": ("python", False),
+    "numpy": ("numpy", False),
+    "revised": ("revised", False),
+    "revised_sparse": ("revised", True),
+    "interior": ("interior", False),
+}
+
+# Допуск относительного замедления, при превышении которого результат считается регрессией
+REGRESSION_THRESHOLD = 0.2
+
+# Наименьшее замедление в секундах, которое считается регрессией (более короткие различия - шум замера)
+REGRESSION_MIN_DELTA = 0.01
+
+# Ограничение числа итераций одного решения по умолчанию: куб Кли-Минти размерности size
+# требует 2^size - 1 итераций, и без ограничения замер на больших размерах не завершается
+DEFAULT_MAX_ITERATIONS = 2000
+
+
+def _problem(objective, objective_sense, rows, constraint_senses, constraint_rhs, number_of_variables,
+             expected_status, expected_objective=None):
+    """
+    Собирает сгенерированную ЗЛП в словарь (коэффициенты - в формате {индекс: коэффициент}),
+    "expected" - ожидаемый статус решения и (если известно) оптимальное значение целевой функции.
+    """
+    return {
+        "objective": objective,
+        "objective_sense": objective_sense,
+        "rows": rows,
+        "constraint_senses": constraint_senses,
+        "constraint_rhs": constraint_rhs,
+        "number_of_variables": number_of_variables,
+        "expected": {"status": expected_status, "objective": expected_objective},
+    }
+
+
+def _random_rows(rnd, m, n, density):
+    """
+    Генерирует m непустых строк с положительными целыми коэффициентами (доля ненулевых - density).
+    """
+    rows = []
+    for _ in range(m):
+        row = {j: rnd.randint(1, 9) for j in range(n) if rnd.random() < density}
+        if not row:
+            row[rnd.randrange(n)] = rnd.randint(1, 9)
+        rows.append(row)
+    return rows
+
+
+def random_feasible(size, density=0.3, seed=0):
+    """
+    Случайная допустимая и ограниченная ЗЛП с size ограничениями и size переменными.
+    Ограничения всех трёх типов строятся вокруг случайной точки x0 >= 0 (поэтому ЗЛП допустима),
+    а каждая переменная входит с положительным коэффициентом хотя бы в одно ограничение "<=",
+    поэтому область допустимых решений ограничена.
+    """
+    rnd = random.Random(seed)
+    m = n = size
+    x0 = [rnd.randint(0, 5) for _ in range(n)]
+    rows = _random_rows(rnd, m, n, density)
+
+    # Первое ограничение всегда "<=", остальные - "<=" примерно в 60% случаев
+    senses = ["<="] + [rnd.choice(["<=", "<=", "<=", ">=", "="]) for _ in range(m - 1)]
+    bounding_rows = [i for i in range(m) if senses[i] == "<="]
+    for j in range(n):
+        if not any(j in rows[i] for i in bounding_rows):
+            rows[rnd.choice(bounding_rows)][j] = rnd.randint(1, 9)
+
+    rhs = []
+    for row, sense in zip(rows, senses):
+        value = sum(a * x0[j] for j, a in row.items())
+        if sense == "<=":
+            rhs.append(value + rnd.randint(0, 10))
+        elif sense == ">=":
+            rhs.append(max(value - rnd.randint(0, 10), 0))
+        else:
+            rhs.append(value)
+
+    # В ограничения ">=" и "=" добавляем случайные отрицательные коэффициенты при переменных с x0 = 0,
+    # чтобы задача не решалась тривиально
+    for row, sense in zip(rows, senses):
+        if sense != "<=":
+            for j in range(n):
+                if x0[j] == 0 and j not in row and rnd.random() < density / 2:
+                    row[j] = -rnd.randint(1, 9)
+    objective = {j: rnd.randint(-5, 20) for j in range(n)}
+    return _problem(objective, "max", rows, senses, rhs, n, "optimal")
+
+
+def klee_minty(size, density=None, seed=None):
+    """
+    Куб Кли-Минти размерности size: max sum(2^(size-j) * x_j)
+    при 2 * sum(2^(i-j) * x_j, j < i) + x_i <= 5^i, x >= 0.
+    Правило Данцига проходит все 2^size - 1 вершин, оптимум равен 5^size (x_size = 5^size).
+    """
+    n = size
+    objective = {j: 2 ** (n - 1 - j) for j in range(n)}
+    rows = []
+    for i in range(n):
+        row = {j: 2 ** (i - j + 1) for j in range(i)}
+        row[i] = 1
+        rows.append(row)
+    rhs = [5 ** (i + 1) for i in range(n)]
+    return _problem(objective, "max", rows, ["<="] * n, rhs, n, "optimal", 5 ** n)
+
+
+def transportation(size, density=None, seed=0):
+    """
+    Вырожденная сбалансированная транспортная задача с size поставщиками и size потребителями:
+    суммарный запас равен суммарной потребности, все ограничения - равенства (одно из них избыточно),
+    а частичные суммы запасов и потребностей совпадают, что даёт вырожденные базисные решения.
+    """
+    rnd = random.Random(seed)
+    m = n = size
+    supply = [rnd.randint(1, 5) * 10 for _ in range(m)]
+    demand = list(supply)
+    rnd.shuffle(demand)
+
+    def var(i, j):
+        return i * n + j
+
+    objective = {var(i, j): rnd.randint(1, 20) for i in range(m) for j in range(n)}
+    rows = [{var(i, j): 1 for j in range(n)} for i in range(m)]
+    rows += [{var(i, j): 1 for i in range(m)} for j in range(n)]
+    return _problem(objective, "min", rows, ["="] * (m + n), supply + demand, m * n, "optimal")
+
+
+def assignment(size, density=None, seed=0):
+    """
+    Задача о назначениях size x size: каждый работник выполняет ровно одну работу, каждая работа
+    выполняется ровно одним работником. Любое базисное решение имеет size - 1 нулевых базисных переменных.
+    """
+    rnd = random.Random(seed)
+    n = size
+    objective = {i * n + j: rnd.randint(1, 50) for i in range(n) for j in range(n)}
+    rows = [{i * n + j: 1 for j in range(n)} for i in range(n)]
+    rows += [{i * n + j: 1 for i in range(n)} for j in range(n)]
+    return _problem(objective, "min", rows, ["="] * (2 * n), [1] * (2 * n), n * n, "optimal")
+
+
+def infeasible(size, density=0.3, seed=0):
+    """
+    Случайная ЗЛП (см. `random_feasible`), в которую добавлено ограничение ">=", противоречащее
+    первому ограничению (оно всегда "<="): a * x <= b и a * x >= b + 1.
+    """
+    problem = random_feasible(size, density, seed)
+    problem["rows"].append(dict(problem["rows"][0]))
+    problem["constraint_senses"].append(">=")
+    problem["constraint_rhs"].append(problem["constraint_rhs"][0] + 1)
+    problem["expected"]["status"] = "infeasible"
+    return problem
+
+
+def unbounded(size, density=0.3, seed=0):
+    """
+    Случайная ЗЛП (см. `random_feasible`) с дополнительной переменной, которая увеличивает
+    целевую функцию и входит только в ограничения "<=" с неположительными коэффициентами,
+    поэтому её можно неограниченно увеличивать.
+    """
+    problem = random_feasible(size, density, seed)
+    rnd = random.Random(seed)
+    extra = problem["number_of_variables"]
+    for row, sense in zip(problem["rows"], problem["constraint_senses"]):
+        if sense == "<=" and rnd.random() < density:
+            row[extra] = -rnd.randint(1, 9)
+    problem["objective"][extra] = 1
+    problem["number_of_variables"] += 1
+    problem["expected"]["status"] = "unbounded"
+    return problem
+
+
+def badly_scaled(size, density=0.5, seed=0, spread=4):
+    """
+    Случайная допустимая и ограниченная ЗЛП с size ограничениями "<=" и size переменными, у которой строки,
+    столбцы и коэффициенты целевой функции домножены на случайные множители от 10^-spread до 10^spread,
+    так что коэффициенты отличаются на много порядков (для проверки параметра scaling).
+    Правые части строятся по случайной точке x0 > 0, поэтому ЗЛП допустима, а положительные коэффициенты
+    в каждом столбце делают её ограниченной.
+    """
+    rnd = random.Random(seed)
+    m = n = size
+    row_factors = [10 ** rnd.uniform(-spread, spread) for _ in range(m)]
+    column_factors = [10 ** rnd.uniform(-spread, spread) for _ in range(n)]
+    rows = [{j: a * row_factors[i] * column_factors[j] for j, a in row.items()}
+            for i, row in enumerate(_random_rows(rnd, m, n, density))]
+    for j in range(n):
+        if not any(j in row for row in rows):
+            i = rnd.randrange(m)
+            rows[i][j] = rnd.randint(1, 9) * row_factors[i] * column_factors[j]
+
+    x0 = [rnd.random() for _ in range(n)]
+    rhs = [sum(a * (x0[j] + 0.1) for j, a in row.items()) for row in rows]
+    objective = {j: rnd.randint(1, 9) * 10 ** rnd.uniform(-spread, spread) for j in range(n)}
+    return _problem(objective, "max", rows, ["<="] * m, rhs, n, "optimal")
+
+
+# Генераторы ЗЛП: название -> функция (size, density, seed)
+GENERATORS = {
+    "random": random_feasible,
+    "badly_scaled": badly_scaled,
+    "klee_minty": klee_minty,
+    "transportation": transportation,
+    "assignment": assignment,
+    "infeasible": infeasible,
+    "unbounded": unbounded,
+}
+
+
+def to_txt(problem):
+    """
+    Возвращает ЗЛП в txt-формате, который читает `SimplexMethod.load_problem`.
+    """
+    def terms(row):
+        return " ".join(f"{a:+}x{j + 1}" for j, a in sorted(row.items()) if a != 0)
+
+    lines = [f"{terms(problem['objective'])} -> {problem['objective_sense']}"]
+    for row, sense, b in zip(problem["rows"], problem["constraint_senses"], problem["constraint_rhs"]):
+        lines.append(f"{terms(row)} {sense} {b}")
+    return "\n".join(lines) + "\n"
+
+
+def write_problem(problem, file_path):
+    """
+    Сохраняет ЗЛП в txt-файл.
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(to_txt(problem))
+
+
+def load(problem, sparse=False):
+    """
+    Загружает сгенерированную ЗЛП в новый экземпляр SimplexMethod без записи на диск.
+    """
+    return SimplexMethod.from_data(problem["objective"], problem["rows"], problem["constraint_senses"],
+                                   problem["constraint_rhs"], problem["objective_sense"],
+                                   number_of_variables=problem["number_of_variables"], sparse=sparse)
+
+
+def run_case(problem, engine="numpy", repeat=3, **solve_options):
+    """
+    Решает ЗЛП движком engine (название из ENGINES) repeat раз и возвращает словарь с результатом:
+    статусом (при сработавшем ограничении max_iterations или time_limit - его статусом), числом итераций,
+    наименьшим и медианным временем решения (без загрузки) в секундах, пиковым объёмом выделенной
+    при решении памяти в байтах (отдельный запуск под tracemalloc) и признаком совпадения с ожидаемым результатом.
+    """
+    engine_name, sparse = ENGINES[engine]
+    result = {"engine": engine, "status": None, "iterations": None, "time": None, "median_time": None,
+              "peak_memory": None, "objective": None, "correct": False}
+    try:
+        times = []
+        for _ in range(repeat):
+            sm = load(problem, sparse)
+            start = time.perf_counter()
+            answer = sm.get_solution(engine=engine_name, **solve_options)
+            times.append(time.perf_counter() - start)
+
+        # Пиковую память замеряем отдельно: tracemalloc заметно замедляет решение
+        sm_memory = load(problem, sparse)
+        tracemalloc.start()
+        try:
+            sm_memory.get_solution(engine=engine_name, **solve_options)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except (ImportError, ValueError) as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    expected = problem["expected"]
+    result.update(status=sm.status, iterations=sm.iterations, time=min(times), median_time=statistics.median(times),
+                  peak_memory=peak, objective=answer[1] if answer is not None else None)
+    result["correct"] = sm.status == expected["status"] and (
+        expected["objective"] is None or abs(result["objective"] - expected["objective"]) <= 1e-6 * max(1, abs(expected["objective"])))
+    return result
+
+
+def run_benchmark(generators=None, sizes=(10, 20), engines=None, density=0.3, seed=0, repeat=3,
+                  **solve_options):
+    """
+    Прогоняет все сочетания генераторов, размеров и движков и выдаёт результаты по одному
+    (словари `run_case`, дополненные названием генератора, размером и размерами ЗЛП).
+    solve_options - дополнительные параметры `get_solution` (например, method="dual").
+    """
+    for generator in generators or GENERATORS:
+        for size in sizes:
+            problem = GENERATORS[generator](size, density=density, seed=seed)
+            for engine in engines or ENGINES:
+                result = {"generator": generator, "size": size, "rows": len(problem["rows"]),
+                          "columns": problem["number_of_variables"]}
+                result.update(run_case(problem, engine, repeat, **solve_options))
+                yield result
+
+
+def environment():
+    """
+    Возвращает сведения об окружении, в котором выполнялся замер.
+    """
+    numpy = simplex_method.np
+    scipy = sys.modules.get("scipy")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__ if numpy is not None else None,
+        "scipy": scipy.__version__ if scipy is not None else None,
+        "cache_version": simplex_method.CACHE_VERSION,
+    }
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD, min_delta=REGRESSION_MIN_DELTA):
+    """
+    Сравнивает результаты с результатами прошлого замера (списки словарей `run_benchmark`)
+    и возвращает список регрессий: случаев, где медианное время выросло больше чем в (1 + threshold) раз
+    и больше чем на min_delta секунд, изменилось число итераций или результат перестал совпадать с ожидаемым.
+    """
+    def key(result):
+        return result["generator"], result["size"], result["engine"]
+
+    previous = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(key(result))
+        if old is None:
+            continue
+        reasons = []
+        if old["correct"] and not result["correct"]:
+            reasons.append("incorrect")
+        if old["iterations"] is not None and result["iterations"] != old["iterations"]:
+            reasons.append(f"iterations {old['iterations']} -> {result['iterations']}")
+        # В старых замерах медианного времени нет - сравниваем наименьшее
+        old_time = old.get("median_time") or old["time"]
+        new_time = result.get("median_time") or result["time"]
+        if old_time and new_time is not None and new_time > old_time * (1 + threshold) \
+                and new_time - old_time > min_delta:
+            reasons.append(f"time x{new_time / old_time:.2f}")
+        if reasons:
+            regressions.append({"generator": result["generator"], "size": result["size"],
+                                "engine": result["engine"], "reasons": reasons})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замер производительности движков SimplexMethod")
+    parser.add_argument("--generators", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 20])
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--method", choices=simplex_method.SIMPLEX_METHODS, default="auto")
+    parser.add_argument("--scaling", choices=simplex_method.SCALING_METHODS, default=None)
+    parser.add_argument("--max-iterations", type=int, default=DEFAULT_MAX_ITERATIONS,
+                        help="наибольшее число итераций одного решения (0 - без ограничения)")
+    parser.add_argument("--time-limit", type=float, default=None, help="ограничение времени одного решения в секундах")
+    parser.add_argument("--output", help="файл для результатов в формате JSON (по умолчанию - stdout)")
+    parser.add_argument("--baseline", help="JSON-файл прошлого замера для поиска регрессий")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="допуск относительного замедления медианного времени")
+    parser.add_argument("--min-delta", type=float, default=REGRESSION_MIN_DELTA,
+                        help="наименьшее замедление в секундах, которое считается регрессией")
+    parser.add_argument("--write-dir", help="каталог, в который сохраняются сгенерированные ЗЛП в txt-формате")
+    args = parser.parse_args(argv)
+
+    if args.write_dir:
+        for generator in args.generators:
+            for size in args.sizes:
+                problem = GENERATORS[generator](size, density=args.density, seed=args.seed)
+                write_problem(problem, f"{args.write_dir}/{generator}_{size}.txt")
+
+    results = []
+    for result in run_benchmark(args.generators, args.sizes, args.engines, args.density, args.seed,
+                                args.repeat, method=args.method, scaling=args.scaling,
+                                max_iterations=args.max_iterations or None, time_limit=args.time_limit):
+        results.append(result)
+        # Краткий ход замера выводим в stderr, чтобы не смешивать его с JSON в stdout
+        time_text = f"{result['time']:.4f} с" if result["time"] is not None else "-"
+        print(f"{result['generator']:>14} {result['size']:>5} {result['engine']:>14} {result['status']:>10} "
+              f"{str(result['iterations']):>7} {time_text:>10}" + ("" if result["correct"] else "  !"),
+              file=sys.stderr)
+
+    report = {"environment": environment(), "options": vars(args), "results": results}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            report["regressions"] = compare(results, json.load(f)["results"], args.threshold, args.min_delta)
+        for regression in report["regressions"]:
+            print("Регрессия:", regression, file=sys.stderr)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
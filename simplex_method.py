@@ -1,454 +1,4537 @@
 # Для реализации симплекс-метода использовался алгоритм с сайта:
 # https://programforyou.ru/calculators/simplex-method
 
+import asyncio
+import hashlib
+import json
+import os
 import re
+import shutil
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
+from multiprocessing import Pool
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy нужен только для движка "numpy"
+    np = None
 
-class SimplexMethod:
-    """
-    Класс для реализации симплекс-метода для решения задачи линейного программирования (ЗЛП).
-    """
-    def __init__(self):
-        """
-        Метод для инициализации класса.
-        """
-        # Список коэффициентов целевой функции
-        self.objective_coefficients: list[int]
+try:
+    import scipy.sparse as sp
+    from scipy.linalg import blas, cho_factor, cho_solve
+    from scipy.sparse.linalg import splu
+except ImportError:
+    # SciPy нужен только для разреженного представления ЗЛП
+    sp = None
+    blas = None
 
-        # Направление оптимизации ('max' или 'min')
-        self.objective_sense: str
+# Допуск для сравнения чисел с плавающей точкой
+EPS = 1e-9
 
-        # Матрица с коэффициентами ограничений
-        self.constraint_matrix: list[list[int]]
+# Правила выбора разрешающего столбца (ценообразования) для движков "numpy" и "revised"
+PRICING_RULES = ("dantzig", "partial", "devex", "steepest_edge")
 
-        # Список с типами ограничений ('>=', '<=', '=')
-        self.constraint_senses: list[str]
+# Варианты симплекс-метода (см. `get_solution`)
+SIMPLEX_METHODS = ("primal", "dual", "auto")
 
-        # Список с правыми частями ограничений
-        self.constraint_rhs = list[int]
+# Правила защиты от зацикливания (см. `get_solution`)
+ANTI_CYCLING_RULES = ("bland", "lexicographic")
 
-        # Таблица с ЗЛП в каноническом виде (в ограничениях используются только равенства)
-        # Пример:
-        # [20, 20, 10, 0, 0, 0, "max"]
-        # [-4, -3, -2, 1, 0, 0, -33],
-        # [-3, -2, -1, 0, 1, 0, -23],
-        # [-1, -1, -2, 0, 0, 1, -12]
-        self.canonical_problem_table: list[list]
+# Число вырожденных итераций подряд (с нулевым шагом), после которого включается защита от зацикливания
+ANTI_CYCLING_THRESHOLD = 50
 
+# Статусы решения, остановленного до получения ответа (см. `get_solution`)
+LIMIT_STATUSES = ("iteration_limit", "time_limit", "cancelled")
 
-    def load_problem(self, file_path: str) -> None:
-        """
-        Метод для загрузки ЗЛП. На вход принимает путь до txt-файла с ЗЛП.
-        Пример ожидаемого формата в txt-файле:
+# Наибольшее число итераций и допуск сходимости (относительные невязки и зазор) метода внутренней точки
+INTERIOR_MAX_ITERATIONS = 100
+INTERIOR_TOLERANCE = 1e-8
 
-        ```
-        2x1 +3x2 +x3 +4x4 -> max
-        x1 +x2 +x3 +x4 <= 10
-        2x1 +x2 -x3 +x4 = 8
-        x2 +2x3 +x4 >= 5
-        ```
-        """
+# Доля шага до границы ортанта x >= 0, z >= 0, на которую сдвигается точка метода внутренней точки
+INTERIOR_STEP_FACTOR = 0.99
 
-        # === ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ===
+# Число сегментов, на которые делятся столбцы при частичном ценообразовании
+PARTIAL_PRICING_SEGMENTS = 10
 
-        # Паттерн для извлечения коэффициента и индекса X из строки
-        pattern = re.compile(r'^([+-]?)(\d*)x(\d+)$')
+# Способы масштабирования матрицы ограничений (см. `_scaling_factors`)
+SCALING_METHODS = ("geometric", "equilibration", "geometric_equilibration")
 
-        def parse_coefficient_index(s: str) -> tuple[int,int]:
-            """
-            Функция для извлечения коэффициента и индекса X из строки.
-            Примеры работы:
-            ```
-            "2x1" -> (2, 1)
-            "+3x2" -> (3, 2)
-            "+x3" -> (1, 3)
-            "-x3" -> (-1, 3)
-            "-5x4" -> (-5, 4)
-            "x6" -> (1, 6)
-            ```
-            """
-            m = pattern.match(s)
-            sign, coefficient, index = m.groups()
-            coefficient = int(coefficient) if coefficient else 1
-            if sign == '-':
-                coefficient = -coefficient
-            
-            # В Python индексы начинаются с нуля, так что возвращаем (index - 1)
-            return coefficient, int(index) - 1
+# Число проходов геометрического масштабирования
+GEOMETRIC_SCALING_PASSES = 4
 
-        # ===============================
-        
-        # Считываем все непустые строки из txt-файла, убирая '\n' и лишние пробелы по краям
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f if line.strip() != '']
-        
-        # Строка с целевой функцией
-        objective_function = lines[0]
-        
-        # Разбиваем строку с целевой функцией на отдельные элементы
-        objective_function = objective_function.split()
-        
-        # Удаляем элемент '->' (он не нужен для дальнейших расчётов)
-        objective_function.pop(-2)
+# Версия формата двоичного кэша ЗЛП (при изменении формата старые записи перестают использоваться)
+CACHE_VERSION = 3
 
-        # Направление оптимизации ('max' или 'min')
-        objective_sense = objective_function.pop(-1)
+# Ограничение на суммарный размер двоичного кэша ЗЛП по умолчанию (1 ГиБ)
+CACHE_MAX_BYTES = 1 << 30
 
-        # Преобразуем элементы-строки в картежи вида (коэффициент, индекс)
-        # Пример преобразования элемента: "-5x4" -> (-5, 4)
-        for i in range(len(objective_function)):
-            objective_function[i] = parse_coefficient_index(objective_function[i])
-        
-        # Список со строками с ограничениями
-        constraints = lines[1:]
 
-        # Разбиваем строки с ограничениями на отдельные элементы
-        for i in range(len(constraints)):
-            constraints[i] = constraints[i].split()
-        
-        # Список с типами ограничений ('>=', '<=', '=')
-        constraint_senses = []
+def _parse_number(s):
+    """
+    Преобразует строку в int (если это целое число) или во float.
+    """
+    try:
+        return int(s)
+    except ValueError:
+        return float(s)
 
-        # Список с правыми частями ограничений
-        constraint_rhs = []
 
-        # Заполняем списки с типами и правыми частями ограничений
-        for c in constraints:
-            constraint_senses.append(c.pop(-2))
-            constraint_rhs.append(int(c.pop(-1)))
-        
-        # Преобразуем оставшиеся элементы в формат (коэффициент, индекс)
-        for c in constraints:
-            for i in range(len(c)):
-                c[i] = parse_coefficient_index(c[i])
-
-        # Получаем число значимых переменных
-        # (оно равно наибольшему индексу X, встречающемуся в ЗЛП)
-        number_of_variables = max(i for _, i in objective_function) + 1
-        for c in constraints:
-            c_i_max = max(i for _, i in c) + 1
-            number_of_variables = max(number_of_variables, c_i_max)
+def _select_entering_column(scores, weights, pricing, state):
+    """
+    Выбирает разрешающий столбец по правилу ценообразования.
+    scores - улучшение целевой функции на единицу изменения переменной (кандидаты - положительные значения),
+    weights - веса столбцов для правил "devex" и "steepest_edge",
+    state - словарь с номером сегмента, с которого начинается частичное ценообразование.
+    Возвращает индекс столбца или None, если кандидатов нет.
+    """
+    if pricing == "dantzig":
+        j = int(np.argmax(scores))
+        return j if scores[j] > 0 else None
 
-        # Создаём список для коэффициентов целевой функции
-        # (изначально заполняем его нулями)
-        objective_coefficients = [0 for _ in range(number_of_variables)]
+    if pricing in ("devex", "steepest_edge"):
+        candidates = scores > 0
+        if not candidates.any():
+            return None
+        ratios = np.where(candidates, scores, 0.0) ** 2 / weights
+        return int(np.argmax(ratios))
 
-        # Заполняем список коэффициентами целевой функции
-        # ci - (coefficient, index)
-        for ci in objective_function:
-            objective_coefficients[ci[1]] = ci[0]
-        
-        # Создаём матрицу с коэффициентами ограничений
-        # (изначально заполняем её нулями)
-        constraint_matrix = []
-        for _ in range(len(constraints)):
-            constraint_matrix.append([0 for _ in range(number_of_variables)])
-        
-        # Заполняем матрицу с коэффициентами ограничений соответствующими значениями
-        for row_i in range(len(constraints)):
-            for ci in constraints[row_i]:
-                constraint_matrix[row_i][ci[1]] = ci[0]
-        
-        # Загружаем полученные параметры ЗЛП в глобальные переменные класса
-        self.objective_coefficients = objective_coefficients
-        self.objective_sense = objective_sense
-        self.constraint_matrix = constraint_matrix
-        self.constraint_senses = constraint_senses
-        self.constraint_rhs = constraint_rhs
+    if pricing == "bland":
+        # Правило Бланда: первый столбец, улучшающий решение
+        candidates = np.flatnonzero(scores > 0)
+        return int(candidates[0]) if len(candidates) > 0 else None
 
-        # Создаём глобальную переменную для хранения базиса симплекс-таблицы
-        self.basis_indexes = [None for _ in range(len(constraint_matrix))]
+    if pricing == "partial":
+        # Просматриваем сегменты по кругу, начиная с сохранённого,
+        # и берём лучший столбец в первом сегменте, где есть кандидаты
+        size = -(-len(scores) // PARTIAL_PRICING_SEGMENTS)
+        number_of_segments = -(-len(scores) // size)
+        for k in range(number_of_segments):
+            segment = (state["segment"] + k) % number_of_segments
+            lo = segment * size
+            part = scores[lo:lo + size]
+            j = int(np.argmax(part))
+            if part[j] > 0:
+                state["segment"] = (segment + 1) % number_of_segments
+                return lo + j
+        return None
+
+    raise ValueError(f"Неизвестное правило ценообразования: {pricing}")
 
-        # Преобразуем параметры ЗЛП к каноническому виду
-        self._convert_problem_to_canonical_form()
 
+def _lexicographic_min(vectors):
+    """
+    Возвращает номер лексикографически наименьшей строки матрицы vectors
+    (значения, отличающиеся меньше чем на EPS, считаются равными).
+    """
+    candidates = np.arange(len(vectors))
+    for k in range(vectors.shape[1]):
+        values = vectors[candidates, k]
+        candidates = candidates[values <= values.min() + EPS]
+        if len(candidates) == 1:
+            break
+    return int(candidates[0])
+
+
+def _scaling_factors(rows, columns, values, shape, scaling):
+    """
+    Вычисляет множители строк r и столбцов s, после умножения на которые (r_i * a_ij * s_j)
+    ненулевые коэффициенты матрицы становятся ближе к единице.
+    rows, columns, values - позиции и модули ненулевых коэффициентов, shape - размеры матрицы.
+    - "geometric" - несколько проходов деления строк и столбцов на среднее геометрическое
+      наибольшего и наименьшего коэффициента;
+    - "equilibration" - деление строк, а затем столбцов на наибольший по модулю коэффициент;
+    - "geometric_equilibration" - геометрическое масштабирование и затем уравновешивание.
+    Множители округляются до степеней двойки, чтобы масштабирование не вносило погрешностей округления.
+    """
+    if scaling not in SCALING_METHODS:
+        raise ValueError(f"Неизвестный способ масштабирования: {scaling}")
 
-    def get_solution(self, precision=8):
+    m, n = shape
+    r = np.ones(m)
+    s = np.ones(n)
+
+    def extremes(index, size, scaled):
         """
-        Выдаёт решение канонической задачи линейного программирование, используя симплекс-метод.
+        Наибольший и наименьший коэффициент в каждой строке (или столбце); для пустых - единицы.
         """
+        largest = np.zeros(size)
+        smallest = np.full(size, np.inf)
+        np.maximum.at(largest, index, scaled)
+        np.minimum.at(smallest, index, scaled)
+        empty = largest == 0
+        largest[empty] = 1
+        smallest[empty] = 1
+        return largest, smallest
 
-        # Коэффициенты целевой функции (coefficients)
-        self.c = self.canonical_problem_table[0].copy()
-        self.c.pop()
+    if scaling in ("geometric", "geometric_equilibration"):
+        for _ in range(GEOMETRIC_SCALING_PASSES):
+            largest, smallest = extremes(rows, m, values * r[rows] * s[columns])
+            r /= np.sqrt(largest * smallest)
+            largest, smallest = extremes(columns, n, values * r[rows] * s[columns])
+            s /= np.sqrt(largest * smallest)
 
-        # Цель задачи (найти максимум или минимум) (objective)
-        self.obj = self.canonical_problem_table[0][-1]
+    if scaling in ("equilibration", "geometric_equilibration"):
+        largest, _ = extremes(rows, m, values * r[rows] * s[columns])
+        r /= largest
+        largest, _ = extremes(columns, n, values * r[rows] * s[columns])
+        s /= largest
 
-        # Симплекс-таблица (simplex table)
-        self.st = [row.copy() for row in self.canonical_problem_table[1:]]
+    return np.exp2(np.round(np.log2(r))), np.exp2(np.round(np.log2(s)))
 
-        # Если в системе нет полного базиса, то формируем его
-        if None in self.basis_indexes:
-            self._form_basis()
 
-        # Избавляемся от отрицательных свободных коэффициентов
-        for row in self.st:
-            if row[-1] < 0:
-                try:
-                    self._get_rid_of_negative_free_coefficients()
-                except:
-                    return
-                break
-        
-        # Дельты симплекс-таблицы для оптимизации решения
-        self.deltas = [None for _ in range(len(self.st[0]) - 1)]
+class _BasisFactorization:
+    """
+    Факторизация базисной матрицы B для модифицированного симплекс-метода.
+    Хранит обратную матрицу последней рефакторизации и мультипликативное представление
+    (список eta-векторов) для обновлений базиса после неё.
+    """
+    def __init__(self, refactor_frequency=50):
+        """
+        Метод для инициализации класса.
+        """
+        # Число обновлений базиса, после которого факторизация строится заново
+        self.refactor_frequency = refactor_frequency
 
-        # Цикл оптимизации с помощью дельт
-        while True:
-            # Рассчитываем дельты
-            self._calculate_deltas()
+        # Обратная матрица базиса на момент последней рефакторизации
+        self.base_inverse = None
 
-            # Проверяем решение на оптимальность
-            if self._checking_all_deltas(self.obj):
-                break
-            
-            # Ищем разрешающий столбец
-            resolution_column_j = None
+        # Список eta-векторов в виде (номер строки, вектор)
+        self.etas = []
 
-            # При заданном условии "max" - ищем столбец с минимальной дельтой
-            if self.obj == "max":
-                resolution_column_j = self.deltas.index(min(self.deltas))
 
-            # При заданном условии "min" - ищем столбец с максимальной дельтой
-            elif self.obj == "min":
-                resolution_column_j = self.deltas.index(max(self.deltas))
-            
-            # Рассчитываем симплекс-отношения Q
-            q = self._calculate_simplex_relations_of_q(resolution_column_j)
-            
-            # Если нет подходящих Q, значит решения не существует
-            if all(x is None for x in q):
-                return
+    def refactor(self, basis_matrix):
+        """
+        Строит факторизацию заново по базисной матрице.
+        Для разреженной матрицы строится разреженное LU-разложение, для плотной - обратная матрица.
+        """
+        if sp is not None and sp.issparse(basis_matrix):
+            self.base_lu = splu(basis_matrix.tocsc())
+            self.base_inverse = None
+        else:
+            self.base_lu = None
+            self.base_inverse = np.linalg.inv(basis_matrix)
+        self.etas = []
 
-            # Ищем строку с минимальным Q (разрешающая строка)
-            # (Элемент на пересечении разрешающих столбца и строки также называется разрешающим)
-            row_with_min_q_i = None
-            q_min = float("inf")
-            for i in range(len(q)):
-                if (not (q[i] is None)) and (q[i] < q_min):
-                    row_with_min_q_i = i
-                    q_min = q[i]
-            
-            # Приводим разрешающий элемент к единице, а все остальные элементы в разрешающем столбце к нулю
-            self._dividing_row_in_simplex_table(row_with_min_q_i, self.st[row_with_min_q_i][resolution_column_j])
-            self._zero_out_other_items_in_the_column(row_with_min_q_i, resolution_column_j)
 
-            # Обновляем базис
-            self.basis_indexes[row_with_min_q_i] = resolution_column_j
-    
-        # Формируем ответ в виде: [[<Значения x_1, x_2, x_3, ...>], <Значение целевой функции F>]
-        answer = [[0 for _ in range(len(self.c))], None]
+    def _solve_base(self, rhs, trans=False):
+        """
+        Решает систему с базисной матрицей последней рефакторизации (или с транспонированной к ней).
+        """
+        if self.base_lu is not None:
+            return self.base_lu.solve(rhs, trans="T" if trans else "N")
+        if trans:
+            return rhs @ self.base_inverse
+        return self.base_inverse @ rhs
 
-        # Находим значения переменных x_1, x_2, x_3, ...
-        i = 0
-        for bi in self.basis_indexes:
-            answer[0][bi] = self.st[i][-1]
-            i += 1
-        
-        # Находим значение целевой функции F
-        f = 0
-        for i in range(len(self.c)):
-            f += self.c[i] * answer[0][i]
-        answer[1] = f
 
-        # Убираем из итогового ответа коэффициенты тех переменных,
-        # которые не входили в изначальную ЗЛП
-        answer[0] = answer[0][:len(self.objective_coefficients)]
+    def size(self):
+        """
+        Возвращает число хранимых элементов (обратной матрицы или LU-разложения и eta-векторов).
+        """
+        if self.base_lu is not None:
+            base = self.base_lu.L.nnz + self.base_lu.U.nnz
+        else:
+            base = self.base_inverse.size
+        return base + sum(len(v) for _, v in self.etas)
 
-        # Возвращаем округлённый ответ
-        # (чтобы избежать погрешностей Python при работе с числами)
-        return self._round_result(answer, precision)
-       
-        
-    def _convert_problem_to_canonical_form(self):
+
+    def needs_refactor(self):
         """
-        Преобразует ЗЛП к каноническому виду и записывает в единую таблицу для дальнейшей работы.
+        Проверяет, накопилось ли достаточно обновлений для рефакторизации.
         """
-        # Создаём локальные копии параметров ЗЛП
-        objective_coefficients = self.objective_coefficients.copy()
-        objective_sense = self.objective_sense
-        constraint_matrix = [row.copy() for row in self.constraint_matrix]
-        constraint_senses = self.constraint_senses.copy()
-        constraint_rhs = self.constraint_rhs.copy()
+        return len(self.etas) >= self.refactor_frequency
 
-        # Перебираем все типы ограничений
-        for i in range(len(constraint_senses)):
-            # Если знак ограничения не равен "=" (т.е. равен "<=" или ">="),
-            # то нужно сделать соответствующее преобразование
-            if constraint_senses[i] != "=":
-                # Для знака "<=" добавляем новую переменную с коэффициентом 1
-                if constraint_senses[i] == "<=":
-                    constraint_matrix[i].append(1)
 
-                # Для знака ">=" домножаем всё ограничение на -1 (чтобы изменить знак на "<="),
-                # а дальше также добавляем новую переменную с коэффициентом 1
-                elif constraint_senses[i] == ">=":
-                    for j in range(len(constraint_matrix[i])):
-                        constraint_matrix[i][j] = -constraint_matrix[i][j]
-                    constraint_rhs[i] = -constraint_rhs[i]
-                    constraint_matrix[i].append(1)
-                
-                # Для всех остальных строк добавляем эту новую переменную с коэффициентом 0
-                objective_coefficients.append(0)
-                for j in range(len(constraint_senses)):
-                    if j != i:
-                        constraint_matrix[j].append(0)
+    def ftran(self, a):
+        """
+        Решает систему B * y = a.
+        """
+        y = self._solve_base(a)
+        for r, v in self.etas:
+            t = y[r]
+            if t != 0:
+                y[r] = 0
+                y += v * t
+        return y
 
-                # Также указываем новую переменную как базисную 
-                # для соответствующей строки симплекс-таблицы
-                self.basis_indexes[i] = len(constraint_matrix[i]) - 1
-        
-        # Единая таблица для канонической формы ЗЛП
-        canonical_problem_table = []
 
-        # Добавляем в таблицу коэффициенты целевой функции и направление оптимизации 
-        canonical_problem_table.append(objective_coefficients)
-        canonical_problem_table[0].append(objective_sense)
+    def btran(self, c):
+        """
+        Решает систему y^T * B = c^T.
+        """
+        z = np.array(c, dtype=np.float64)
+        for r, v in reversed(self.etas):
+            z[r] = z @ v
+        return self._solve_base(z, trans=True)
 
-        # Добавляем в таблицу коэффициенты и правую часть ограничений
-        for i in range(len(constraint_matrix)):
-            canonical_problem_table.append(constraint_matrix[i])
-            canonical_problem_table[i + 1].append(constraint_rhs[i])
 
-        # Сохраняем таблицу в глобальную переменную класса
-        self.canonical_problem_table = canonical_problem_table
+    def update(self, r, d):
+        """
+        Обновляет факторизацию после замены r-го базисного столбца.
+        d - столбец входящей переменной, приведённый к текущему базису (результат ftran).
+        """
+        v = -d / d[r]
+        v[r] = 1 / d[r]
+        self.etas.append((r, v))
 
 
-    def _get_rid_of_negative_free_coefficients(self):
+class CancellationToken:
+    """
+    Флаг кооперативной отмены решения (см. параметр `cancel` метода `get_solution`).
+    Метод cancel можно вызвать из другого потока: решение остановится перед следующей итерацией.
+    """
+    def __init__(self):
         """
-        Избавляется от отрицательных свободных коэффициентов b.
+        Метод для инициализации класса.
         """
-        while True:
-            # Найдём строку с минимальной отрицательной b
-            i_min = self._find_row_with_smallest_negative_b()
-            # Если такой строки нет, значит все свободные коэффициенты положительны
-            if i_min is None:
-                return
+        self._event = threading.Event()
 
-            # Найдём в строке i_min минимальный отрицательный элемент
-            j_min = self._find_minimum_negative_item_in_row(i_min)
-            if j_min is None:
-                raise Exception("В строке нет отрицательных значений!")
-            
-            # Делим строку на найденный элемент
-            self._dividing_row_in_simplex_table(i_min, self.st[i_min][j_min])
 
-            # Обнуляем все другие элементы в этом столбце
-            self._zero_out_other_items_in_the_column(i_min, j_min)
+    def cancel(self):
+        """
+        Запрашивает остановку решения.
+        """
+        self._event.set()
+
 
-            # Обновляем базис
-            self.basis_indexes[i_min] = j_min
+    @property
+    def cancelled(self):
+        """
+        Была ли запрошена остановка решения.
+        """
+        return self._event.is_set()
 
 
-    def _find_row_with_smallest_negative_b(self):
+class SolutionCache:
+    """
+    LRU-кэш решений для повторяющихся ЗЛП (см. параметр `cache` метода `get_solution`).
+    Ключ - хэш канонической ЗЛП вместе с параметрами решения, значение - ответ, статус, базис,
+    число итераций и сертификат недопустимости.
+    - max_size - наибольшее число решений в кэше (при переполнении удаляется давно не использованное);
+    - ttl - время жизни решения в секундах (None - без ограничения).
+    Счётчики hits, misses и evictions (удалено по размеру или времени жизни) можно сбросить методом clear.
+    Кэш можно использовать из нескольких потоков.
+    """
+    def __init__(self, max_size=128, ttl=None):
         """
-        Находит строку с минимальным отрицательным b.
+        Метод для инициализации класса.
         """
-        b_min = 0
-        i_min = None
-        for i in range(len(self.st)):
-            if self.st[i][-1] < b_min:
-                b_min = self.st[i][-1]
-                i_min = i
-        return i_min
+        if max_size < 1:
+            raise ValueError("Размер кэша решений должен быть положительным")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Решения в порядке использования: ключ -> (момент сохранения, решение)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
 
 
-    def _find_minimum_negative_item_in_row(self, i):
+    def get(self, key):
         """
-        Находит минимальный отрицательный элемент в строке.
+        Возвращает сохранённое решение или None (если его нет или истекло время его жизни).
         """
-        row = self.st[i][:-1]
-        min_element = 0
-        j_min = None
-        for j in range(len(row)):
-            if row[j] < min_element:
-                min_element = row[j]
-                j_min = j
-        return j_min
-    
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
 
-    def _dividing_row_in_simplex_table(self, row_i, divisor):
+
+    def put(self, key, solution):
         """
-        Делит строку в таблице на заданное значение.
+        Сохраняет решение, удаляя давно не использованные решения сверх max_size.
         """
-        row = self.st[row_i]
-        for j in range(len(row)):
-            row[j] = row[j] / divisor
+        with self._lock:
+            self._entries[key] = (time.monotonic(), solution)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
 
 
-    def _zero_out_other_items_in_the_column(self, i, j):
+    def clear(self):
         """
-        Приводит к нулю все элементы столбца кроме заданного.
+        Удаляет все решения и сбрасывает счётчики.
         """
-        for row_i in range(len(self.st)):
-            if row_i == i:
-                continue
-            row = self.st[row_i]
-            subtraction_coeff = row[j]
-            for k in range(len(row)):
-                row[k] = row[k] - (self.st[i][k] * subtraction_coeff)
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
 
 
-    def _calculate_deltas(self):
+    def __len__(self):
+        return len(self._entries)
+
+
+    def __repr__(self):
+        return (f"SolutionCache(size={len(self)}/{self.max_size}, ttl={self.ttl}, "
+                f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})")
+
+
+class SolveStats:
+    """
+    Статистика решения ЗЛП (см. параметр `stats` метода `get_solution`):
+    - iterations - число итераций по фазам ("phase_one", "dual", "phase_two", а для движка "interior" -
+      "interior" и "crossover");
+    - times - время в секундах по этапам: загрузки ("parsing", "cache", "presolve", "canonicalization"),
+      решения ("scaling", "setup" - построение рабочей таблицы, "phase_one", "dual", "phase_two",
+      "interior", "crossover", "postsolve")
+      и шагов итераций прямого симплекс-метода ("pricing", "ratio_test", "pivoting");
+    - degenerate_pivots - число вырожденных итераций (с нулевым шагом);
+    - peak_table_size - наибольшее число элементов симплекс-таблицы
+      (для движка "revised" - факторизации базиса вместе с eta-векторами).
+    """
+    def __init__(self, load_times=None, callback=None):
         """
-        Рассчитывает дельты для симплекс-таблицы.
+        Метод для инициализации класса.
         """
-        coeffs = []
-        for bi in self.basis_indexes:
-            coeffs.append(self.c[bi])
-        for j in range(len(self.st[0]) - 1):
-            delta_j = 0
-            for i in range(len(self.st)):
-                delta_j += self.st[i][j] * coeffs[i]
-            delta_j -= self.c[j]
-            self.deltas[j] = delta_j
+        self.iterations = {"phase_one": 0, "dual": 0, "phase_two": 0, "interior": 0, "crossover": 0}
+        self.times = dict(load_times or {})
+        self.degenerate_pivots = 0
+        self.peak_table_size = 0
 
+        # Функция, вызываемая после каждой итерации, текущая фаза и отметки времени
+        self.callback = callback
+        self.phase = None
+        self._phase_start = None
+        self._step_start = None
 
-    def _checking_all_deltas(self, obj):
+
+    def start(self, phase):
         """
-        Проверяет оптимальность решения с помощью дельт.
+        Завершает текущий этап и начинает этап phase.
         """
-        for delta in self.deltas:
-            if ((delta > 0) and (obj == "min")) or ((delta < 0) and (obj == "max")):
-                return False
-        return True
+        self.stop()
+        self.phase = phase
+        self._phase_start = time.perf_counter()
 
 
-    def _calculate_simplex_relations_of_q(self, j):
+    def stop(self):
         """
-        Рассчитывает симплекс-отношения Q.
+        Завершает текущий этап, добавляя его длительность в times.
         """
-        q = []
-        for i in range(len(self.st)):
-            if self.st[i][j] <= 0:
-                q.append(None)
-                continue
-            q.append(self.st[i][-1] / self.st[i][j])
-        return q
+        if self._phase_start is not None:
+            self.times[self.phase] = self.times.get(self.phase, 0.0) + time.perf_counter() - self._phase_start
+            self._phase_start = None
 
 
-    def _form_basis(self):
+    def mark(self):
         """
-        Формирует базис.
+        Отмечает начало шага итерации.
         """
-        for i in range(len(self.basis_indexes)):
-            if self.basis_indexes[i] is None:
-                for j in range(len(self.st[0]) - 1):
-                    if self.st[i][j] != 0:
-                        self._dividing_row_in_simplex_table(i, self.st[i][j])
-                        self._zero_out_other_items_in_the_column(i, j)
-                        self.basis_indexes[i] = j
-                        break
+        self._step_start = time.perf_counter()
 
 
-    def _round_result(self, result, precision):
+    def lap(self, step):
         """
-        Округляет ответ до заданной точности.
+        Добавляет время с последней отметки к шагу step и ставит новую отметку.
         """
-        if isinstance(result, list):
-            return [self._round_result(x, precision) for x in result]
-        elif isinstance(result, float):
-            return round(result, precision)
-        else:
-            return result
+        now = time.perf_counter()
+        self.times[step] = self.times.get(step, 0.0) + now - self._step_start
+        self._step_start = now
+
+
+    def __repr__(self):
+        return (f"SolveStats(iterations={self.iterations}, degenerate_pivots={self.degenerate_pivots}, "
+                f"peak_table_size={self.peak_table_size}, times={self.times})")
+
+
+class SimplexMethod:
+    """
+    Класс для реализации симплекс-метода для решения задачи линейного программирования (ЗЛП).
+    """
+    # Атрибуты экземпляра перечислены явно: у экземпляров нет словаря __dict__,
+    # поэтому множество одновременно загруженных ЗЛП занимает меньше памяти
+    __slots__ = (
+        # Исходная ЗЛП
+        "objective_coefficients", "objective_sense", "constraint_matrix", "constraint_senses", "constraint_rhs",
+        "lower_bounds", "upper_bounds", "variable_names", "presolve_info", "sparse",
+        # Канонический вид ЗЛП
+        "canonical_problem_table", "canonical_basis_indexes", "canonical_constraint_matrix", "canonical_rhs",
+        # Состояние последнего решения
+        "basis_indexes", "c", "obj", "st", "deltas", "engine", "status", "iterations", "infeasibility_certificate",
+        "stats", "_stats", "_limits", "_anti_cycling", "_revised", "_row_scale", "_column_scale", "_load_times",
+        "_upper", "_flipped",
+        # Рабочие буферы, сохраняемые между решениями
+        "_row_buffers", "_numpy_buffers",
+    )
+
+    def __init__(self):
+        """
+        Метод для инициализации класса.
+        """
+        # Список коэффициентов целевой функции
+        self.objective_coefficients: list[int]
+
+        # Направление оптимизации ('max' или 'min')
+        self.objective_sense: str
+
+        # Матрица с коэффициентами ограничений
+        self.constraint_matrix: list[list[int]]
+
+        # Список с типами ограничений ('>=', '<=', '=')
+        self.constraint_senses: list[str]
+
+        # Список с правыми частями ограничений
+        self.constraint_rhs = list[int]
+
+        # Нижние и верхние границы переменных (по умолчанию 0 и float("inf"))
+        self.lower_bounds: list
+        self.upper_bounds: list
+
+        # Имена переменных (для txt-файлов - "x1", "x2", ...)
+        self.variable_names: list[str]
+
+        # Сведения о предварительной обработке ЗЛП (None, если она не выполнялась):
+        # число удалённых строк и столбцов и данные для перевода ответа к исходным переменным
+        self.presolve_info: dict
+
+        # Признак разреженного представления ЗЛП
+        # (матрица ограничений хранится в формате CSR, дополнительные переменные - неявно)
+        self.sparse: bool
+
+        # Таблица с ЗЛП в каноническом виде (в ограничениях используются только равенства)
+        # Строки ограничений хранятся в массивах array("d") (по 8 байт на коэффициент) и при решении
+        # не изменяются: симплекс-таблица копирует их в рабочие буферы только при изменении.
+        # Пример:
+        # [20, 20, 10, 0, 0, 0, "max"]
+        # array('d', [-4.0, -3.0, -2.0, 1.0, 0.0, 0.0, -33.0]),
+        # array('d', [-3.0, -2.0, -1.0, 0.0, 1.0, 0.0, -23.0]),
+        # array('d', [-1.0, -1.0, -2.0, 0.0, 0.0, 1.0, -12.0])
+        self.canonical_problem_table: list
+
+        # Базис, полученный при приведении ЗЛП к каноническому виду
+        self.canonical_basis_indexes: list
+
+        # Рабочие буферы строк симплекс-таблицы движка "python" и массивов движка "numpy"
+        # (сохраняются между решениями, поэтому повторное решение не выделяет память под таблицу)
+        self._row_buffers = []
+        self._numpy_buffers = {}
+
+
+    def __getstate__(self):
+        """
+        Возвращает состояние экземпляра для pickle (например, при передаче в процессы `solve_many`)
+        без рабочих буферов.
+        """
+        state = {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+        state["_row_buffers"] = []
+        state["_numpy_buffers"] = {}
+        return state
+
+
+    def __setstate__(self, state):
+        """
+        Восстанавливает экземпляр из состояния, полученного `__getstate__`.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+    def load_problem(self, file_path: str, sparse: bool = False, presolve: bool = False, cache_dir: str = None,
+                     cache_max_bytes: int = CACHE_MAX_BYTES) -> None:
+        """
+        Метод для загрузки ЗЛП. На вход принимает путь до txt-файла с ЗЛП.
+        При sparse=True матрица ограничений хранится в разреженном виде (требуется пакет scipy),
+        а решать такую ЗЛП можно только движком "revised".
+        При presolve=True ЗЛП перед приведением к каноническому виду упрощается (см. `_presolve`),
+        а сведения об упрощении сохраняются в `self.presolve_info`.
+        При заданном cache_dir загруженная ЗЛП сохраняется в двоичный кэш (требуется пакет numpy),
+        и при следующих загрузках того же файла читается из кэша без разбора текста.
+        Пример ожидаемого формата в txt-файле:
+
+        ```
+        2x1 +3x2 +x3 +4x4 -> max
+        x1 +x2 +x3 +x4 <= 10
+        2x1 +x2 -x3 +x4 = 8
+        x2 +2x3 +x4 >= 5
+        ```
+
+        Границы переменных задаются строками вида "<нижняя> <= x<номер> <= <верхняя>",
+        например "0 <= x3 <= 5" или "-2 <= x1 <= inf" (по умолчанию 0 <= x <= inf).
+        """
+        self._load_file(file_path, _read_txt, sparse, presolve, cache_dir, cache_max_bytes)
+
+
+    def load_mps(self, file_path: str, sparse: bool = False, presolve: bool = False, cache_dir: str = None,
+                 cache_max_bytes: int = CACHE_MAX_BYTES) -> None:
+        """
+        Метод для загрузки ЗЛП из файла в свободном формате MPS
+        (секции NAME, OBJSENSE, ROWS, COLUMNS, RHS, RANGES, BOUNDS, ENDATA).
+        Переменные нумеруются в порядке появления в секции COLUMNS, их имена сохраняются в `self.variable_names`.
+        """
+        self._load_file(file_path, _read_mps, sparse, presolve, cache_dir, cache_max_bytes)
+
+
+    def load_lp(self, file_path: str, sparse: bool = False, presolve: bool = False, cache_dir: str = None,
+                cache_max_bytes: int = CACHE_MAX_BYTES) -> None:
+        """
+        Метод для загрузки ЗЛП из файла в формате CPLEX LP
+        (секции Maximize/Minimize, Subject To, Bounds, End).
+        Переменные нумеруются в порядке первого появления, их имена сохраняются в `self.variable_names`.
+        """
+        self._load_file(file_path, _read_lp, sparse, presolve, cache_dir, cache_max_bytes)
+
+
+    @classmethod
+    def from_data(cls, objective, constraint_matrix, constraint_senses, constraint_rhs, objective_sense="max",
+                  bounds=None, variable_names=None, number_of_variables=None, sparse=None, presolve=False):
+        """
+        Создаёт экземпляр класса с ЗЛП, заданной в памяти, без записи и разбора txt-файла:
+        - objective - коэффициенты целевой функции (список, массив NumPy или словарь {индекс: коэффициент});
+        - constraint_matrix - коэффициенты ограничений (список списков, список словарей {индекс: коэффициент},
+          двумерный массив NumPy или разреженная матрица SciPy);
+        - constraint_senses - типы ограничений ("<=", ">=", "=") списком или одной строкой для всех ограничений;
+        - constraint_rhs - правые части ограничений (список или массив NumPy);
+        - bounds - границы переменных (словарь {индекс: (нижняя, верхняя)} или список пар (нижняя, верхняя));
+        - number_of_variables - число переменных (по умолчанию определяется по размерам данных);
+        - sparse - хранить матрицу ограничений в формате CSR (по умолчанию - если передана разреженная матрица).
+
+        Строки списка списков и разреженная матрица в формате CSR (при sparse=True) используются без копирования.
+        При presolve=True ЗЛП упрощается так же, как в `load_problem`.
+        """
+        if sparse is None:
+            sparse = sp is not None and sp.issparse(constraint_matrix)
+        if hasattr(constraint_matrix, "shape"):
+            number_of_constraints, width = constraint_matrix.shape
+        else:
+            constraint_matrix = list(constraint_matrix)
+            number_of_constraints = len(constraint_matrix)
+            width = max([len(row) if not isinstance(row, dict) else max(row, default=-1) + 1
+                         for row in constraint_matrix], default=0)
+
+        if isinstance(constraint_senses, str):
+            constraint_senses = [constraint_senses] * number_of_constraints
+        constraint_senses = list(constraint_senses)
+        constraint_rhs = constraint_rhs.tolist() if hasattr(constraint_rhs, "tolist") else list(constraint_rhs)
+        if not len(constraint_senses) == len(constraint_rhs) == number_of_constraints:
+            raise ValueError(f"Ожидалось {number_of_constraints} типов ограничений и правых частей")
+
+        if isinstance(objective, dict):
+            objective_width = max(objective, default=-1) + 1
+        else:
+            objective = objective.tolist() if hasattr(objective, "tolist") else list(objective)
+            objective_width = len(objective)
+        if bounds is not None and not isinstance(bounds, dict):
+            bounds = {index: pair for index, pair in enumerate(bounds) if pair is not None}
+        if number_of_variables is None:
+            number_of_variables = max(width, objective_width, max(bounds or {}, default=-1) + 1)
+        if width > number_of_variables or objective_width > number_of_variables:
+            raise ValueError(f"Ожидалось не более {number_of_variables} переменных")
+
+        sm = cls()
+
+        # Предварительная обработка работает со строками в формате {индекс: коэффициент}
+        if presolve:
+            if not isinstance(objective, dict):
+                objective = dict(enumerate(objective))
+            sm._set_problem(objective, objective_sense, _rows_from_data(constraint_matrix), constraint_senses,
+                            constraint_rhs, number_of_variables, sparse, variable_names, bounds, presolve=True)
+            return sm
+
+        _check_senses(objective_sense, constraint_senses)
+        variable_names = list(variable_names or [f"x{i + 1}" for i in range(number_of_variables)])
+        lower_bounds, upper_bounds = _variable_bounds(bounds, number_of_variables, variable_names)
+        start = time.perf_counter()
+
+        objective_coefficients = [0 for _ in range(number_of_variables)]
+        if isinstance(objective, dict):
+            for index, coefficient in objective.items():
+                objective_coefficients[index] = coefficient
+        else:
+            objective_coefficients[:len(objective)] = objective
+
+        if sparse:
+            if sp is None:
+                raise ImportError("Для разреженного представления ЗЛП требуется установленный пакет scipy")
+            if sp.issparse(constraint_matrix):
+                matrix = constraint_matrix.tocsr().astype(np.float64, copy=False)
+            elif hasattr(constraint_matrix, "shape"):
+                matrix = sp.csr_matrix(np.asarray(constraint_matrix, dtype=np.float64))
+            else:
+                matrix = sm._build_sparse_matrix(_rows_from_data(constraint_matrix), width)
+            if width < number_of_variables:
+                matrix = sp.hstack([matrix, sp.csr_matrix((number_of_constraints, number_of_variables - width))],
+                                   format="csr")
+        else:
+            # Для плотного представления нужен список списков чисел Python
+            if sp is not None and sp.issparse(constraint_matrix):
+                constraint_matrix = constraint_matrix.toarray()
+            if hasattr(constraint_matrix, "tolist"):
+                constraint_matrix = constraint_matrix.tolist()
+            matrix = []
+            for row in constraint_matrix:
+                if isinstance(row, dict):
+                    dense_row = [0 for _ in range(number_of_variables)]
+                    for index, coefficient in row.items():
+                        dense_row[index] = coefficient
+                    row = dense_row
+                elif not isinstance(row, list):
+                    row = list(row)
+                if len(row) < number_of_variables:
+                    row = row + [0] * (number_of_variables - len(row))
+                matrix.append(row)
+
+        sm._store_problem(objective_coefficients, objective_sense, matrix, constraint_senses, constraint_rhs,
+                          sparse, variable_names, lower_bounds, upper_bounds)
+        sm._load_times = {"canonicalization": time.perf_counter() - start}
+        return sm
+
+
+    @classmethod
+    def from_text(cls, text, file_format="txt", sparse=False, presolve=False):
+        """
+        Создаёт экземпляр класса с ЗЛП, переданной строкой в формате file_format
+        ("txt" - как в `load_problem`, "mps" или "lp"), без записи во временный файл.
+        """
+        readers = {"txt": _read_txt, "mps": _read_mps, "lp": _read_lp}
+        if file_format not in readers:
+            raise ValueError(f"Неизвестный формат ЗЛП: {file_format}")
+        sm = cls()
+        start = time.perf_counter()
+        problem = readers[file_format](text.splitlines())
+        parsing_time = time.perf_counter() - start
+        sm._set_problem(sparse=sparse, presolve=presolve, **problem)
+        sm._load_times["parsing"] = parsing_time
+        return sm
+
+
+    def _load_file(self, file_path, reader, sparse, presolve, cache_dir, cache_max_bytes):
+        """
+        Загружает ЗЛП из файла с помощью функции чтения reader, используя двоичный кэш (если задан cache_dir).
+        """
+        start = time.perf_counter()
+        if cache_dir is not None:
+            file_format = reader.__name__ + ("+presolve" if presolve else "")
+            entry = _cache_entry_path(cache_dir, file_path, file_format)
+            if self._restore_from_cache(entry, sparse):
+                self._load_times = {"cache": time.perf_counter() - start}
+                return
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            problem = reader(f)
+        parsing_time = time.perf_counter() - start
+        self._set_problem(sparse=sparse, presolve=presolve, **problem)
+        self._load_times["parsing"] = parsing_time
+
+        if cache_dir is not None:
+            self._write_to_cache(entry)
+            _evict_cache(cache_dir, cache_max_bytes)
+
+
+    def _set_problem(self, objective, objective_sense, rows, constraint_senses, constraint_rhs,
+                     number_of_variables, sparse, variable_names=None, bounds=None, presolve=False):
+        """
+        Загружает разобранную ЗЛП в глобальные переменные класса и приводит её к каноническому виду.
+        objective и rows - строки в формате {индекс: коэффициент},
+        bounds - границы переменных в формате {индекс: [нижняя, верхняя]}.
+        """
+        _check_senses(objective_sense, constraint_senses)
+
+        # Имена переменных сохраняются для исходной ЗЛП (в её переменных выдаётся ответ)
+        variable_names = variable_names or [f"x{i + 1}" for i in range(number_of_variables)]
+
+        # Границы переменных (переменные без нижней границы не поддерживаются)
+        lower_bounds, upper_bounds = _variable_bounds(bounds, number_of_variables, variable_names)
+
+        # Длительность этапов загрузки (для статистики решения)
+        self._load_times = {}
+        start = time.perf_counter()
+
+        # Упрощаем ЗЛП (если предварительная обработка обнаружила недопустимость, оставляем ЗЛП как есть)
+        presolve_info = None
+        if presolve:
+            reduced, presolve_info = _presolve(objective, objective_sense, rows, constraint_senses, constraint_rhs,
+                                               number_of_variables, lower_bounds, upper_bounds)
+            if reduced is not None:
+                (objective, rows, constraint_senses, constraint_rhs,
+                 number_of_variables, lower_bounds, upper_bounds) = reduced
+            self._load_times["presolve"] = time.perf_counter() - start
+            start = time.perf_counter()
+
+        # Создаём список для коэффициентов целевой функции
+        # (изначально заполняем его нулями)
+        objective_coefficients = [0 for _ in range(number_of_variables)]
+        for index, coefficient in objective.items():
+            objective_coefficients[index] = coefficient
+
+        # Для разреженного представления сразу собираем матрицу в формате CSR
+        if sparse:
+            constraint_matrix = self._build_sparse_matrix(rows, number_of_variables)
+        else:
+            # Создаём матрицу с коэффициентами ограничений
+            # (изначально заполняем её нулями)
+            constraint_matrix = []
+            for row in rows:
+                dense_row = [0 for _ in range(number_of_variables)]
+                for index, coefficient in row.items():
+                    dense_row[index] = coefficient
+                constraint_matrix.append(dense_row)
+
+        self._store_problem(objective_coefficients, objective_sense, constraint_matrix, constraint_senses,
+                            constraint_rhs, sparse, variable_names, lower_bounds, upper_bounds, presolve_info)
+        self._load_times["canonicalization"] = time.perf_counter() - start
+
+
+    def _store_problem(self, objective_coefficients, objective_sense, constraint_matrix, constraint_senses,
+                       constraint_rhs, sparse, variable_names, lower_bounds, upper_bounds, presolve_info=None):
+        """
+        Загружает параметры ЗЛП в глобальные переменные класса и приводит её к каноническому виду.
+        constraint_matrix - список списков или (при sparse=True) матрица в формате CSR.
+        """
+        # Загружаем полученные параметры ЗЛП в глобальные переменные класса
+        self.objective_coefficients = objective_coefficients
+        self.objective_sense = objective_sense
+        self.constraint_matrix = constraint_matrix
+        self.constraint_senses = constraint_senses
+        self.constraint_rhs = constraint_rhs
+        self.lower_bounds = lower_bounds
+        self.upper_bounds = upper_bounds
+        self.sparse = sparse
+        self.variable_names = variable_names
+        self.presolve_info = presolve_info
+
+        # Создаём глобальную переменную для хранения базиса симплекс-таблицы
+        self.basis_indexes = [None for _ in range(len(constraint_rhs))]
+
+        # Преобразуем параметры ЗЛП к каноническому виду
+        if sparse:
+            self._convert_problem_to_canonical_form_sparse()
+        else:
+            self._convert_problem_to_canonical_form()
+
+
+    def _write_to_cache(self, entry):
+        """
+        Сохраняет загруженную ЗЛП в двоичный кэш: коэффициенты - в npy-файлах
+        (матрица ограничений - в формате CSR), остальные параметры - в meta.json.
+        Запись сначала создаётся во временной папке и затем переносится на место целиком,
+        поэтому параллельные загрузки никогда не видят её частично записанной.
+        """
+        if np is None:
+            raise ImportError("Для двоичного кэша ЗЛП требуется установленный пакет numpy")
+
+        if self.sparse:
+            matrix = self.constraint_matrix
+            data, indices, indptr = matrix.data, matrix.indices, matrix.indptr
+        else:
+            # Переводим плотную матрицу в формат CSR, чтобы не хранить нули
+            dense = np.array(self.constraint_matrix, dtype=np.float64).reshape(
+                len(self.constraint_rhs), len(self.objective_coefficients))
+            rows_nonzero, indices = np.nonzero(dense)
+            data = dense[rows_nonzero, indices]
+            indptr = np.concatenate(([0], np.cumsum(np.count_nonzero(dense, axis=1))))
+
+        objective = np.array(self.objective_coefficients, dtype=np.float64)
+        rhs = np.array(self.constraint_rhs, dtype=np.float64)
+
+        # Если все числа ЗЛП целые, то при чтении из кэша восстанавливаем их как int
+        # (так же, как при разборе текста)
+        integer = bool(
+            np.all(np.mod(data, 1) == 0) and np.all(np.mod(objective, 1) == 0) and np.all(np.mod(rhs, 1) == 0)
+        )
+
+        meta = {
+            "objective_sense": self.objective_sense,
+            "constraint_senses": self.constraint_senses,
+            "variable_names": self.variable_names,
+            "lower_bounds": self.lower_bounds,
+            "upper_bounds": self.upper_bounds,
+            "presolve_info": self.presolve_info,
+            "integer": integer,
+        }
+
+        cache_dir = os.path.dirname(entry)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=cache_dir)
+        try:
+            np.save(os.path.join(tmp, "objective.npy"), objective)
+            np.save(os.path.join(tmp, "rhs.npy"), rhs)
+            np.save(os.path.join(tmp, "data.npy"), np.asarray(data, dtype=np.float64))
+            np.save(os.path.join(tmp, "indices.npy"), np.asarray(indices, dtype=np.int64))
+            np.save(os.path.join(tmp, "indptr.npy"), np.asarray(indptr, dtype=np.int64))
+            with open(os.path.join(tmp, "meta.json"), 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp, entry)
+        except OSError:
+            # Запись уже создана параллельной загрузкой (или кэш недоступен) - просто не кэшируем
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        # Удаляем записи для прежних версий этого же файла
+        prefix = os.path.basename(entry).split("-")[0] + "-"
+        for name in os.listdir(cache_dir):
+            if name.startswith(prefix) and name != os.path.basename(entry):
+                shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+
+
+    def _restore_from_cache(self, entry, sparse):
+        """
+        Загружает ЗЛП из записи двоичного кэша (массивы отображаются в память без разбора текста).
+        Возвращает False, если записи нет или она повреждена (повреждённая запись удаляется,
+        чтобы `_write_to_cache` мог записать её заново).
+        """
+        if np is None:
+            raise ImportError("Для двоичного кэша ЗЛП требуется установленный пакет numpy")
+
+        try:
+            with open(os.path.join(entry, "meta.json"), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta = {
+                name: meta[name]
+                for name in ("objective_sense", "constraint_senses", "variable_names", "lower_bounds",
+                             "upper_bounds", "presolve_info", "integer")
+            }
+            arrays = {
+                name: np.load(os.path.join(entry, name + ".npy"), mmap_mode='r')
+                for name in ("objective", "rhs", "data", "indices", "indptr")
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            shutil.rmtree(entry, ignore_errors=True)
+            return False
+
+        # Отмечаем использование записи (для вытеснения давно не использованных записей);
+        # в кэше, доступном только для чтения, это невозможно, но запись всё равно используется
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        number_of_variables = len(arrays["objective"])
+        number_of_rows = len(arrays["rhs"])
+        if sparse:
+            if sp is None:
+                raise ImportError("Для разреженного представления ЗЛП требуется установленный пакет scipy")
+            constraint_matrix = sp.csr_matrix(
+                (arrays["data"], arrays["indices"], arrays["indptr"]),
+                shape=(number_of_rows, number_of_variables),
+            )
+        else:
+            dense = np.zeros((number_of_rows, number_of_variables))
+            row_indexes = np.repeat(np.arange(number_of_rows), np.diff(arrays["indptr"]))
+            dense[row_indexes, arrays["indices"]] = arrays["data"]
+            constraint_matrix = _to_python_numbers(dense, meta["integer"])
+
+        self._store_problem(
+            _to_python_numbers(arrays["objective"], meta["integer"]),
+            meta["objective_sense"],
+            constraint_matrix,
+            meta["constraint_senses"],
+            _to_python_numbers(arrays["rhs"], meta["integer"]),
+            sparse,
+            meta["variable_names"],
+            meta["lower_bounds"],
+            meta["upper_bounds"],
+            meta["presolve_info"],
+        )
+        return True
+
+
+    def _build_sparse_matrix(self, rows, number_of_variables):
+        """
+        Собирает матрицу ограничений в формате CSR из строк вида {индекс: коэффициент},
+        не создавая плотную матрицу.
+        """
+        if sp is None:
+            raise ImportError("Для разреженного представления ЗЛП требуется установленный пакет scipy")
+
+        data = []
+        indices = []
+        indptr = [0]
+        for row in rows:
+            indices.extend(row.keys())
+            data.extend(row.values())
+            indptr.append(len(indices))
+
+        return sp.csr_matrix(
+            (np.array(data, dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr)),
+            shape=(len(rows), number_of_variables),
+        )
+
+
+    def get_solution(self, precision=8, engine="python", pricing="dantzig", scaling=None, method="auto",
+                     anti_cycling="bland", stats=False, callback=None, max_iterations=None, time_limit=None,
+                     cancel=None, cache=None, crossover=True):
+        """
+        Выдаёт решение канонической задачи линейного программирование, используя симплекс-метод.
+
+        Параметр `engine` задаёт способ хранения симплекс-таблицы:
+        - "python" - таблица в виде списка списков (по умолчанию);
+        - "numpy" - таблица в виде непрерывного массива float64 с векторизованными операциями;
+        - "revised" - модифицированный симплекс-метод: хранится только матрица ограничений
+          и факторизация базиса, дополнительные переменные учитываются неявно;
+        - "interior" - прямо-двойственный метод внутренней точки по таблице движка "numpy" (для крупных плотных ЗЛП).
+          При crossover=True (по умолчанию) от найденной точки выполняется переход к оптимальному базису
+          и ответ совпадает с ответами симплекс-движков; при crossover=False выдаётся точка метода внутренней точки
+          без базиса (в `self.basis_indexes` - None, анализ чувствительности недоступен). Недопустимые
+          и неограниченные ЗЛП, на которых метод не сходится, решаются симплекс-методом.
+
+        Параметр `pricing` задаёт правило выбора разрешающего столбца (см. PRICING_RULES):
+        - "dantzig" - столбец с наибольшей по модулю дельтой (по умолчанию, единственное правило движка "python");
+        - "partial" - частичное ценообразование: лучший столбец в первом сегменте, где есть кандидаты;
+        - "devex" - приближённые веса наискорейшего ребра;
+        - "steepest_edge" - наискорейшее ребро (точные веса столбцов).
+
+        Параметр `scaling` включает масштабирование строк и столбцов матрицы ограничений перед решением
+        (см. SCALING_METHODS и `_scaling_factors`, требуется пакет numpy); ответ выдаётся в исходном масштабе.
+
+        Параметр `method` задаёт вариант симплекс-метода (см. SIMPLEX_METHODS):
+        - "primal" - прямой двухфазный симплекс-метод;
+        - "dual" - двойственный симплекс-метод от начального базиса из дополнительных переменных;
+          базис должен быть двойственно допустимым (дельты оптимальны, у движка "revised" переменные
+          с неподходящей оценкой могут начинать с конечной верхней границы), иначе выдаётся ValueError;
+        - "auto" - двойственный метод, если начальный базис двойственно допустим, но в нём есть
+          отрицательные свободные коэффициенты b (например, минимизация с ограничениями ">="), иначе прямой.
+
+        Параметр `anti_cycling` задаёт защиту прямого симплекс-метода от зацикливания на вырожденных ЗЛП
+        (см. ANTI_CYCLING_RULES). Она включается после ANTI_CYCLING_THRESHOLD вырожденных итераций подряд
+        и действует до первой итерации с ненулевым шагом:
+        - "bland" - правило Бланда: входит первый улучшающий столбец, выходит базисная переменная
+          с наименьшим индексом среди строк с минимальным Q (по умолчанию);
+        - "lexicographic" - лексикографический тест отношений: из строк с минимальным Q выбирается строка
+          с лексикографически наименьшим отношением к разрешающему элементу в столбцах базиса,
+          действовавшего при включении защиты (разрешающий столбец выбирается по правилу `pricing`);
+        - None - без защиты.
+
+        Число выполненных итераций (преобразований таблицы) сохраняется в `self.iterations`,
+        а статус решения - в `self.status`: "optimal", "unbounded" (целевая функция не ограничена)
+        или "infeasible" (допустимых решений нет). В последних двух случаях возвращается None.
+
+        Допустимый базис ищется двухфазным методом: в фазе I минимизируется сумма искусственных переменных.
+        Если ЗЛП недопустима, в `self.infeasibility_certificate` сохраняются множители ограничений mu
+        (mu_i >= 0 для "<=", mu_i <= 0 для ">="), для которых сумма mu_i * b_i меньше минимума
+        суммы mu_i * (a_i * x) по всем x в границах переменных (для x >= 0: все коэффициенты
+        суммы mu_i * a_i неотрицательны, а сумма mu_i * b_i отрицательна). Иначе там хранится None
+        (также None, если недопустимость обнаружена предварительной обработкой или по границам переменных).
+
+        При stats=True метод возвращает пару (ответ, статистика решения) - см. SolveStats.
+        callback - функция, вызываемая после каждой итерации со словарём: фаза ("phase_one", "dual", "phase_two"),
+        номер итерации, входящая и выходящая переменные (индексы столбцов; при переходе переменной
+        к противоположной границе в движке "revised" - одна и та же переменная), шаг и признак вырожденности.
+        Итерации метода внутренней точки передают фазу "interior", номер итерации, mu (среднее x_j * z_j)
+        и нормы невязок прямой и двойственной задач ("primal_residual", "dual_residual").
+        Статистика последнего решения с ними сохраняется в `self.stats`; без них сбор статистики отключён
+        и не замедляет решение.
+
+        Решение можно ограничить числом итераций max_iterations, временем time_limit (в секундах, считая
+        от вызова метода) и остановить из другого потока через cancel (см. CancellationToken).
+        Ограничения проверяются перед каждой итерацией. При срабатывании статус равен "iteration_limit",
+        "time_limit" или "cancelled" (см. LIMIT_STATUSES). Если допустимый базис уже найден (фаза II),
+        возвращается решение в последнем базисе (допустимое, но, возможно, не оптимальное), иначе - None.
+
+        cache - кэш решений SolutionCache. Если та же каноническая ЗЛП уже решалась с теми же параметрами,
+        сохранённые ответ, статус, базис, число итераций и сертификат недопустимости возвращаются без решения.
+        Решения, остановленные ограничениями, не кэшируются; при сборе статистики кэш не используется.
+        """
+        # Каждое решение начинаем с базиса, полученного при приведении ЗЛП к каноническому виду
+        self.basis_indexes = self.canonical_basis_indexes.copy()
+
+        # Счётчик итераций симплекс-метода, движок и статус последнего решения
+        self.iterations = 0
+        self.engine = engine
+        self.status = None
+        self.infeasibility_certificate = None
+
+        # Статистика решения (None - сбор отключён)
+        self.stats = None
+        if stats or callback is not None:
+            self.stats = SolveStats(getattr(self, "_load_times", None), callback)
+        self._stats = self.stats
+
+        # Ограничения решения: (число итераций, момент времени, флаг отмены) или None
+        self._limits = None
+        if max_iterations is not None or time_limit is not None or cancel is not None:
+            deadline = None if time_limit is None else time.perf_counter() + time_limit
+            self._limits = (max_iterations, deadline, cancel)
+
+        # Множители строк и столбцов при масштабировании (None - решение в исходном масштабе)
+        self._row_scale = None
+        self._column_scale = None
+        if scaling is not None:
+            if np is None:
+                raise ImportError("Для масштабирования требуется установленный пакет numpy")
+            self._start_phase("scaling")
+            self._row_scale, self._column_scale = self._calculate_scaling(scaling)
+
+        if pricing not in PRICING_RULES:
+            raise ValueError(f"Неизвестное правило ценообразования: {pricing}")
+        if engine == "python" and pricing != "dantzig":
+            raise ValueError("Движок \"python\" поддерживает только правило \"dantzig\"")
+
+        if self.sparse and engine != "revised":
+            raise ValueError("Разреженное представление ЗЛП поддерживается только движком \"revised\"")
+
+        if engine not in ("python", "numpy", "revised", "interior"):
+            raise ValueError(f"Неизвестный движок: {engine}")
+
+        if method not in SIMPLEX_METHODS:
+            raise ValueError(f"Неизвестный вариант симплекс-метода: {method}")
+
+        if anti_cycling is not None and anti_cycling not in ANTI_CYCLING_RULES:
+            raise ValueError(f"Неизвестное правило защиты от зацикливания: {anti_cycling}")
+        self._anti_cycling = anti_cycling
+
+        # Ищем решение в кэше
+        cache_key = None
+        if cache is not None and self.stats is None:
+            cache_key = self._solution_key(precision, engine, pricing, scaling, method, anti_cycling,
+                                           engine == "interior" and crossover)
+            solution = cache.get(cache_key)
+            if solution is not None:
+                return self._restore_solution(solution)
+
+        answer = self._solve(precision, engine, pricing, method, crossover)
+        if cache_key is not None and self.status not in LIMIT_STATUSES:
+            cache.put(cache_key, {
+                "answer": _copy_answer(answer),
+                "status": self.status,
+                "basis_indexes": self.basis_indexes.copy(),
+                "iterations": self.iterations,
+                "infeasibility_certificate": _copy_answer(self.infeasibility_certificate),
+            })
+        if self.stats is None:
+            return answer
+        self.stats.stop()
+        return (answer, self.stats) if stats else answer
+
+
+    def _solution_key(self, *options):
+        """
+        Возвращает ключ кэша решений: хэш канонической ЗЛП (с типами ограничений, границами переменных
+        и сведениями о предварительной обработке) и параметров решения options.
+        """
+        digest = hashlib.sha256()
+
+        # Целевая функция и её цель
+        digest.update(np.asarray(self.objective_coefficients, dtype=np.float64).tobytes())
+        digest.update(self.objective_sense.encode())
+
+        # Ограничения: байты массивов без построения текстового представления таблицы
+        if self.sparse:
+            matrix = self.canonical_constraint_matrix
+            for values in (matrix.data, matrix.indices, matrix.indptr, self.canonical_rhs):
+                digest.update(np.ascontiguousarray(values).tobytes())
+            digest.update(repr(matrix.shape).encode())
+        else:
+            rows = self.canonical_problem_table[1:]
+            digest.update(repr((len(rows), len(self.canonical_problem_table[0]))).encode())
+            for row in rows:
+                digest.update(row.tobytes() if isinstance(row, array) else np.asarray(row, dtype=np.float64).tobytes())
+        digest.update(repr((self.constraint_senses, self.lower_bounds, self.upper_bounds, options)).encode())
+        digest.update(json.dumps(self.presolve_info, sort_keys=True, default=repr).encode())
+        return digest.hexdigest()
+
+
+    def _restore_solution(self, solution):
+        """
+        Восстанавливает результаты решения из кэша и возвращает копию ответа.
+        """
+        self.status = solution["status"]
+        self.basis_indexes = solution["basis_indexes"].copy()
+        self.iterations = solution["iterations"]
+        self.infeasibility_certificate = _copy_answer(solution["infeasibility_certificate"])
+
+        # Симплекс-таблица не восстанавливается, поэтому `resolve` решит ЗЛП заново
+        self.st = None
+        return _copy_answer(solution["answer"])
+
+
+    async def get_solution_async(self, progress=None, progress_interval=0.1, executor=None, **solve_options):
+        """
+        Асинхронная обёртка над `get_solution`: решает ЗЛП в пуле потоков executor
+        (по умолчанию - в пуле цикла событий), не блокируя цикл событий.
+        solve_options - параметры `get_solution` (например, engine="numpy", time_limit=5).
+
+        progress - функция, которая вызывается в потоке цикла событий со словарём итерации
+        (см. параметр `callback` метода `get_solution`) не чаще раза в progress_interval секунд.
+        Переданный в solve_options callback при этом по-прежнему вызывается после каждой итерации (в потоке решения).
+        При отмене задачи asyncio решение останавливается через CancellationToken
+        (переданный в cancel или созданный автоматически) перед следующей итерацией.
+        """
+        loop = asyncio.get_running_loop()
+        if solve_options.get("cancel") is None:
+            solve_options["cancel"] = CancellationToken()
+
+        if progress is not None:
+            last_report = [float("-inf")]
+            user_callback = solve_options.get("callback")
+
+            def callback(event):
+                if user_callback is not None:
+                    user_callback(event)
+                now = time.perf_counter()
+                if now - last_report[0] >= progress_interval:
+                    last_report[0] = now
+                    loop.call_soon_threadsafe(progress, event)
+
+            solve_options["callback"] = callback
+
+        try:
+            return await loop.run_in_executor(executor, partial(self.get_solution, **solve_options))
+        except asyncio.CancelledError:
+            solve_options["cancel"].cancel()
+            raise
+
+
+    def _solve(self, precision, engine, pricing, method, crossover=True):
+        """
+        Решает ЗЛП выбранным движком и переводит ответ к переменным исходной ЗЛП.
+        """
+        # Недопустимость ЗЛП могла быть обнаружена ещё при предварительной обработке
+        if self.presolve_info is not None and self.presolve_info["status"] == "infeasible":
+            self.status = "infeasible"
+            return
+
+        # Нижняя граница переменной больше верхней
+        if any(lower > upper for lower, upper in zip(self.lower_bounds, self.upper_bounds)):
+            self.status = "infeasible"
+            return
+
+        # ЗЛП без ограничений (например, полностью решённая предварительной обработкой) решается сразу:
+        # переменные, улучшающие целевую функцию, берутся на верхней границе (если её нет - решение не ограничено),
+        # остальные - на нижней
+        if len(self.constraint_rhs) == 0:
+            x = []
+            for c, lower, upper in zip(self.objective_coefficients, self.lower_bounds, self.upper_bounds):
+                improving = c != 0 and (c > 0) == (self.objective_sense == "max")
+                if improving and upper == float("inf"):
+                    self.status = "unbounded"
+                    return
+                x.append(upper if improving else lower)
+            self.status = "optimal"
+            answer = [x, sum(c * value for c, value in zip(self.objective_coefficients, x))]
+        elif engine == "numpy":
+            answer = self._get_solution_numpy(precision, pricing, method)
+        elif engine == "revised":
+            answer = self._get_solution_revised(precision, pricing, method=method)
+        elif engine == "interior":
+            answer = self._get_solution_interior(precision, pricing, crossover)
+        else:
+            answer = self._get_solution_python(precision, method)
+
+        # Переводим ответ к переменным исходной ЗЛП
+        self._start_phase("postsolve")
+        return self._postsolve(answer, precision)
+
+
+    def _limit_status(self):
+        """
+        Возвращает статус сработавшего ограничения решения (см. LIMIT_STATUSES) или None.
+        """
+        max_iterations, deadline, cancel = self._limits
+        if max_iterations is not None and self.iterations >= max_iterations:
+            return "iteration_limit"
+        if deadline is not None and time.perf_counter() >= deadline:
+            return "time_limit"
+        if cancel is not None and cancel.cancelled:
+            return "cancelled"
+        return None
+
+
+    def _start_phase(self, phase):
+        """
+        Начинает этап phase в статистике решения (если её сбор включён).
+        """
+        if self._stats is not None:
+            self._stats.start(phase)
+
+
+    def _record_pivot(self, entering, leaving, step, table_size):
+        """
+        Учитывает итерацию в статистике решения и вызывает callback (если сбор статистики включён).
+        table_size - текущее число элементов симплекс-таблицы (или факторизации базиса).
+        """
+        stats = self._stats
+        stats.iterations[stats.phase] += 1
+        step = float(step)
+        degenerate = step <= EPS
+        if degenerate:
+            stats.degenerate_pivots += 1
+        stats.peak_table_size = max(stats.peak_table_size, table_size)
+        if stats.callback is not None:
+            stats.callback({"phase": stats.phase, "iteration": self.iterations, "entering": int(entering),
+                            "leaving": None if leaving is None else int(leaving), "step": step, "degenerate": degenerate})
+
+
+    def _get_solution_python(self, precision, method="auto"):
+        """
+        Решает каноническую ЗЛП, храня симплекс-таблицу в виде списка списков.
+        """
+        self._start_phase("setup")
+
+        # Коэффициенты целевой функции (coefficients)
+        self.c = self.canonical_problem_table[0].copy()
+        self.c.pop()
+
+        # Цель задачи (найти максимум или минимум) (objective)
+        self.obj = self.canonical_problem_table[0][-1]
+
+        # Симплекс-таблица (simplex table): строки канонической таблицы не копируются,
+        # а переносятся в рабочие буферы при первом изменении (см. `_writable_row`)
+        self.st = self.canonical_problem_table[1:]
+
+        # Сдвигаем нижние границы переменных в ноль (x = l + x')
+        lower = self.lower_bounds
+        if any(value != 0 for value in lower):
+            for i in range(len(self.st)):
+                shift = sum(self.st[i][j] * lower[j] for j in range(len(lower)) if lower[j] != 0)
+                if shift != 0:
+                    self._writable_row(i)[-1] -= shift
+
+        # Масштабируем столбцы исходных переменных и строки
+        # (столбцы дополнительных переменных делятся на множитель своей строки и не меняются)
+        if self._column_scale is not None:
+            n = len(self._column_scale)
+            for j in range(n):
+                self.c[j] *= float(self._column_scale[j])
+            for i in range(len(self.st)):
+                row = self._writable_row(i)
+                r = float(self._row_scale[i])
+                for j in range(n):
+                    row[j] *= r * float(self._column_scale[j])
+                row[-1] *= r
+
+        # Конечные верхние границы учитываются в тесте отношений (см. `_primal_simplex`), а не строками таблицы
+        upper = self._working_upper_bounds()
+        if any(value != float("inf") for value in upper):
+            self._upper = upper + [float("inf") for _ in range(len(self.c) - len(upper))]
+            self._flipped = [False for _ in range(len(self.c))]
+        else:
+            self._upper = self._flipped = None
+
+        # Ищем допустимый базис двойственным симплекс-методом (если начальный базис двойственно допустим)
+        # или фазой I двухфазного метода
+        if self._use_dual_simplex(method):
+            self._start_phase("dual")
+            status = self._dual_simplex()
+        else:
+            self._start_phase("phase_one")
+            status = self._phase_one()
+        if status != "optimal":
+            self.status = status
+            return
+
+        # Фаза II: оптимизируем исходную целевую функцию
+        # (при сработавшем ограничении решения ответ формируется по текущему допустимому базису)
+        self._start_phase("phase_two")
+        status = self._primal_simplex()
+        if status == "unbounded":
+            self.status = "unbounded"
+            return
+
+        # Формируем ответ в виде: [[<Значения x_1, x_2, x_3, ...>], <Значение целевой функции F>]
+        answer = [[0 for _ in range(len(self.c))], None]
+
+        # Находим значения переменных x_1, x_2, x_3, ...
+        # (в линейно зависимых строках базисной переменной нет)
+        i = 0
+        for bi in self.basis_indexes:
+            if bi is not None:
+                answer[0][bi] = self.st[i][-1]
+            i += 1
+        
+        # Дополненные переменные (x_j = u_j - x'_j) возвращаем к исходным,
+        # а их коэффициентам целевой функции - исходный знак
+        c = self.c.copy()
+        if self._flipped is not None:
+            for j in range(len(self.c)):
+                if self._flipped[j]:
+                    answer[0][j] = self._upper[j] - answer[0][j]
+                    c[j] = -c[j]
+
+        # Находим значение целевой функции F
+        f = 0
+        for i in range(len(c)):
+            f += c[i] * answer[0][i]
+        answer[1] = f
+
+        # Убираем из итогового ответа коэффициенты тех переменных,
+        # которые не входили в изначальную ЗЛП
+        answer = self._restore_answer(answer[0][:len(self.objective_coefficients)], answer[1])
+
+        # Возвращаем округлённый ответ
+        # (чтобы избежать погрешностей Python при работе с числами)
+        self.status = status
+        return self._round_result(answer, precision)
+       
+        
+    def _phase_one(self):
+        """
+        Фаза I двухфазного метода: ищет допустимый базис, минимизируя сумму искусственных переменных.
+        Строки с отрицательным b домножаются на -1, а в строки без базисной переменной
+        добавляются искусственные переменные. Если минимальная сумма больше нуля, допустимых решений нет:
+        сохраняет сертификат недопустимости и возвращает "infeasible". Иначе выводит искусственные переменные
+        из базиса, удаляет их столбцы и возвращает "optimal".
+        Если сработало ограничение решения, возвращает его статус (см. LIMIT_STATUSES).
+        """
+        m = len(self.st)
+        width = len(self.c)
+        tolerance = EPS * max([1] + [abs(row[-1]) for row in self.st])
+
+        # Домножаем строки с отрицательным b на -1 (их дополнительные переменные перестают быть базисными)
+        signs = [1 for _ in range(m)]
+        for i in range(m):
+            if self.st[i][-1] < 0:
+                row = self._writable_row(i)
+                for p in range(len(row)):
+                    row[p] = -row[p]
+                signs[i] = -1
+                self.basis_indexes[i] = None
+
+        # Добавляем искусственные переменные (столбцы единичной матрицы) в строки без базисной переменной
+        artificial_rows = [i for i in range(m) if self.basis_indexes[i] is None]
+        if not artificial_rows:
+            return "optimal"
+        k = len(artificial_rows)
+        zeros = [0] * k
+        for i in range(m):
+            self._writable_row(i)[-1:-1] = zeros
+        for t, i in enumerate(artificial_rows):
+            self.st[i][width + t] = 1
+            self.basis_indexes[i] = width + t
+
+        # Столбцы, которые в начале фазы I образуют единичную матрицу (сейчас в них записана матрица B^-1)
+        identity = self.basis_indexes.copy()
+
+        # Минимизируем сумму искусственных переменных (вернувшись из базиса, они в него больше не входят)
+        c, obj, upper = self.c, self.obj, self._upper
+        flipped = None if upper is None else self._flipped.copy()
+        self.c = [0 for _ in range(width)] + [1 for _ in range(k)]
+        self.obj = "min"
+        if upper is not None:
+            self._upper = upper + [float("inf") for _ in range(k)]
+        status = self._primal_simplex(width)
+        if status in LIMIT_STATUSES:
+            self._restore_objective(c, obj, upper, flipped)
+            return status
+
+        infeasibility = sum(self.st[i][-1] for i in range(m) if self.basis_indexes[i] >= width)
+        if infeasibility > tolerance:
+            # Двойственные оценки фазы I y = c_B * B^-1 дают сертификат недопустимости
+            y = [sum(self.c[bi] * self.st[r][identity[i]] for r, bi in enumerate(self.basis_indexes))
+                 for i in range(m)]
+            self._set_infeasibility_certificate([-signs[i] * y[i] for i in range(m)])
+            self._restore_objective(c, obj, upper, flipped)
+            return "infeasible"
+
+        # Выводим из базиса оставшиеся (нулевые) искусственные переменные
+        for i in range(m):
+            if self.basis_indexes[i] < width:
+                continue
+            j = next((j for j in range(width) if abs(self.st[i][j]) > EPS), None)
+            if j is None:
+                # Строка линейно зависима от остальных: обнуляем её и оставляем без базисной переменной
+                row = self.st[i]
+                for p in range(len(row)):
+                    row[p] = 0
+                self.basis_indexes[i] = None
+                continue
+            leaving_j = self.basis_indexes[i]
+            self._dividing_row_in_simplex_table(i, self.st[i][j])
+            self._zero_out_other_items_in_the_column(i, j)
+            self.basis_indexes[i] = j
+            self.iterations += 1
+            if self._stats is not None:
+                self._record_pivot(j, leaving_j, 0, len(self.st) * len(self.st[0]))
+
+        # Удаляем столбцы искусственных переменных и возвращаем исходную целевую функцию
+        for row in self.st:
+            del row[width:width + k]
+        self._restore_objective(c, obj, upper, flipped)
+        return "optimal"
+
+
+    def _restore_objective(self, c, obj, upper, flipped):
+        """
+        Возвращает после фазы I исходную целевую функцию c, цель obj и верхние границы столбцов upper.
+        У переменных, дополненных во время фазы I (признаки дополнения до неё - flipped),
+        коэффициенты c меняют знак.
+        """
+        if upper is not None:
+            for j in range(len(upper)):
+                if self._flipped[j] != flipped[j]:
+                    c[j] = -c[j]
+            self._upper = upper
+        self.c, self.obj = c, obj
+
+
+    def _use_dual_simplex(self, method):
+        """
+        Проверяет, можно ли начать с двойственного симплекс-метода: в каждой строке должна быть
+        базисная переменная, а дельты - оптимальными (базис двойственно допустим).
+        При method="auto" двойственный метод выбирается, только если есть отрицательные b.
+        """
+        if method == "primal":
+            return False
+        if method == "auto" and all(row[-1] >= 0 for row in self.st):
+            return False
+
+        dual_feasible = None not in self.basis_indexes
+        if dual_feasible:
+            self.deltas = [None for _ in range(len(self.st[0]) - 1)]
+            self._calculate_deltas()
+            dual_feasible = self._checking_all_deltas(self.obj)
+
+        if method == "dual" and not dual_feasible:
+            raise ValueError("Начальный базис не является двойственно допустимым")
+        return dual_feasible
+
+
+    def _dual_simplex(self):
+        """
+        Двойственный симплекс-метод: начиная с базиса с оптимальными дельтами,
+        избавляется от отрицательных свободных коэффициентов b, сохраняя оптимальность дельт.
+        Возвращает "optimal" или "infeasible" (если в строке с отрицательным b нет отрицательных элементов;
+        тогда эта строка B^-1 даёт сертификат недопустимости), а также статус сработавшего ограничения решения.
+        """
+        # Столбцы начального базиса (в них записана матрица B^-1)
+        identity = self.basis_indexes.copy()
+
+        while True:
+            if self._limits is not None:
+                limit = self._limit_status()
+                if limit is not None:
+                    return limit
+
+            # Базисные переменные выше своих верхних границ заменяем на u - x: их b становятся отрицательными
+            if self._upper is not None:
+                for r, bi in enumerate(self.basis_indexes):
+                    if bi is not None and self.st[r][-1] > self._upper[bi] + EPS:
+                        self._complement_basic_variable(r)
+
+            # Разрешающая строка - строка с минимальным отрицательным b
+            i = min(range(len(self.st)), key=lambda k: self.st[k][-1])
+            if self.st[i][-1] >= -EPS:
+                return "optimal"
+
+            # Разрешающий столбец - с минимальным отношением дельты к элементу строки
+            # (при таком выборе дельты сохраняют оптимальный знак)
+            j = None
+            ratio_min = float("inf")
+            for k in range(len(self.st[i]) - 1):
+                if self.st[i][k] < -EPS:
+                    reduced = max(self.deltas[k] if self.obj == "max" else -self.deltas[k], 0)
+                    ratio = reduced / -self.st[i][k]
+                    if ratio < ratio_min:
+                        j = k
+                        ratio_min = ratio
+            if j is None:
+                self._set_infeasibility_certificate([self.st[i][k] for k in identity])
+                return "infeasible"
+
+            leaving_j = self.basis_indexes[i]
+            self._dividing_row_in_simplex_table(i, self.st[i][j])
+            self._zero_out_other_items_in_the_column(i, j)
+            self.basis_indexes[i] = j
+            self._update_deltas(i, j)
+            self.iterations += 1
+            if self._stats is not None:
+                self._record_pivot(j, leaving_j, ratio_min, len(self.st) * len(self.st[0]))
+
+
+    def _primal_simplex(self, number_of_columns=None):
+        """
+        Цикл оптимизации с помощью дельт, начиная с текущего допустимого базиса.
+        В базис могут входить только первые number_of_columns столбцов (по умолчанию - все).
+        Возвращает "optimal" или "unbounded" (если нет подходящих симплекс-отношений Q),
+        а также статус сработавшего ограничения решения (см. LIMIT_STATUSES).
+        """
+        # Дельты симплекс-таблицы для оптимизации решения
+        self.deltas = [None for _ in range(len(self.st[0]) - 1)]
+
+        # Рассчитываем дельты (дальше они пересчитываются по разрешающей строке после каждой итерации)
+        self._calculate_deltas()
+        deltas = self.deltas
+
+        # Число вырожденных итераций подряд и базис, действовавший при включении защиты от зацикливания
+        degenerate_run = 0
+        anti_cycling_basis = None
+        stats = self._stats
+
+        # Цикл оптимизации с помощью дельт
+        while True:
+            if self._limits is not None:
+                limit = self._limit_status()
+                if limit is not None:
+                    return limit
+            if stats is not None:
+                stats.mark()
+            anti_cycling = self._anti_cycling is not None and degenerate_run >= ANTI_CYCLING_THRESHOLD
+            if anti_cycling and anti_cycling_basis is None:
+                anti_cycling_basis = [bi for bi in self.basis_indexes if bi is not None]
+
+            # Проверяем решение на оптимальность
+            if self._checking_all_deltas(self.obj, number_of_columns):
+                # Перед выходом сверяемся с дельтами, рассчитанными заново,
+                # чтобы накопленная погрешность не привела к преждевременной остановке
+                self._calculate_deltas()
+                if self._checking_all_deltas(self.obj, number_of_columns):
+                    return "optimal"
+
+            # Ищем разрешающий столбец (среди первых number_of_columns столбцов, не копируя дельты)
+            resolution_column_j = None
+            candidates = range(len(deltas) if number_of_columns is None else number_of_columns)
+
+            # Правило Бланда - первый столбец, улучшающий решение
+            if anti_cycling and self._anti_cycling == "bland":
+                resolution_column_j = next(j for j in candidates
+                                           if (deltas[j] < 0) == (self.obj == "max") and deltas[j] != 0)
+
+            # При заданном условии "max" - ищем столбец с минимальной дельтой
+            elif self.obj == "max":
+                resolution_column_j = min(candidates, key=deltas.__getitem__)
+
+            # При заданном условии "min" - ищем столбец с максимальной дельтой
+            elif self.obj == "min":
+                resolution_column_j = max(candidates, key=deltas.__getitem__)
+            if stats is not None:
+                stats.lap("pricing")
+            
+            # Рассчитываем симплекс-отношения Q
+            q = self._calculate_simplex_relations_of_q(resolution_column_j)
+
+            # Входящая переменная может дойти до своей верхней границы раньше, чем базисные - до своих
+            bound = float("inf") if self._upper is None else self._upper[resolution_column_j]
+
+            # Если нет подходящих Q и верхней границы, значит решения не существует
+            if all(x is None for x in q) and bound == float("inf"):
+                return "unbounded"
+
+            # Ищем строку с минимальным Q (разрешающая строка)
+            # (Элемент на пересечении разрешающих столбца и строки также называется разрешающим)
+            row_with_min_q_i = None
+            q_min = float("inf")
+            for i in range(len(q)):
+                if (not (q[i] is None)) and (q[i] < q_min):
+                    row_with_min_q_i = i
+                    q_min = q[i]
+
+            # При защите от зацикливания выбираем среди строк с минимальным Q
+            # базисную переменную с наименьшим индексом (правило Бланда)
+            # или строку с лексикографически наименьшим отношением к разрешающему столбцу
+            if anti_cycling and row_with_min_q_i is not None:
+                tied = [i for i in range(len(q)) if q[i] is not None and q[i] <= q_min + EPS]
+                if self._anti_cycling == "bland":
+                    row_with_min_q_i = min(tied, key=lambda i: self.basis_indexes[i])
+                else:
+                    row_with_min_q_i = min(tied, key=lambda i: [self.st[i][k] / self.st[i][resolution_column_j]
+                                                                for k in anti_cycling_basis])
+            step = min(q_min, bound)
+            if step <= EPS:
+                degenerate_run += 1
+            else:
+                degenerate_run = 0
+                anti_cycling_basis = None
+            if stats is not None:
+                stats.lap("ratio_test")
+
+            # Входящая переменная дошла до верхней границы: переводим её на эту границу без смены базиса
+            if bound <= q_min:
+                self._flip_column(resolution_column_j)
+                self.iterations += 1
+                if stats is not None:
+                    stats.lap("pivoting")
+                    self._record_pivot(resolution_column_j, resolution_column_j, step, len(self.st) * len(self.st[0]))
+                continue
+
+            # Базисная переменная дошла до верхней границы: заменяем её на u - x, и она выходит из базиса на нуле
+            if self.st[row_with_min_q_i][resolution_column_j] < 0:
+                self._complement_basic_variable(row_with_min_q_i)
+
+            # Приводим разрешающий элемент к единице, а все остальные элементы в разрешающем столбце к нулю
+            leaving_j = self.basis_indexes[row_with_min_q_i]
+            self._dividing_row_in_simplex_table(row_with_min_q_i, self.st[row_with_min_q_i][resolution_column_j])
+            self._zero_out_other_items_in_the_column(row_with_min_q_i, resolution_column_j)
+
+            # Обновляем базис и дельты
+            self.basis_indexes[row_with_min_q_i] = resolution_column_j
+            self._update_deltas(row_with_min_q_i, resolution_column_j)
+            self.iterations += 1
+            if stats is not None:
+                stats.lap("pivoting")
+                self._record_pivot(resolution_column_j, leaving_j, step, len(self.st) * len(self.st[0]))
+
+
+    def _set_infeasibility_certificate(self, z):
+        """
+        Сохраняет сертификат недопустимости по двойственным оценкам фазы I.
+        z - множители строк рабочей системы (ограничения в каноническом виде, после масштабирования;
+        строки верхних границ движка "interior", если они есть, идут после ограничений и не учитываются).
+        """
+        certificate = []
+        for i in range(len(self.constraint_rhs)):
+            value = float(z[i])
+            if self._row_scale is not None:
+                value *= float(self._row_scale[i])
+            if self.constraint_senses[i] == ">=":
+                value = -value
+            certificate.append(value)
+        self.infeasibility_certificate = certificate
+
+
+    def resolve(self, rhs=None, objective_coefficients=None, constraint=None, precision=8, pricing="dantzig"):
+        """
+        Повторно решает ЗЛП после небольших изменений, начиная с базиса и симплекс-таблицы
+        последнего решения движком "numpy" (если его не было, ЗЛП решается заново).
+
+        - rhs - новые правые части ограничений (список той же длины);
+        - objective_coefficients - новые коэффициенты целевой функции;
+        - constraint - новое ограничение в виде (коэффициенты, знак, правая часть),
+          например ([1, 0, 2], "<=", 5). Ограничение "=" добавляется парой ограничений "<=" и ">=".
+
+        Если после изменений базис перестаёт быть допустимым, но дельты остаются оптимальными,
+        используется двойственный симплекс-метод.
+        """
+        if self.sparse:
+            raise ValueError("Повторное решение не поддерживается для разреженного представления ЗЛП")
+        if self.presolve_info is not None:
+            raise ValueError("Повторное решение не поддерживается для ЗЛП после предварительной обработки")
+
+        # Продолжить можно только с полной симплекс-таблицы последнего решения движком "numpy"
+        warm_start = (
+            getattr(self, "engine", None) == "numpy"
+            and isinstance(getattr(self, "st", None), np.ndarray)
+            and None not in self.basis_indexes
+            and self._column_scale is None
+            and self.st.shape[1] == len(self.canonical_problem_table[0])
+        )
+
+        # Вносим изменения в ЗЛП, каноническую таблицу и (при повторном решении) в симплекс-таблицу
+        if objective_coefficients is not None:
+            self._change_objective(objective_coefficients)
+        if rhs is not None:
+            self._change_rhs(rhs, warm_start)
+        if constraint is not None:
+            coefficients, sense, constraint_rhs = constraint
+            if sense == "=":
+                self._add_constraint(coefficients, "<=", constraint_rhs, warm_start)
+                self._add_constraint(coefficients, ">=", constraint_rhs, warm_start)
+            else:
+                self._add_constraint(coefficients, sense, constraint_rhs, warm_start)
+
+        if not warm_start:
+            return self.get_solution(precision, "numpy", pricing)
+
+        self.iterations = 0
+        self.status = None
+        self.infeasibility_certificate = None
+        self.stats = self._stats = None
+        self._limits = None
+        self._calculate_deltas_numpy()
+
+        # Если появились отрицательные свободные коэффициенты (или базисные переменные вышли за верхние границы),
+        # восстанавливаем допустимость двойственным симплекс-методом (если дельты остались оптимальными)
+        # или решаем заново
+        infeasible = (self.st[:, -1] < -EPS).any()
+        if self._upper is not None:
+            infeasible = infeasible or (self.st[:, -1] > self._basic_upper_bounds_numpy() + EPS).any()
+        if infeasible:
+            if self._select_column_numpy(None, "dantzig", None) is not None:
+                return self.get_solution(precision, "numpy", pricing)
+            identity = self.canonical_basis_indexes if None not in self.canonical_basis_indexes else None
+            if self._dual_simplex_numpy(identity) == "infeasible":
+                self.status = "infeasible"
+                return
+
+        # Доводим решение до оптимального прямым симплекс-методом
+        if self._primal_simplex_numpy(pricing) == "unbounded":
+            self.status = "unbounded"
+            return
+
+        return self._answer_numpy(precision)
+
+
+    def _change_objective(self, objective_coefficients):
+        """
+        Заменяет коэффициенты целевой функции (в том числе в канонической таблице).
+        """
+        number_of_variables = len(self.objective_coefficients)
+        if len(objective_coefficients) != number_of_variables:
+            raise ValueError(f"Ожидалось {number_of_variables} коэффициентов целевой функции")
+
+        self.objective_coefficients = list(objective_coefficients)
+        self.canonical_problem_table[0][:number_of_variables] = self.objective_coefficients
+        if isinstance(getattr(self, "c", None), np.ndarray):
+            self.c[:number_of_variables] = self.objective_coefficients
+            # У дополненных переменных (x_j = u_j - x'_j) коэффициенты в симплекс-таблице с обратным знаком
+            flipped = getattr(self, "_flipped", None)
+            if flipped is not None:
+                self.c[:number_of_variables][flipped[:number_of_variables]] *= -1
+
+
+    def _change_rhs(self, rhs, warm_start):
+        """
+        Заменяет правые части ограничений (в том числе в канонической таблице).
+        При повторном решении пересчитывает столбец b симплекс-таблицы: B^-1 * b.
+        """
+        if len(rhs) != len(self.constraint_rhs):
+            raise ValueError(f"Ожидалось {len(self.constraint_rhs)} правых частей ограничений")
+
+        # Изменения правых частей в каноническом виде (строки с ">=" домножены на -1)
+        changes = []
+        for i in range(len(rhs)):
+            sign = -1 if self.constraint_senses[i] == ">=" else 1
+            changes.append(sign * (rhs[i] - self.constraint_rhs[i]))
+            self.canonical_problem_table[i + 1][-1] = sign * rhs[i]
+        self.constraint_rhs = list(rhs)
+
+        if not warm_start:
+            return
+
+        # Столбцы дополнительных переменных симплекс-таблицы - это столбцы матрицы B^-1
+        # (в строках с дополненной базисной переменной - с обратным знаком, как и изменение b),
+        # поэтому изменения в строках с дополнительными переменными учитываются без решения системы
+        changed_rows = [i for i in range(len(changes)) if changes[i] != 0]
+        if all(self.canonical_basis_indexes[i] is not None for i in changed_rows):
+            for i in changed_rows:
+                self.st[:, -1] += changes[i] * self.st[:, self.canonical_basis_indexes[i]]
+        else:
+            table = np.array(self.canonical_problem_table[1:], dtype=np.float64)
+            shift = np.linalg.solve(table[:, self.basis_indexes], changes)
+            if self._flipped is not None:
+                shift[self._flipped[self.basis_indexes]] *= -1
+            self.st[:, -1] += shift
+
+
+    def _add_constraint(self, coefficients, sense, rhs, warm_start):
+        """
+        Добавляет ограничение "<=" или ">=" с новой дополнительной переменной, которая становится базисной.
+        При повторном решении добавляет в симплекс-таблицу строку, выраженную через текущий базис.
+        """
+        number_of_variables = len(self.objective_coefficients)
+        if len(coefficients) > number_of_variables:
+            raise ValueError(f"Ожидалось не более {number_of_variables} коэффициентов ограничения")
+        coefficients = list(coefficients) + [0] * (number_of_variables - len(coefficients))
+
+        self.constraint_matrix.append(coefficients)
+        self.constraint_senses.append(sense)
+        self.constraint_rhs.append(rhs)
+
+        # Добавляем столбец новой дополнительной переменной во все строки канонической таблицы
+        for row in self.canonical_problem_table:
+            row.insert(-1, 0)
+        slack_j = len(self.canonical_problem_table[0]) - 2
+
+        # Новая строка канонической таблицы (ограничение ">=" домножается на -1)
+        sign = -1 if sense == ">=" else 1
+        row = [sign * coefficient for coefficient in coefficients]
+        row += [0] * (slack_j - number_of_variables) + [1, sign * rhs]
+        self.canonical_problem_table.append(array("d", row))
+        self.canonical_basis_indexes.append(slack_j)
+        self.basis_indexes.append(slack_j)
+
+        if not warm_start:
+            return
+
+        # Переводим новую строку к переменным симплекс-таблицы: сдвигаем нижние границы в ноль
+        # и дополняем те же переменные, что и в таблице (x_j = u_j - x'_j)
+        self.st = np.insert(self.st, slack_j, 0.0, axis=1)
+        new_row = np.array(row, dtype=np.float64)
+        new_row[-1] -= new_row[:number_of_variables] @ np.array(self.lower_bounds, dtype=np.float64)
+        if self._upper is not None:
+            self._upper = np.append(self._upper, np.inf)
+            self._flipped = np.append(self._flipped, False)
+            new_row[-1] -= new_row[:-1][self._flipped] @ self._upper[self._flipped]
+            new_row[:-1][self._flipped] *= -1
+
+        # Выражаем новую строку через текущий базис: вычитаем из неё базисные строки таблицы
+        new_row -= new_row[self.basis_indexes[:-1]] @ self.st
+        self.st = np.vstack([self.st, new_row])
+        self.c = np.append(self.c, 0.0)
+
+
+    def sensitivity(self, precision=8):
+        """
+        Анализ чувствительности оптимального решения последнего вызова `get_solution` (или `resolve`).
+        Возвращает словарь:
+        - "shadow_prices" - двойственные оценки ограничений: изменение оптимального значения целевой функции
+          при увеличении правой части ограничения на единицу;
+        - "reduced_costs" - оценки переменных: изменение целевой функции при увеличении переменной
+          на единицу (у базисных переменных - 0);
+        - "rhs_ranges" - для каждого ограничения отрезок [нижняя, верхняя] значений правой части,
+          на котором оптимальный базис не меняется (остальные данные неизменны);
+        - "objective_ranges" - такие же отрезки для коэффициентов целевой функции.
+        Все величины вычисляются за один проход по таблице B^-1 * A оптимального базиса.
+        """
+        tableau = self._optimal_tableau()
+        t, beta, binv, rows, basis = tableau["t"], tableau["beta"], tableau["binv"], tableau["rows"], tableau["basis"]
+        d, y, signs, sense = tableau["d"], tableau["y"], tableau["signs"], tableau["sense"]
+        n = len(self.objective_coefficients)
+        nonbasic = np.ones(len(d), dtype=bool)
+        nonbasic[basis] = False
+
+        # Правые части: базис остаётся допустимым, пока B^-1 * (b + t * e_i) >= 0
+        rhs_ranges = []
+        position = {i: p for p, i in enumerate(rows)}
+        for i, b in enumerate(self.constraint_rhs):
+            if i not in position:
+                # Линейно зависимое равенство: любое изменение делает ограничения несовместными
+                rhs_ranges.append([b, b])
+                continue
+            low, high = _parametric_interval(beta, binv[:, position[i]])
+            rhs_ranges.append([b + low, b + high] if signs[i] > 0 else [b - high, b - low])
+
+        # Коэффициенты целевой функции: базис остаётся оптимальным, пока оценки d (для максимизации) <= 0
+        objective_ranges = []
+        row_of = {j: p for p, j in enumerate(basis)}
+        for j, c in enumerate(self.objective_coefficients):
+            if j in row_of:
+                # Изменение коэффициента базисной переменной меняет оценки на -t * (строка таблицы)
+                slopes = np.where(nonbasic, t[row_of[j]], 0.0)
+                low, high = _parametric_interval(-d, slopes)
+            else:
+                low, high = -np.inf, -d[j]
+            objective_ranges.append([c + low, c + high] if sense > 0 else [c - high, c - low])
+
+        result = {
+            "shadow_prices": (sense * signs * y + 0.0).tolist(),
+            "reduced_costs": (sense * d[:n] + 0.0).tolist(),
+            "rhs_ranges": [[float(low), float(high)] for low, high in rhs_ranges],
+            "objective_ranges": [[float(low), float(high)] for low, high in objective_ranges],
+        }
+        return {key: self._round_result(value, precision) for key, value in result.items()}
+
+
+    def parametric(self, rhs_direction=None, objective_direction=None, t_max=float("inf"), precision=8):
+        """
+        Параметрический анализ: начиная с оптимального базиса последнего решения, проходит по лучу
+        b + t * rhs_direction (или c + t * objective_direction) при t от 0 до t_max, меняя базис
+        на каждой точке излома (двойственным симплекс-методом для правых частей, прямым - для целевой функции).
+        Задаётся ровно одно из направлений.
+
+        Возвращает список отрезков в порядке возрастания t. Отрезок - словарь с ключами
+        "t_from", "t_to", "status" ("optimal", а после последней точки излома - "infeasible" или "unbounded",
+        если дальше решения нет), "x" и "objective" (решение и значение целевой функции при t_from),
+        "x_slope" и "objective_slope" (их производные по t на отрезке) и "basis".
+        """
+        if (rhs_direction is None) == (objective_direction is None):
+            raise ValueError("Нужно задать ровно одно из направлений: rhs_direction или objective_direction")
+
+        tableau = self._optimal_tableau()
+        t_table, rows, basis = tableau["t"], tableau["rows"], list(tableau["basis"])
+        d, signs, sense = tableau["d"], tableau["signs"], tableau["sense"]
+        n = len(self.objective_coefficients)
+        number_of_columns = t_table.shape[1]
+
+        # Рабочая таблица [B^-1 * A | B^-1 * b | B^-1 * направление правых частей]
+        # и оценки d (для максимизации) с их производными по t
+        work = np.zeros((len(rows), number_of_columns + 2))
+        work[:, :number_of_columns] = t_table
+        work[:, -2] = tableau["beta"]
+        d_slope = np.zeros(number_of_columns)
+        if rhs_direction is not None:
+            if len(rhs_direction) != len(self.constraint_rhs):
+                raise ValueError(f"Ожидалось {len(self.constraint_rhs)} компонент направления правых частей")
+            work[:, -1] = tableau["binv"] @ (signs * np.array(rhs_direction, dtype=np.float64))[rows]
+        else:
+            if len(objective_direction) != n:
+                raise ValueError(f"Ожидалось {n} компонент направления целевой функции")
+            g = np.zeros(number_of_columns)
+            g[:n] = sense * np.array(objective_direction, dtype=np.float64)
+            d_slope = g - g[basis] @ t_table
+            objective_direction = np.array(objective_direction, dtype=np.float64)
+        c = np.array(self.objective_coefficients, dtype=np.float64)
+
+        def pivot(r, k):
+            """
+            Вводит столбец k в базис вместо базисной переменной строки r.
+            """
+            work[r] /= work[r, k]
+            column = work[:, k].copy()
+            column[r] = 0
+            work[:] -= np.outer(column, work[r])
+            d[:] -= d[k] * work[r, :number_of_columns]
+            d_slope[:] -= d_slope[k] * work[r, :number_of_columns]
+            basis[r] = k
+
+        segments = []
+        status = None
+        t = 0.0
+        while True:
+            # Решение и его производная по t в текущем базисе
+            x_full = np.zeros(number_of_columns)
+            x_full[basis] = work[:, -2] + t * work[:, -1]
+            x_slope_full = np.zeros(number_of_columns)
+            x_slope_full[basis] = work[:, -1]
+            x, x_slope = x_full[:n], x_slope_full[:n]
+            objective = c @ x
+            objective_slope = c @ x_slope
+            if objective_direction is not None:
+                objective += t * (objective_direction @ x)
+                objective_slope = objective_direction @ x
+
+            # Точка излома: базисная переменная строки r обращается в ноль
+            # или оценка небазисной переменной k становится положительной
+            nonbasic = np.ones(number_of_columns, dtype=bool)
+            nonbasic[basis] = False
+            if rhs_direction is not None:
+                slopes = work[:, -1]
+                ratios = np.full(len(slopes), np.inf)
+                np.divide(np.maximum(x_full[basis], 0.0), -slopes, out=ratios, where=slopes < -EPS)
+                r = int(np.argmin(ratios)) if len(ratios) > 0 else None
+                t_next = t + ratios[r] if r is not None else np.inf
+            else:
+                ratios = np.full(number_of_columns, np.inf)
+                np.divide(np.maximum(-(d + t * d_slope), 0.0), d_slope, out=ratios, where=nonbasic & (d_slope > EPS))
+                k = int(np.argmin(ratios))
+                t_next = t + ratios[k]
+
+            if t_next > t + EPS or t_next >= t_max:
+                segments.append({
+                    "t_from": float(t), "t_to": float(min(t_next, t_max)), "status": "optimal",
+                    "x": x.tolist(), "objective": float(objective),
+                    "x_slope": x_slope.tolist(), "objective_slope": float(objective_slope),
+                    "basis": [int(j) for j in basis],
+                })
+            if t_next >= t_max:
+                break
+            t = float(t_next)
+
+            if rhs_direction is not None:
+                # Двойственный шаг: выходит переменная, обратившаяся в ноль, входит переменная
+                # с минимальным отношением оценки к отрицательному элементу строки
+                row = work[r, :number_of_columns]
+                entering = nonbasic & (row < -EPS)
+                if not entering.any():
+                    status = "infeasible"
+                    break
+                ratios = np.full(number_of_columns, np.inf)
+                np.divide(d, row, out=ratios, where=entering)
+                pivot(r, int(np.argmin(ratios)))
+            else:
+                # Прямой шаг: входит переменная, оценка которой стала положительной
+                column = work[:, k]
+                if not (column > EPS).any():
+                    status = "unbounded"
+                    break
+                ratios = np.full(len(column), np.inf)
+                np.divide(work[:, -2], column, out=ratios, where=column > EPS)
+                pivot(int(np.argmin(ratios)), k)
+
+        if t < t_max and (not segments or segments[-1]["t_to"] < t_max):
+            segments.append({"t_from": float(t), "t_to": float(t_max), "status": status, "x": None, "objective": None,
+                             "x_slope": None, "objective_slope": None, "basis": None})
+        return [{key: self._round_result(value, precision) for key, value in segment.items()} for segment in segments]
+
+
+    def _optimal_tableau(self):
+        """
+        Восстанавливает по канонической ЗЛП и базису последнего оптимального решения данные для анализа
+        чувствительности (ЗЛП приводится к максимизации). Возвращает словарь:
+        t = B^-1 * A и beta = B^-1 * b (только строки с базисной переменной rows), binv = B^-1, basis,
+        двойственные оценки y и оценки переменных d = c - y * A (в оптимуме d <= 0),
+        signs - множители строк при приведении к каноническому виду (-1 для ">="),
+        sense - 1 для максимизации и -1 для минимизации.
+        """
+        if np is None:
+            raise ImportError("Для анализа чувствительности требуется установленный пакет numpy")
+        if getattr(self, "status", None) != "optimal":
+            raise ValueError("Анализ чувствительности доступен только после оптимального решения")
+        if self.basis_indexes and all(j is None for j in self.basis_indexes):
+            raise ValueError("Анализ чувствительности требует базисного решения (engine=\"interior\" с crossover=True)")
+        if self.presolve_info is not None or self._has_bounds():
+            raise ValueError("Анализ чувствительности не поддерживается для ЗЛП после предварительной обработки "
+                             "и с границами переменных")
+
+        # Каноническая матрица ограничений вместе со столбцами дополнительных переменных
+        if self.sparse:
+            m, n = self.canonical_constraint_matrix.shape
+            slack_rows = [i for i in range(m) if self.constraint_senses[i] != "="]
+            a = np.zeros((m, n + len(slack_rows)))
+            a[:, :n] = self.canonical_constraint_matrix.toarray()
+            a[slack_rows, n + np.arange(len(slack_rows))] = 1
+            b = self.canonical_rhs
+            c = np.zeros(a.shape[1])
+            c[:n] = self.objective_coefficients
+        else:
+            table = np.array(self.canonical_problem_table[1:], dtype=np.float64).reshape(len(self.constraint_rhs), -1)
+            a, b = table[:, :-1], table[:, -1]
+            c = np.array(self.canonical_problem_table[0][:-1], dtype=np.float64)
+        sense = 1.0 if self.objective_sense == "max" else -1.0
+        c = sense * c
+
+        # Строки без базисной переменной линейно зависимы от остальных и не участвуют в анализе
+        rows = [i for i, bi in enumerate(self.basis_indexes) if bi is not None]
+        basis = [int(self.basis_indexes[i]) for i in rows]
+        binv = np.linalg.inv(a[np.ix_(rows, basis)])
+        y = np.zeros(len(b))
+        y[rows] = c[basis] @ binv
+        d = c - y @ a
+        d[basis] = 0
+        d[np.abs(d) < EPS] = 0
+
+        return {
+            "t": binv @ a[rows], "beta": binv @ b[rows], "binv": binv, "rows": rows, "basis": basis,
+            "y": y, "d": d, "sense": sense,
+            "signs": np.array([-1.0 if s == ">=" else 1.0 for s in self.constraint_senses]),
+        }
+
+
+    def compare_pricing_rules(self, engine="numpy", rules=PRICING_RULES):
+        """
+        Решает ЗЛП с каждым из правил ценообразования и возвращает число итераций для каждого из них.
+        Пример: {"dantzig": 12, "partial": 15, "devex": 9, "steepest_edge": 7}
+        """
+        report = {}
+        for pricing in rules:
+            self.get_solution(engine=engine, pricing=pricing)
+            report[pricing] = self.iterations
+        return report
+
+
+    def _convert_problem_to_canonical_form(self):
+        """
+        Преобразует ЗЛП к каноническому виду и записывает в единую таблицу для дальнейшей работы.
+        """
+        # Создаём локальные копии параметров ЗЛП
+        objective_coefficients = self.objective_coefficients.copy()
+        objective_sense = self.objective_sense
+        constraint_matrix = [row.copy() for row in self.constraint_matrix]
+        constraint_senses = self.constraint_senses.copy()
+        constraint_rhs = self.constraint_rhs.copy()
+
+        # Перебираем все типы ограничений
+        for i in range(len(constraint_senses)):
+            # Если знак ограничения не равен "=" (т.е. равен "<=" или ">="),
+            # то нужно сделать соответствующее преобразование
+            if constraint_senses[i] != "=":
+                # Для знака "<=" добавляем новую переменную с коэффициентом 1
+                if constraint_senses[i] == "<=":
+                    constraint_matrix[i].append(1)
+
+                # Для знака ">=" домножаем всё ограничение на -1 (чтобы изменить знак на "<="),
+                # а дальше также добавляем новую переменную с коэффициентом 1
+                elif constraint_senses[i] == ">=":
+                    for j in range(len(constraint_matrix[i])):
+                        constraint_matrix[i][j] = -constraint_matrix[i][j]
+                    constraint_rhs[i] = -constraint_rhs[i]
+                    constraint_matrix[i].append(1)
+                
+                # Для всех остальных строк добавляем эту новую переменную с коэффициентом 0
+                objective_coefficients.append(0)
+                for j in range(len(constraint_senses)):
+                    if j != i:
+                        constraint_matrix[j].append(0)
+
+                # Также указываем новую переменную как базисную 
+                # для соответствующей строки симплекс-таблицы
+                self.basis_indexes[i] = len(constraint_matrix[i]) - 1
+        
+        # Единая таблица для канонической формы ЗЛП
+        canonical_problem_table = []
+
+        # Добавляем в таблицу коэффициенты целевой функции и направление оптимизации 
+        canonical_problem_table.append(objective_coefficients)
+        canonical_problem_table[0].append(objective_sense)
+
+        # Добавляем в таблицу коэффициенты и правую часть ограничений (строки хранятся в массивах array("d"))
+        for i in range(len(constraint_matrix)):
+            constraint_matrix[i].append(constraint_rhs[i])
+            canonical_problem_table.append(array("d", constraint_matrix[i]))
+
+        # Сохраняем таблицу в глобальную переменную класса
+        self.canonical_problem_table = canonical_problem_table
+
+        # Сохраняем исходный базис, чтобы каждое решение начиналось с него
+        self.canonical_basis_indexes = self.basis_indexes.copy()
+
+
+    def _convert_problem_to_canonical_form_sparse(self):
+        """
+        Приводит разреженную ЗЛП к каноническому виду.
+        Дополнительные переменные в матрицу не добавляются: их столбцы - единичные векторы,
+        поэтому хватает знать только строки, в которых они стоят.
+        """
+        # Строки с ">=" домножаем на -1
+        signs = np.array([-1.0 if s == ">=" else 1.0 for s in self.constraint_senses])
+        self.canonical_constraint_matrix = (sp.diags(signs) @ self.constraint_matrix).tocsc()
+        self.canonical_rhs = np.array(self.constraint_rhs, dtype=np.float64) * signs
+
+        # Дополнительные переменные нумеруются после значимых и становятся базисными
+        number_of_variables = self.constraint_matrix.shape[1]
+        k = 0
+        for i in range(len(self.constraint_senses)):
+            if self.constraint_senses[i] != "=":
+                self.basis_indexes[i] = number_of_variables + k
+                k += 1
+
+        # Плотная таблица для разреженного представления не строится
+        self.canonical_problem_table = None
+        self.canonical_basis_indexes = self.basis_indexes.copy()
+
+
+    def _dividing_row_in_simplex_table(self, row_i, divisor):
+        """
+        Делит строку в таблице на заданное значение.
+        """
+        row = self._writable_row(row_i)
+        for j in range(len(row)):
+            row[j] = row[j] / divisor
+
+
+    def _zero_out_other_items_in_the_column(self, i, j):
+        """
+        Приводит к нулю все элементы столбца кроме заданного.
+        """
+        resolution_row = self.st[i]
+        for row_i in range(len(self.st)):
+            if row_i == i:
+                continue
+            subtraction_coeff = self.st[row_i][j]
+            if subtraction_coeff == 0:
+                # Строка не меняется (и остаётся общей с канонической таблицей)
+                continue
+            row = self._writable_row(row_i)
+            for k in range(len(row)):
+                row[k] = row[k] - (resolution_row[k] * subtraction_coeff)
+
+
+    def _flip_column(self, j):
+        """
+        Переводит небазисную переменную столбца j на противоположную границу заменой x_j = u_j - x'_j:
+        из столбца b вычитается столбец j, умноженный на u_j, а столбец, коэффициент целевой функции
+        и дельта столбца меняют знак.
+        """
+        upper = self._upper[j]
+        for i in range(len(self.st)):
+            a = self.st[i][j]
+            if a != 0:
+                row = self._writable_row(i)
+                row[j] = -a
+                row[-1] -= a * upper
+        self.c[j] = -self.c[j]
+        self.deltas[j] = -self.deltas[j]
+        self._flipped[j] = not self._flipped[j]
+
+
+    def _complement_basic_variable(self, i):
+        """
+        Заменяет базисную переменную x строки i на u - x (u - её верхняя граница):
+        элементы строки, кроме базисного, меняют знак, b заменяется на u - b.
+        Дельты при этом не меняются.
+        """
+        j = self.basis_indexes[i]
+        row = self._writable_row(i)
+        for k in range(len(row)):
+            row[k] = -row[k]
+        row[j] = 1
+        row[-1] += self._upper[j]
+        self.c[j] = -self.c[j]
+        self._flipped[j] = not self._flipped[j]
+
+
+    def _writable_row(self, i):
+        """
+        Возвращает строку i симплекс-таблицы движка "python", которую можно изменять (копирование при записи).
+        Пока строка не менялась, в таблице лежит сама строка канонической таблицы; перед первым изменением
+        она копируется в рабочий буфер экземпляра. Буферы сохраняются между решениями, поэтому повторное
+        решение той же ЗЛП не выделяет память под таблицу, а каноническая таблица никогда не изменяется.
+        """
+        buffers = self._row_buffers
+        while len(buffers) <= i:
+            buffers.append([])
+        buffer = buffers[i]
+        row = self.st[i]
+        if row is not buffer:
+            buffer[:] = row
+            self.st[i] = buffer
+        return buffer
+
+
+    def _calculate_deltas(self):
+        """
+        Рассчитывает дельты для симплекс-таблицы.
+        Значения, отличающиеся от нуля меньше чем на EPS, считаются нулевыми (это погрешность вычислений).
+        """
+        coeffs = []
+        for bi in self.basis_indexes:
+            coeffs.append(0 if bi is None else self.c[bi])
+        for j in range(len(self.st[0]) - 1):
+            delta_j = 0
+            for i in range(len(self.st)):
+                delta_j += self.st[i][j] * coeffs[i]
+            delta_j -= self.c[j]
+            self.deltas[j] = delta_j if abs(delta_j) >= EPS else 0
+
+
+    def _update_deltas(self, i, j):
+        """
+        Пересчитывает дельты после преобразования таблицы с разрешающим элементом (i, j).
+        Дельты ведут себя как ещё одна строка таблицы, поэтому из них достаточно вычесть
+        разрешающую строку, умноженную на дельту разрешающего столбца.
+        Значения, отличающиеся от нуля меньше чем на EPS, считаются нулевыми (это погрешность вычитания).
+        """
+        row = self.st[i]
+        delta_j = self.deltas[j]
+        for k in range(len(self.deltas)):
+            delta = self.deltas[k] - row[k] * delta_j
+            self.deltas[k] = delta if abs(delta) >= EPS else 0
+
+
+    def _checking_all_deltas(self, obj, number_of_columns=None):
+        """
+        Проверяет оптимальность решения с помощью дельт (первых number_of_columns столбцов).
+        """
+        for delta in islice(self.deltas, number_of_columns):
+            if ((delta > 0) and (obj == "min")) or ((delta < 0) and (obj == "max")):
+                return False
+        return True
+
+
+    def _calculate_simplex_relations_of_q(self, j):
+        """
+        Рассчитывает симплекс-отношения Q.
+        Элементы столбца, не превышающие EPS по модулю, считаются нулевыми (это погрешность вычислений).
+        Для отрицательного элемента отношение есть, только если у базисной переменной строки конечная
+        верхняя граница u: Q = (u - b) / (-a) - шаг, на котором переменная дойдёт до этой границы.
+        """
+        q = []
+        upper = self._upper
+        for i in range(len(self.st)):
+            a = self.st[i][j]
+            if a > EPS:
+                q.append(self.st[i][-1] / a)
+            elif a < -EPS and upper is not None and self.basis_indexes[i] is not None \
+                    and upper[self.basis_indexes[i]] != float("inf"):
+                q.append((upper[self.basis_indexes[i]] - self.st[i][-1]) / -a)
+            else:
+                q.append(None)
+        return q
+
+
+    def _round_result(self, result, precision):
+        """
+        Округляет ответ до заданной точности.
+        """
+        if isinstance(result, list):
+            return [self._round_result(x, precision) for x in result]
+        elif isinstance(result, float):
+            return round(result, precision)
+        else:
+            return result
+
+
+    def _postsolve(self, answer, precision):
+        """
+        Переводит ответ упрощённой ЗЛП к переменным исходной ЗЛП:
+        возвращает на свои места удалённые при предварительной обработке переменные
+        и добавляет к целевой функции вклад зафиксированных переменных.
+        """
+        if answer is None or self.presolve_info is None:
+            return answer
+
+        x = [0 for _ in range(self.presolve_info["number_of_variables"])]
+        for j, value in self.presolve_info["fixed"]:
+            x[j] = value
+        for k, j in enumerate(self.presolve_info["columns"]):
+            x[j] = answer[0][k]
+
+        return self._round_result([x, answer[1] + self.presolve_info["offset"]], precision)
+
+
+    def _calculate_scaling(self, scaling):
+        """
+        Вычисляет множители строк и столбцов исходных переменных для масштабирования канонической ЗЛП.
+        """
+        if self.sparse:
+            matrix = self.canonical_constraint_matrix.tocoo()
+            rows, columns, values = matrix.row, matrix.col, np.abs(matrix.data)
+        else:
+            shape = (len(self.constraint_rhs), len(self.objective_coefficients))
+            matrix = np.abs(np.array(self.constraint_matrix, dtype=np.float64).reshape(shape))
+            rows, columns = np.nonzero(matrix)
+            values = matrix[rows, columns]
+        return _scaling_factors(rows, columns, values, matrix.shape, scaling)
+
+
+    def _has_bounds(self):
+        """
+        Проверяет, заданы ли у переменных границы, отличные от 0 <= x <= inf.
+        """
+        return any(lower != 0 for lower in self.lower_bounds) \
+            or any(upper != float("inf") for upper in self.upper_bounds)
+
+
+    def _working_upper_bounds(self):
+        """
+        Возвращает верхние границы исходных переменных после сдвига нижних границ в ноль
+        и масштабирования (u'_j = (u_j - l_j) / s_j).
+        """
+        upper = [u - l for u, l in zip(self.upper_bounds, self.lower_bounds)]
+        if self._column_scale is not None:
+            upper = [u / float(scale) for u, scale in zip(upper, self._column_scale)]
+        return upper
+
+
+    def _restore_answer(self, x, f):
+        """
+        Переводит значения исходных переменных x и целевой функции f из масштабированной ЗЛП
+        со сдвинутыми нижними границами к исходной ЗЛП (x_j = l_j + s_j * x'_j).
+        """
+        if self._column_scale is not None:
+            x = [value * float(scale) for value, scale in zip(x, self._column_scale)]
+        if any(lower != 0 for lower in self.lower_bounds):
+            x = [value + lower for value, lower in zip(x, self.lower_bounds)]
+            f += sum(c * lower for c, lower in zip(self.objective_coefficients, self.lower_bounds))
+        return [x, f]
+
+
+    # === ДВИЖОК NUMPY ===
+
+    def _get_solution_numpy(self, precision, pricing="dantzig", method="auto"):
+        """
+        Выдаёт решение ЗЛП, храня симплекс-таблицу в массиве NumPy.
+        Повторяет шаги метода `get_solution`, но заменяет циклы Python векторизованными операциями.
+        """
+        if np is None:
+            raise ImportError("Для движка \"numpy\" требуется установленный пакет numpy")
+        self._start_phase("setup")
+        self._build_table_numpy()
+
+        # Ищем допустимый базис двойственным симплекс-методом (если начальный базис двойственно допустим)
+        # или фазой I двухфазного метода, затем оптимизируем решение прямым симплекс-методом
+        return self._solve_table_numpy(precision, pricing, method)
+
+
+    def _build_table_numpy(self):
+        """
+        Строит симплекс-таблицу канонической ЗЛП в массиве NumPy (self.st, self.c, self.obj)
+        со сдвигом нижних границ и масштабированием. Конечные верхние границы в таблицу не добавляются:
+        они сохраняются в self._upper и учитываются в тесте отношений (см. `_find_row_with_min_q_numpy`).
+        """
+        # Коэффициенты целевой функции и цель задачи
+        self.c = np.array(self.canonical_problem_table[0][:-1], dtype=np.float64)
+        self.obj = self.canonical_problem_table[0][-1]
+
+        # Симплекс-таблица в виде непрерывного массива float64 (в рабочем буфере, общем для повторных решений):
+        # строки канонической таблицы копируются в него без промежуточных объектов
+        rows = self.canonical_problem_table[1:]
+        self.st = self._numpy_buffer("table", (len(rows), len(self.canonical_problem_table[0])))
+        for i, row in enumerate(rows):
+            self.st[i] = np.frombuffer(row, dtype=np.float64) if isinstance(row, array) else row
+
+        # Сдвигаем нижние границы переменных в ноль (x = l + x')
+        lower = np.array(self.lower_bounds, dtype=np.float64)
+        if lower.any():
+            self.st[:, -1] -= self.st[:, :len(lower)] @ lower
+
+        # Масштабируем столбцы исходных переменных и строки
+        # (столбцы дополнительных переменных делятся на множитель своей строки и не меняются)
+        if self._column_scale is not None:
+            n = len(self._column_scale)
+            self.c[:n] *= self._column_scale
+            self.st[:, :n] *= self._column_scale
+            self.st[:, :n] *= self._row_scale[:, None]
+            self.st[:, -1] *= self._row_scale
+
+        # Верхние границы столбцов (у дополнительных переменных их нет) и признаки дополнения x_j = u_j - x'_j
+        upper = np.array(self._working_upper_bounds(), dtype=np.float64)
+        if (upper != np.inf).any():
+            self._upper = np.concatenate([upper, np.full(len(self.c) - len(upper), np.inf)])
+            self._flipped = np.zeros(len(self.c), dtype=bool)
+        else:
+            self._upper = self._flipped = None
+
+
+    def _solve_table_numpy(self, precision, pricing="dantzig", method="auto"):
+        """
+        Решает ЗЛП по построенной симплекс-таблице NumPy, начиная с текущего базиса self.basis_indexes.
+        """
+        # Ищем допустимый базис двойственным симплекс-методом (если начальный базис двойственно допустим)
+        # или фазой I двухфазного метода
+        if self._use_dual_simplex_numpy(method):
+            self._start_phase("dual")
+            status = self._dual_simplex_numpy(self.basis_indexes.copy())
+        else:
+            self._start_phase("phase_one")
+            status = self._phase_one_numpy(pricing)
+        if status != "optimal":
+            self.status = status
+            return
+
+        # Фаза II: оптимизируем исходную целевую функцию прямым симплекс-методом
+        # (при сработавшем ограничении решения ответ формируется по текущему допустимому базису)
+        self._start_phase("phase_two")
+        status = self._primal_simplex_numpy(pricing)
+        if status == "unbounded":
+            self.status = "unbounded"
+            return
+
+        answer = self._answer_numpy(precision)
+        self.status = status
+        return answer
+
+
+    def _get_solution_interior(self, precision, pricing="dantzig", crossover=True):
+        """
+        Выдаёт решение ЗЛП прямо-двойственным методом внутренней точки (предиктор-корректор Мехротры)
+        по той же симплекс-таблице, что и движок "numpy" (см. `_interior_point`).
+        При crossover=True от найденной точки выполняется переход к базису: столбцы с наибольшими
+        значениями переменных вводятся в базис (`_crossover_numpy`), а решение доводится до оптимальной
+        вершины симплекс-методом. Если метод внутренней точки не сошёлся (ЗЛП недопустима или не ограничена),
+        ЗЛП решается симплекс-методом от начального базиса, который и определяет статус.
+        """
+        if np is None:
+            raise ImportError("Для движка \"interior\" требуется установленный пакет numpy")
+        self._start_phase("setup")
+        self._build_table_numpy()
+        self._append_bound_rows_numpy()
+        canonical_basis = self.basis_indexes.copy()
+
+        # Метод внутренней точки решает задачу min c * x, A * x = b, x >= 0
+        self._start_phase("interior")
+        c = self.c if self.obj == "min" else -self.c
+        status, x = self._interior_point(self.st[:, :-1], self.st[:, -1], c)
+        if status in LIMIT_STATUSES:
+            self.status = status
+            return
+
+        if status != "optimal":
+            self.basis_indexes = canonical_basis
+            return self._solve_table_numpy(precision, pricing, "primal")
+
+        if not crossover:
+            # Ответ - точка внутренней точки без базиса
+            self.basis_indexes = [None for _ in range(self.st.shape[0])]
+            answer = self._restore_answer(x[:len(self.objective_coefficients)].tolist(), float(self.c @ x))
+            self.status = "optimal"
+            return self._round_result(answer, precision)
+
+        self._start_phase("crossover")
+        self._crossover_numpy(x)
+        return self._solve_table_numpy(precision, pricing, "primal")
+
+
+    def _interior_point(self, a, b, c):
+        """
+        Прямо-двойственный метод внутренней точки для задачи min c * x при A * x = b, x >= 0.
+        На каждой итерации решаются нормальные уравнения (A * D * A^T) * dy = r с D = x / z дважды:
+        для шага-предиктора (аффинного направления) и для шага-корректора с центрированием sigma * mu.
+        Возвращает статус ("optimal", "not_converged" или статус сработавшего ограничения решения) и x.
+        """
+        m, n = a.shape
+        norm_b = 1 + np.linalg.norm(b)
+        norm_c = 1 + np.linalg.norm(c)
+
+        def factorize(d):
+            """
+            Факторизует матрицу нормальных уравнений A * diag(d) * A^T (с малой регуляризацией,
+            чтобы линейно зависимые строки не делали её вырожденной) и возвращает функцию решения.
+            """
+            normal = (a * d) @ a.T
+            normal[np.diag_indices(m)] += 1e-12 * normal.diagonal() + 1e-14
+            if sp is not None:
+                try:
+                    factor = cho_factor(normal)
+                    return lambda rhs: cho_solve(factor, rhs)
+                except np.linalg.LinAlgError:
+                    pass
+            return lambda rhs: np.linalg.lstsq(normal, rhs, rcond=None)[0]
+
+        def max_step(v, dv):
+            """
+            Наибольший шаг alpha <= 1, при котором v + alpha * dv >= 0.
+            """
+            negative = dv < 0
+            if not negative.any():
+                return 1.0
+            with np.errstate(over="ignore"):
+                return min(1.0, float(np.min(-v[negative] / dv[negative])))
+
+        # Начальная точка Мехротры: решение задачи наименьших квадратов, сдвинутое внутрь ортанта
+        solve = factorize(np.ones(n))
+        x = a.T @ solve(b)
+        y = solve(a @ c)
+        z = c - a.T @ y
+        x += max(-1.5 * x.min(initial=0), 0)
+        z += max(-1.5 * z.min(initial=0), 0)
+        xz = x @ z
+        x += 0.5 * xz / max(z.sum(), EPS) + EPS
+        z += 0.5 * xz / max(x.sum(), EPS) + EPS
+
+        stats = self._stats
+        for _ in range(INTERIOR_MAX_ITERATIONS):
+            if self._limits is not None:
+                limit = self._limit_status()
+                if limit is not None:
+                    return limit, x
+
+            # Невязки прямой и двойственной задач и мера дополняющей нежёсткости
+            rp = b - a @ x
+            rd = c - a.T @ y - z
+            mu = x @ z / n
+            primal_objective = c @ x
+            gap = abs(primal_objective - b @ y) / (1 + abs(primal_objective))
+            if np.linalg.norm(rp) / norm_b < INTERIOR_TOLERANCE and np.linalg.norm(rd) / norm_c < INTERIOR_TOLERANCE \
+                    and gap < INTERIOR_TOLERANCE:
+                return "optimal", x
+
+            # Неограниченный рост переменных, вырождение z или исчезнувшая дополняющая нежёсткость
+            # при ненулевых невязках означают, что ЗЛП недопустима или не ограничена
+            if not np.isfinite(mu) or not np.isfinite(y).all() or z.min() <= 0 or mu < EPS * EPS \
+                    or np.abs(x).max() > 1e15 * norm_b or np.abs(y).max() > 1e15 * norm_c:
+                return "not_converged", x
+
+            with np.errstate(divide="ignore", over="ignore"):
+                d = x / z
+            if not np.isfinite(d).all():
+                return "not_converged", x
+            solve = factorize(d)
+
+            def direction(rc):
+                """
+                Решает систему Ньютона A * dx = rp, A^T * dy + dz = rd, Z * dx + X * dz = rc.
+                """
+                dy = solve(rp + a @ (d * rd - rc / z))
+                dz = rd - a.T @ dy
+                dx = (rc - x * dz) / z
+                return dx, dy, dz
+
+            # Предиктор: аффинное направление и оценка параметра центрирования sigma
+            dx, dy, dz = direction(-x * z)
+            alpha_p, alpha_d = max_step(x, dx), max_step(z, dz)
+            mu_affine = (x + alpha_p * dx) @ (z + alpha_d * dz) / n
+            sigma = (mu_affine / mu) ** 3
+
+            # Корректор: учитываем нелинейный член dx * dz и центрирование
+            dx, dy, dz = direction(-x * z - dx * dz + sigma * mu)
+            alpha_p = INTERIOR_STEP_FACTOR * max_step(x, dx)
+            alpha_d = INTERIOR_STEP_FACTOR * max_step(z, dz)
+            x = x + alpha_p * dx
+            y = y + alpha_d * dy
+            z = z + alpha_d * dz
+
+            self.iterations += 1
+            if stats is not None:
+                stats.iterations["interior"] += 1
+                if stats.callback is not None:
+                    stats.callback({"phase": "interior", "iteration": self.iterations, "mu": float(mu),
+                                    "primal_residual": float(np.linalg.norm(rp)),
+                                    "dual_residual": float(np.linalg.norm(rd))})
+        return "not_converged", x
+
+
+    def _crossover_numpy(self, x):
+        """
+        Переход от точки метода внутренней точки к базису: столбцы в порядке убывания x_j вводятся
+        в базис в строках, ещё не занятых такими столбцами (по наибольшему по модулю элементу).
+        Если носитель x состоит из линейно независимых столбцов, полученное базисное решение совпадает с x;
+        иначе оставшиеся отрицательные b устраняются фазой I.
+        """
+        m = self.st.shape[0]
+        tolerance = 1e-6 * max(1.0, float(x.max(initial=0)))
+        occupied = np.zeros(m, dtype=bool)
+        for j in np.argsort(-x, kind="stable"):
+            if x[j] <= tolerance:
+                break
+            j = int(j)
+            if j in self.basis_indexes:
+                occupied[self.basis_indexes.index(j)] = True
+                continue
+
+            column = np.where(occupied, 0.0, np.abs(self.st[:, j]))
+            i = int(np.argmax(column))
+            if column[i] <= EPS * max(1.0, float(np.abs(self.st[:, j]).max())) * 1e3:
+                continue
+            leaving_j = self.basis_indexes[i]
+            self._pivot_numpy(i, j)
+            self.basis_indexes[i] = j
+            occupied[i] = True
+            self.iterations += 1
+            if self._stats is not None:
+                self._record_pivot(j, leaving_j, float(x[j]), self.st.size)
+
+
+    def _use_dual_simplex_numpy(self, method):
+        """
+        Проверяет, можно ли начать с двойственного симплекс-метода (аналог `_use_dual_simplex` для движка NumPy).
+        """
+        if method == "primal":
+            return False
+        if method == "auto" and (self.st[:, -1] >= 0).all():
+            return False
+
+        dual_feasible = None not in self.basis_indexes
+        if dual_feasible:
+            self._calculate_deltas_numpy()
+            dual_feasible = self._select_column_numpy(None, "dantzig", None) is None
+
+        if method == "dual" and not dual_feasible:
+            raise ValueError("Начальный базис не является двойственно допустимым")
+        return dual_feasible
+
+
+    def _phase_one_numpy(self, pricing="dantzig"):
+        """
+        Фаза I двухфазного метода (аналог `_phase_one` для движка NumPy).
+        Возвращает "optimal", "infeasible" (если допустимых решений нет) или статус сработавшего ограничения решения.
+        """
+        m = self.st.shape[0]
+        width = len(self.c)
+        tolerance = EPS * max(1.0, float(np.abs(self.st[:, -1]).max(initial=0)))
+
+        # Домножаем строки с отрицательным b на -1 (их дополнительные переменные перестают быть базисными)
+        negative = self.st[:, -1] < 0
+        np.negative(self.st, out=self.st, where=negative[:, None])
+        signs = np.where(negative, -1.0, 1.0)
+        for i in np.flatnonzero(negative):
+            self.basis_indexes[i] = None
+
+        # Добавляем искусственные переменные в строки без базисной переменной
+        artificial_rows = [i for i in range(m) if self.basis_indexes[i] is None]
+        if not artificial_rows:
+            return "optimal"
+        k = len(artificial_rows)
+        table = self.st
+        st = self._numpy_buffer("phase_one", (m, width + k + 1))
+        st[:, :width] = table[:, :-1]
+        st[:, width:-1] = 0
+        st[:, -1] = table[:, -1]
+        st[artificial_rows, width + np.arange(k)] = 1
+        self.st = st
+        for t, i in enumerate(artificial_rows):
+            self.basis_indexes[i] = width + t
+        identity = self.basis_indexes.copy()
+
+        # Минимизируем сумму искусственных переменных (вернувшись из базиса, они в него больше не входят)
+        c, obj, upper = self.c, self.obj, self._upper
+        flipped = None if upper is None else self._flipped.copy()
+        self.c = np.concatenate([np.zeros(width), np.ones(k)])
+        self.obj = "min"
+        if upper is not None:
+            self._upper = np.concatenate([upper, np.full(k, np.inf)])
+        status = self._primal_simplex_numpy(pricing, width)
+        if status in LIMIT_STATUSES:
+            self._restore_objective(c, obj, upper, flipped)
+            return status
+
+        in_basis = [i for i in range(m) if self.basis_indexes[i] >= width]
+        if self.st[in_basis, -1].sum() > tolerance:
+            # Двойственные оценки фазы I y = c_B * B^-1 дают сертификат недопустимости
+            y = self.c[self.basis_indexes] @ self.st[:, identity]
+            self._set_infeasibility_certificate(-signs * y)
+            self._restore_objective(c, obj, upper, flipped)
+            return "infeasible"
+
+        # Выводим из базиса оставшиеся (нулевые) искусственные переменные
+        for i in in_basis:
+            nonzero = np.flatnonzero(np.abs(self.st[i, :width]) > EPS)
+            if len(nonzero) == 0:
+                # Строка линейно зависима от остальных: обнуляем её и оставляем без базисной переменной
+                self.st[i] = 0
+                self.basis_indexes[i] = None
+                continue
+            leaving_j = self.basis_indexes[i]
+            self._pivot_numpy(i, int(nonzero[0]))
+            self.basis_indexes[i] = int(nonzero[0])
+            self.iterations += 1
+            if self._stats is not None:
+                self._record_pivot(int(nonzero[0]), leaving_j, 0, self.st.size)
+
+        # Удаляем столбцы искусственных переменных (переписывая таблицу обратно в исходный буфер)
+        # и возвращаем исходную целевую функцию
+        table[:, :-1] = self.st[:, :width]
+        table[:, -1] = self.st[:, -1]
+        self.st = table
+        self._restore_objective(c, obj, upper, flipped)
+        return "optimal"
+
+
+    def _primal_simplex_numpy(self, pricing="dantzig", number_of_columns=None):
+        """
+        Цикл оптимизации с помощью дельт, начиная с текущего допустимого базиса.
+        В базис могут входить только первые number_of_columns столбцов (по умолчанию - все).
+        Возвращает "optimal" или "unbounded" (если нет подходящих симплекс-отношений Q),
+        а также статус сработавшего ограничения решения (см. LIMIT_STATUSES).
+        """
+        # Рассчитываем дельты (дальше они пересчитываются по разрешающей строке после каждой итерации)
+        self._calculate_deltas_numpy()
+
+        # Веса столбцов для правил "devex" и "steepest_edge" и состояние частичного ценообразования
+        weights = np.ones(len(self.c))
+        pricing_state = {"segment": 0}
+
+        # Число вырожденных итераций подряд и базис, действовавший при включении защиты от зацикливания
+        degenerate_run = 0
+        anti_cycling_basis = None
+        stats = self._stats
+
+        # Цикл оптимизации с помощью дельт
+        while True:
+            if self._limits is not None:
+                limit = self._limit_status()
+                if limit is not None:
+                    return limit
+            if stats is not None:
+                stats.mark()
+            anti_cycling = self._anti_cycling is not None and degenerate_run >= ANTI_CYCLING_THRESHOLD
+            if anti_cycling and anti_cycling_basis is None:
+                anti_cycling_basis = [bi for bi in self.basis_indexes if bi is not None]
+            rule = "bland" if anti_cycling and self._anti_cycling == "bland" else pricing
+
+            if rule == "steepest_edge":
+                weights = 1 + np.einsum("ij,ij->j", self.st[:, :-1], self.st[:, :-1])
+
+            # Ищем разрешающий столбец
+            resolution_column_j = self._select_column_numpy(weights, rule, pricing_state, number_of_columns)
+            if resolution_column_j is None:
+                # Перед выходом сверяемся с дельтами, рассчитанными заново
+                self._calculate_deltas_numpy()
+                resolution_column_j = self._select_column_numpy(weights, rule, pricing_state, number_of_columns)
+                if resolution_column_j is None:
+                    return "optimal"
+            if stats is not None:
+                stats.lap("pricing")
+
+            # Ищем разрешающую строку по минимальному симплекс-отношению Q
+            # (при защите от зацикливания - с правилом выбора среди строк с минимальным Q)
+            row_with_min_q_i, q_min = self._find_row_with_min_q_numpy(
+                resolution_column_j, self._anti_cycling if anti_cycling else None, anti_cycling_basis)
+
+            # Входящая переменная может дойти до своей верхней границы раньше, чем базисные - до своих
+            bound = np.inf if self._upper is None else self._upper[resolution_column_j]
+
+            # Если нет подходящих Q и верхней границы, значит решения не существует
+            if row_with_min_q_i is None and bound == np.inf:
+                return "unbounded"
+
+            step = min(q_min, bound)
+            if step <= EPS:
+                degenerate_run += 1
+            else:
+                degenerate_run = 0
+                anti_cycling_basis = None
+            if stats is not None:
+                stats.lap("ratio_test")
+
+            # Входящая переменная дошла до верхней границы: переводим её на эту границу без смены базиса
+            if bound <= q_min:
+                self._flip_column_numpy(resolution_column_j)
+                self.iterations += 1
+                if stats is not None:
+                    stats.lap("pivoting")
+                    self._record_pivot(resolution_column_j, resolution_column_j, float(step), self.st.size)
+                continue
+
+            # Базисная переменная дошла до верхней границы: заменяем её на u - x, и она выходит из базиса на нуле
+            if self.st[row_with_min_q_i, resolution_column_j] < 0:
+                self._complement_basic_variable_numpy(row_with_min_q_i)
+
+            # Выполняем преобразование таблицы, обновляем веса, дельты и базис
+            pivot_element = self.st[row_with_min_q_i, resolution_column_j]
+            leaving_j = self.basis_indexes[row_with_min_q_i]
+            self._pivot_numpy(row_with_min_q_i, resolution_column_j)
+            if pricing == "devex":
+                self._update_devex_weights_numpy(weights, row_with_min_q_i, resolution_column_j, leaving_j, pivot_element)
+            self._update_deltas_numpy(row_with_min_q_i, resolution_column_j)
+            self.basis_indexes[row_with_min_q_i] = resolution_column_j
+            self.iterations += 1
+            if stats is not None:
+                stats.lap("pivoting")
+                self._record_pivot(resolution_column_j, leaving_j, float(step), self.st.size)
+
+
+    def _dual_simplex_numpy(self, identity=None):
+        """
+        Двойственный симплекс-метод: начиная с базиса с оптимальными дельтами,
+        избавляется от отрицательных свободных коэффициентов b, сохраняя оптимальность дельт.
+        Возвращает "optimal" или "infeasible" (если в строке с отрицательным b нет отрицательных элементов),
+        а также статус сработавшего ограничения решения.
+        identity - столбцы, образующие единичную матрицу в исходной таблице (если заданы,
+        при недопустимости соответствующая строка B^-1 сохраняется как сертификат недопустимости).
+        """
+        while True:
+            if self._limits is not None:
+                limit = self._limit_status()
+                if limit is not None:
+                    return limit
+
+            # Базисные переменные выше своих верхних границ заменяем на u - x: их b становятся отрицательными
+            if self._upper is not None:
+                for r in np.flatnonzero(self.st[:, -1] > self._basic_upper_bounds_numpy() + EPS):
+                    self._complement_basic_variable_numpy(int(r))
+
+            # Разрешающая строка - строка с минимальным отрицательным b
+            i = int(np.argmin(self.st[:, -1]))
+            if self.st[i, -1] >= -EPS:
+                return "optimal"
+
+            row = self.st[i, :-1]
+            negative = row < -EPS
+            if not negative.any():
+                if identity is not None:
+                    self._set_infeasibility_certificate(self.st[i, identity])
+                return "infeasible"
+
+            # Разрешающий столбец - с минимальным отношением дельты к элементу строки
+            # (при таком выборе дельты сохраняют оптимальный знак)
+            reduced = np.maximum(self.deltas if self.obj == "max" else -self.deltas, 0)
+            ratios = np.full(len(row), np.inf)
+            np.divide(reduced, -row, out=ratios, where=negative)
+            j = int(np.argmin(ratios))
+
+            leaving_j = self.basis_indexes[i]
+            self._pivot_numpy(i, j)
+            self._update_deltas_numpy(i, j)
+            self.basis_indexes[i] = j
+            self.iterations += 1
+            if self._stats is not None:
+                self._record_pivot(j, leaving_j, float(ratios[j]), self.st.size)
+
+
+    def _answer_numpy(self, precision):
+        """
+        Формирует ответ по текущей симплекс-таблице.
+        """
+        # Находим значения переменных x_1, x_2, x_3, ...
+        # (в линейно зависимых строках базисной переменной нет)
+        x = np.zeros(len(self.c))
+        rows = [i for i, bi in enumerate(self.basis_indexes) if bi is not None]
+        x[[self.basis_indexes[i] for i in rows]] = self.st[rows, -1]
+
+        # Дополненные переменные (x_j = u_j - x'_j) возвращаем к исходным,
+        # а их коэффициентам целевой функции - исходный знак
+        c = self.c
+        if self._flipped is not None:
+            x[self._flipped] = self._upper[self._flipped] - x[self._flipped]
+            c = np.where(self._flipped, -c, c)
+
+        # Формируем ответ в виде: [[<Значения x_1, x_2, x_3, ...>], <Значение целевой функции F>]
+        answer = self._restore_answer(x[:len(self.objective_coefficients)].tolist(), float(c @ x))
+
+        self.status = "optimal"
+        return self._round_result(answer, precision)
+
+
+    def _append_bound_rows_numpy(self):
+        """
+        Добавляет в симплекс-таблицу строки x'_j + s = u'_j для конечных верхних границ
+        с новыми базисными переменными s (метод внутренней точки учитывает только условия x >= 0).
+        """
+        if self._upper is None:
+            return
+        upper = self._upper
+        bounded = np.flatnonzero(upper != np.inf)
+        self._upper = self._flipped = None
+
+        m, width = self.st.shape
+        k = len(bounded)
+        st = self._numpy_buffer("bounded", (m + k, width + k))
+        st[:m, :width - 1] = self.st[:, :-1]
+        st[:m, width - 1:-1] = 0
+        st[:m, -1] = self.st[:, -1]
+        st[m:] = 0
+        st[m + np.arange(k), bounded] = 1
+        st[m + np.arange(k), width - 1 + np.arange(k)] = 1
+        st[m:, -1] = upper[bounded]
+
+        self.st = st
+        self.c = np.concatenate([self.c, np.zeros(k)])
+        self.basis_indexes += [width - 1 + i for i in range(k)]
+
+
+    def _pivot_numpy(self, i, j):
+        """
+        Приводит элемент (i, j) к единице, а остальные элементы столбца j - к нулю.
+        Исключение выполняется одним обновлением ранга 1 на месте (BLAS dger, если доступен SciPy),
+        без временной матрицы размером с таблицу.
+        """
+        st = self.st
+        st[i] /= st[i, j]
+        column = self._numpy_buffer("column", (st.shape[0],))
+        column[:] = st[:, j]
+        column[i] = 0
+        if blas is not None and st.flags.c_contiguous:
+            # Транспонированная C-таблица - это Fortran-массив, который dger изменяет на месте
+            blas.dger(-1.0, st[i], column, a=st.T, overwrite_a=True)
+        else:
+            st -= np.outer(column, st[i])
+
+
+    def _flip_column_numpy(self, j):
+        """
+        Переводит небазисную переменную столбца j на противоположную границу (аналог `_flip_column`).
+        """
+        column = self.st[:, j]
+        self.st[:, -1] -= column * self._upper[j]
+        column *= -1
+        self.c[j] = -self.c[j]
+        self.deltas[j] = -self.deltas[j]
+        self._flipped[j] = not self._flipped[j]
+
+
+    def _complement_basic_variable_numpy(self, i):
+        """
+        Заменяет базисную переменную строки i на u - x (аналог `_complement_basic_variable`).
+        """
+        j = self.basis_indexes[i]
+        self.st[i] *= -1
+        self.st[i, j] = 1
+        self.st[i, -1] += self._upper[j]
+        self.c[j] = -self.c[j]
+        self._flipped[j] = not self._flipped[j]
+
+
+    def _basic_upper_bounds_numpy(self):
+        """
+        Возвращает верхние границы базисных переменных строк таблицы (inf для строк без базисной переменной).
+        """
+        return np.array([np.inf if bi is None else self._upper[bi] for bi in self.basis_indexes])
+
+
+    def _numpy_buffer(self, name, shape):
+        """
+        Возвращает рабочий массив float64 заданной формы из буфера экземпляра с именем name.
+        Буфер только растёт и сохраняется между решениями, поэтому повторное решение ЗЛП того же размера
+        не выделяет память под таблицу. Содержимое массива не инициализируется.
+        """
+        size = int(np.prod(shape))
+        buffer = self._numpy_buffers.get(name)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=np.float64)
+            self._numpy_buffers[name] = buffer
+        return buffer[:size].reshape(shape)
+
+
+    def _calculate_deltas_numpy(self):
+        """
+        Рассчитывает дельты для симплекс-таблицы одним матричным произведением.
+        Строки без базисной переменной (линейно зависимые) входят с нулевым коэффициентом,
+        значения, отличающиеся от нуля меньше чем на EPS, считаются нулевыми.
+        """
+        coeffs = np.array([0.0 if bi is None else self.c[bi] for bi in self.basis_indexes])
+        self.deltas = coeffs @ self.st[:, :-1] - self.c
+        self.deltas[np.abs(self.deltas) < EPS] = 0
+
+
+    def _update_deltas_numpy(self, i, j):
+        """
+        Пересчитывает дельты по разрешающей строке i после преобразования таблицы
+        (вместо полного пересчёта за O(m * n)).
+        Значения, отличающиеся от нуля меньше чем на EPS, считаются нулевыми (это погрешность вычитания).
+        """
+        self.deltas -= self.deltas[j] * self.st[i, :-1]
+        self.deltas[np.abs(self.deltas) < EPS] = 0
+
+
+    def _select_column_numpy(self, weights, pricing, pricing_state, number_of_columns=None):
+        """
+        Выбирает разрешающий столбец (среди первых number_of_columns) по правилу ценообразования.
+        При "max" улучшают решение столбцы с отрицательной дельтой, при "min" - с положительной.
+        """
+        scores = (-self.deltas if self.obj == "max" else self.deltas)[:number_of_columns]
+        if weights is not None:
+            weights = weights[:number_of_columns]
+        return _select_entering_column(scores, weights, pricing, pricing_state)
+
+
+    def _update_devex_weights_numpy(self, weights, i, j, leaving_j, pivot_element):
+        """
+        Обновляет веса devex после преобразования таблицы с разрешающим элементом (i, j).
+        Строка i к этому моменту уже разделена на разрешающий элемент.
+        """
+        weight_j = weights[j]
+        np.maximum(weights, self.st[i, :-1] ** 2 * weight_j, out=weights)
+        weights[leaving_j] = max(weight_j / pivot_element ** 2, 1.0)
+
+
+    def _find_row_with_min_q_numpy(self, j, anti_cycling=None, anti_cycling_basis=None):
+        """
+        Находит строку с минимальным симплекс-отношением Q для столбца j (по элементам больше EPS,
+        а при конечных верхних границах базисных переменных - и по элементам меньше -EPS, см.
+        `_calculate_simplex_relations_of_q`). При защите от зацикливания (anti_cycling - правило из
+        ANTI_CYCLING_RULES) среди строк с минимальным Q выбирается базисная переменная с наименьшим индексом
+        или лексикографически наименьшая строка в столбцах anti_cycling_basis.
+        Возвращает строку и её Q или (None, inf), если подходящих Q нет.
+        """
+        column = self.st[:, j]
+        positive = column > EPS
+        q = np.full(len(column), np.inf)
+        np.divide(self.st[:, -1], column, out=q, where=positive)
+        if self._upper is not None:
+            negative = column < -EPS
+            np.divide(self._basic_upper_bounds_numpy() - self.st[:, -1], -column, out=q, where=negative)
+        i = int(np.argmin(q))
+        if q[i] == np.inf:
+            return None, np.inf
+        if anti_cycling is None:
+            return i, float(q[i])
+
+        tied = np.flatnonzero(q <= q[i] + EPS)
+        if anti_cycling == "bland":
+            i = int(tied[np.argmin([self.basis_indexes[t] for t in tied])])
+        else:
+            vectors = self.st[tied][:, anti_cycling_basis] / column[tied, None]
+            i = int(tied[_lexicographic_min(vectors)])
+        return i, float(q[i])
+
+
+    # === ДВИЖОК REVISED (МОДИФИЦИРОВАННЫЙ СИМПЛЕКС-МЕТОД) ===
+
+    def _get_solution_revised(self, precision, pricing="dantzig", refactor_frequency=50, method="auto"):
+        """
+        Выдаёт решение ЗЛП модифицированным симплекс-методом.
+        Вместо полной симплекс-таблицы хранит исходную матрицу ограничений и факторизацию базиса,
+        поэтому работа на итерации зависит от размера базиса, а не от m * (n + m).
+        Допустимый базис ищется двухфазным методом с искусственными переменными.
+        Верхние границы переменных учитываются в тесте отношений без дополнительных строк:
+        небазисная переменная может находиться как на нижней, так и на верхней границе.
+        """
+        if np is None:
+            raise ImportError("Для движка \"revised\" требуется установленный пакет numpy")
+        self._start_phase("setup")
+
+        # Матрица ограничений без дополнительных переменных
+        # (строки с ">=" домножаются на -1, как и в каноническом виде)
+        if self.sparse:
+            a = self.canonical_constraint_matrix
+            b = self.canonical_rhs.copy()
+        else:
+            signs = np.array([-1.0 if s == ">=" else 1.0 for s in self.constraint_senses])
+            a = np.array(self.constraint_matrix, dtype=np.float64).reshape(len(signs), -1) * signs[:, None]
+            b = np.array(self.constraint_rhs, dtype=np.float64) * signs
+
+        # Сдвигаем нижние границы переменных в ноль (x = l + x')
+        b = b - a @ np.array(self.lower_bounds, dtype=np.float64)
+
+        # Масштабируем строки и столбцы исходных переменных
+        # (дополнительные переменные учитываются неявно, их столбцы остаются единичными)
+        if self._column_scale is not None:
+            if self.sparse:
+                a = sp.diags(self._row_scale) @ a @ sp.diags(self._column_scale)
+                a = a.tocsc()
+            else:
+                a = a * self._row_scale[:, None] * self._column_scale
+            b = b * self._row_scale
+        m, n = a.shape
+
+        # Строки, в которых стоят дополнительные переменные (их столбцы - единичные векторы)
+        slack_rows = [i for i in range(m) if self.constraint_senses[i] != "="]
+        number_of_columns = n + len(slack_rows)
+
+        # Коэффициенты целевой функции (задача всегда решается на минимум)
+        c = np.zeros(number_of_columns)
+        c[:len(self.objective_coefficients)] = self.objective_coefficients
+        if self._column_scale is not None:
+            c[:n] *= self._column_scale
+        cost = c if self.objective_sense == "min" else -c
+
+        # Верхние границы всех переменных (у дополнительных и искусственных переменных их нет)
+        upper = np.full(number_of_columns + m, np.inf)
+        upper[:n] = self._working_upper_bounds()
+
+        # Параметры задачи, с которыми работают вспомогательные методы:
+        # at_upper - признаки небазисных переменных на верхней границе,
+        # rhs - правая часть с учётом этих переменных (b - сумма a_j * u_j)
+        self._revised = {
+            "a": a, "b": b, "m": m, "n": n,
+            "slack_rows": np.array(slack_rows, dtype=np.int64), "number_of_columns": number_of_columns,
+            "artificial_signs": np.where(b < 0, -1.0, 1.0),
+            "upper": upper, "at_upper": np.zeros(number_of_columns + m, dtype=bool), "rhs": b.copy(),
+        }
+
+        # Начальный базис: дополнительные переменные для строк с неотрицательным b,
+        # искусственные переменные (индексы number_of_columns + i) для остальных строк
+        basis = [number_of_columns + i for i in range(m)]
+        for k, i in enumerate(slack_rows):
+            if b[i] >= 0:
+                basis[i] = n + k
+
+        factorization = _BasisFactorization(refactor_frequency)
+
+        # Двойственный симплекс-метод начинается с базиса из дополнительных переменных
+        # (переменные с отрицательной оценкой начинают с верхней границы)
+        if self._use_dual_simplex_revised(method, basis, cost):
+            self._start_phase("dual")
+            basis[:] = [n + k for k in range(m)]
+            x_b = self._refactor_revised(factorization, basis)
+            status, x_b = self._revised_dual_simplex_loop(factorization, basis, x_b, cost)
+            if status != "optimal":
+                self.status = status
+                return
+        else:
+            x_b = self._refactor_revised(factorization, basis)
+
+        # Фаза I: минимизируем сумму искусственных переменных
+        if any(bi >= number_of_columns for bi in basis):
+            self._start_phase("phase_one")
+            phase_one_cost = np.zeros(number_of_columns + m)
+            phase_one_cost[number_of_columns:] = 1
+            status, x_b = self._revised_simplex_loop(factorization, basis, x_b, phase_one_cost, False, pricing)
+            if status in LIMIT_STATUSES:
+                self.status = status
+                return
+            if x_b @ phase_one_cost[basis] > EPS * max(1.0, np.abs(b).max()):
+                # Система ограничений несовместна: двойственные оценки фазы I дают сертификат недопустимости
+                self._set_infeasibility_certificate(-factorization.btran(phase_one_cost[basis]))
+                self.status = "infeasible"
+                return
+            x_b = self._drive_out_artificials_revised(factorization, basis, x_b)
+
+        # Фаза II: оптимизируем исходную целевую функцию
+        # (при сработавшем ограничении решения ответ формируется по текущему допустимому базису)
+        self._start_phase("phase_two")
+        phase_two_cost = np.concatenate([cost, np.zeros(m)])
+        status, x_b = self._revised_simplex_loop(factorization, basis, x_b, phase_two_cost, True, pricing)
+        if status == "unbounded":
+            self.status = "unbounded"
+            return
+
+        # Находим значения переменных (небазисные - на нижней или верхней границе)
+        x = np.zeros(number_of_columns)
+        at_upper = self._revised["at_upper"][:number_of_columns]
+        x[at_upper] = upper[:number_of_columns][at_upper]
+        for i, bi in enumerate(basis):
+            if bi < number_of_columns:
+                x[bi] = x_b[i]
+
+        # Сохраняем итоговый базис (None - строка с оставшейся нулевой искусственной переменной)
+        self.basis_indexes = [bi if bi < number_of_columns else None for bi in basis]
+        self.c = c
+
+        answer = self._restore_answer(x[:len(self.objective_coefficients)].tolist(), float(c @ x))
+        self.status = status
+        return self._round_result(answer, precision)
+
+
+    def _use_dual_simplex_revised(self, method, basis, cost):
+        """
+        Проверяет, можно ли начать с двойственного симплекс-метода (аналог `_use_dual_simplex`
+        для движка "revised"). Базис из дополнительных переменных двойственно допустим, если
+        у всех исходных переменных оценка c_j неотрицательна или есть конечная верхняя граница
+        (тогда переменная начинает с неё). При положительном ответе переносит такие переменные
+        на верхнюю границу.
+        """
+        r = self._revised
+        n = r["n"]
+        if method == "primal":
+            return False
+        if method == "auto" and all(bi < r["number_of_columns"] for bi in basis):
+            return False
+
+        negative = cost[:n] < -EPS
+        dual_feasible = len(r["slack_rows"]) == r["m"] and not (negative & (r["upper"][:n] == np.inf)).any()
+        if method == "dual" and not dual_feasible:
+            raise ValueError("Начальный базис не является двойственно допустимым")
+
+        if dual_feasible:
+            for j in np.flatnonzero(negative):
+                r["at_upper"][j] = True
+                r["rhs"] -= r["upper"][j] * self._column_revised(j)
+        return dual_feasible
+
+
+    def _revised_dual_simplex_loop(self, factorization, basis, x_b, cost):
+        """
+        Двойственный симплекс-метод в модифицированной форме с верхними границами (минимизация cost).
+        Начиная с двойственно допустимого базиса, выводит из базиса переменные, нарушающие свои границы.
+        Возвращает статус ("optimal", "infeasible" или статус сработавшего ограничения решения)
+        и значения базисных переменных;
+        при недопустимости строка B^-1 выходящей переменной сохраняется как сертификат недопустимости.
+        """
+        r = self._revised
+        upper = r["upper"]
+        at_upper = r["at_upper"]
+        number_of_columns = r["number_of_columns"]
+
+        while True:
+            if self._limits is not None:
+                limit = self._limit_status()
+                if limit is not None:
+                    return limit, x_b
+
+            # Выходящая переменная - базисная с наибольшим нарушением границ
+            below = -x_b
+            above = x_b - upper[basis]
+            i = int(np.argmax(np.maximum(below, above)))
+            if max(below[i], above[i]) <= EPS:
+                return "optimal", x_b
+            to_upper = above[i] > below[i]
+
+            # Строка i матрицы B^-1 * A и относительные оценки небазисных переменных
+            e = np.zeros(len(basis))
+            e[i] = 1
+            rho = factorization.btran(e)
+            alpha = self._row_revised(rho, 0, number_of_columns)
+            d = self._reduced_costs_revised(basis, cost, factorization.btran(cost[basis]), False, 0, number_of_columns)
+
+            # Входящая переменная должна вернуть выходящую к нарушенной границе:
+            # с нижней границы она увеличивается, с верхней - уменьшается
+            direction = np.where(at_upper[:number_of_columns], -1.0, 1.0)
+            step = alpha * direction if to_upper else -alpha * direction
+            candidates = (step > EPS) & (d != np.inf)
+            if not candidates.any():
+                self._set_infeasibility_certificate(-rho if to_upper else rho)
+                return "infeasible", x_b
+
+            # Двойственный тест отношений сохраняет знаки оценок
+            ratios = np.full(number_of_columns, np.inf)
+            np.divide(np.abs(d), np.abs(alpha), out=ratios, where=candidates)
+            q = int(np.argmin(ratios))
+
+            # Выходящая переменная остаётся на нарушенной границе, входящая покидает свою
+            leaving_j = basis[i]
+            if to_upper:
+                at_upper[leaving_j] = True
+                r["rhs"] -= upper[leaving_j] * self._column_revised(leaving_j)
+            a_q = self._column_revised(q)
+            if at_upper[q]:
+                at_upper[q] = False
+                r["rhs"] += upper[q] * a_q
+
+            # Обновляем базис, факторизацию и значения базисных переменных
+            basis[i] = q
+            factorization.update(i, factorization.ftran(a_q))
+            self.iterations += 1
+            if self._stats is not None:
+                self._record_pivot(q, leaving_j, float(ratios[q]), factorization.size())
+            if factorization.needs_refactor():
+                x_b = self._refactor_revised(factorization, basis)
+            else:
+                x_b = factorization.ftran(r["rhs"])
+
+
+    def _column_revised(self, j):
+        """
+        Возвращает столбец j расширенной матрицы ограничений
+        (исходные, дополнительные и искусственные переменные).
+        """
+        r = self._revised
+        if j < r["n"]:
+            if not self.sparse:
+                return r["a"][:, j].copy()
+            a = r["a"]
+            column = np.zeros(r["m"])
+            column[a.indices[a.indptr[j]:a.indptr[j + 1]]] = a.data[a.indptr[j]:a.indptr[j + 1]]
+            return column
+        column = np.zeros(r["m"])
+        if j < r["number_of_columns"]:
+            column[r["slack_rows"][j - r["n"]]] = 1
+        else:
+            i = j - r["number_of_columns"]
+            column[i] = r["artificial_signs"][i]
+        return column
+
+
+    def _refactor_revised(self, factorization, basis):
+        """
+        Строит факторизацию базиса заново и возвращает значения базисных переменных.
+        """
+        if self.sparse:
+            basis_matrix = self._sparse_basis_matrix_revised(basis)
+        else:
+            basis_matrix = np.column_stack([self._column_revised(j) for j in basis])
+        factorization.refactor(basis_matrix)
+        return factorization.ftran(self._revised["rhs"])
+
+
+    def _sparse_basis_matrix_revised(self, basis):
+        """
+        Собирает разреженную базисную матрицу в формате CSC.
+        """
+        r = self._revised
+        a = r["a"]
+        data = []
+        indices = []
+        indptr = [0]
+        for j in basis:
+            if j < r["n"]:
+                indices.extend(a.indices[a.indptr[j]:a.indptr[j + 1]])
+                data.extend(a.data[a.indptr[j]:a.indptr[j + 1]])
+            elif j < r["number_of_columns"]:
+                indices.append(r["slack_rows"][j - r["n"]])
+                data.append(1.0)
+            else:
+                i = j - r["number_of_columns"]
+                indices.append(i)
+                data.append(r["artificial_signs"][i])
+            indptr.append(len(indices))
+        return sp.csc_matrix((data, indices, indptr), shape=(r["m"], r["m"]))
+
+
+    def _row_revised(self, v, lo=0, hi=None):
+        """
+        Возвращает произведения v^T * a_j для столбцов j из диапазона [lo, hi) расширенной матрицы
+        (исходные, дополнительные и искусственные переменные).
+        """
+        r = self._revised
+        n = r["n"]
+        k = r["number_of_columns"]
+        hi = k + r["m"] if hi is None else min(hi, k + r["m"])
+        parts = []
+        if lo < n:
+            a = r["a"] if lo == 0 and hi >= n else r["a"][:, lo:min(hi, n)]
+            parts.append(a.T @ v)
+        if lo < k and hi > n:
+            parts.append(v[r["slack_rows"][max(lo, n) - n:min(hi, k) - n]])
+        if hi > k:
+            i0 = max(lo, k) - k
+            parts.append(v[i0:hi - k] * r["artificial_signs"][i0:hi - k])
+        return np.concatenate(parts)
+
+
+    def _reduced_costs_revised(self, basis, cost, y, allow_artificial, lo=0, hi=None):
+        """
+        Рассчитывает относительные оценки d_j = c_j - y^T * a_j для столбцов из диапазона [lo, hi).
+        Столбцы базисных (и, в фазе II, искусственных) переменных получают оценку +inf.
+        """
+        r = self._revised
+        hi = len(cost) if hi is None else min(hi, len(cost))
+        d = cost[lo:hi] - self._row_revised(y, lo, hi)
+        basis_array = np.asarray(basis)
+        d[basis_array[(basis_array >= lo) & (basis_array < hi)] - lo] = np.inf
+        if not allow_artificial and hi > r["number_of_columns"]:
+            d[max(r["number_of_columns"], lo) - lo:] = np.inf
+        return d
+
+
+    def _partial_pricing_revised(self, basis, cost, y, allow_artificial, pricing_state):
+        """
+        Частичное ценообразование: оценки рассчитываются по сегментам,
+        пока не найдётся сегмент с подходящим столбцом
+        (с отрицательной оценкой на нижней границе или с положительной - на верхней).
+        """
+        size = -(-len(cost) // PARTIAL_PRICING_SEGMENTS)
+        number_of_segments = -(-len(cost) // size)
+        for k in range(number_of_segments):
+            segment = (pricing_state["segment"] + k) % number_of_segments
+            lo = segment * size
+            d = self._reduced_costs_revised(basis, cost, y, allow_artificial, lo, lo + size)
+            scores = np.where(self._revised["at_upper"][lo:lo + len(d)], d, -d)
+            j = int(np.argmax(scores))
+            if scores[j] > EPS:
+                pricing_state["segment"] = (segment + 1) % number_of_segments
+                return lo + j
+        return None
+
+
+    def _initial_weights_revised(self, pricing, number_of_columns):
+        """
+        Возвращает начальные веса столбцов для правил "devex" и "steepest_edge".
+        Для наискорейшего ребра веса 1 + ||a_j||^2 точны при базисе из дополнительных
+        и искусственных переменных.
+        """
+        weights = np.ones(number_of_columns)
+        if pricing == "steepest_edge":
+            r = self._revised
+            a = r["a"]
+            norms = a.multiply(a).sum(axis=0) if self.sparse else (a * a).sum(axis=0)
+            weights[:r["n"]] += np.asarray(norms).ravel()
+            weights[r["n"]:] += 1
+        return weights
+
+
+    def _revised_simplex_loop(self, factorization, basis, x_b, cost, phase_two, pricing="dantzig"):
+        """
+        Основной цикл модифицированного симплекс-метода с верхними границами переменных (минимизация cost).
+        Возвращает статус ("optimal", "unbounded" или статус сработавшего ограничения решения)
+        и значения базисных переменных.
+        """
+        weights = self._initial_weights_revised(pricing, len(cost))
+        pricing_state = {"segment": 0}
+        upper = self._revised["upper"]
+        at_upper = self._revised["at_upper"]
+
+        # Число вырожденных итераций подряд и базис, действовавший при включении защиты от зацикливания
+        degenerate_run = 0
+        anti_cycling_basis = None
+        stats = self._stats
+
+        while True:
+            if self._limits is not None:
+                limit = self._limit_status()
+                if limit is not None:
+                    return limit, x_b
+            if stats is not None:
+                stats.mark()
+            anti_cycling = self._anti_cycling is not None and degenerate_run >= ANTI_CYCLING_THRESHOLD
+            if anti_cycling and anti_cycling_basis is None:
+                anti_cycling_basis = list(basis)
+            rule = "bland" if anti_cycling and self._anti_cycling == "bland" else pricing
+
+            # Ищем входящую переменную среди столбцов с отрицательной оценкой на нижней границе
+            # и с положительной оценкой на верхней границе
+            y = factorization.btran(cost[basis])
+            if rule == "partial":
+                q = self._partial_pricing_revised(basis, cost, y, not phase_two, pricing_state)
+            else:
+                d = self._reduced_costs_revised(basis, cost, y, not phase_two)
+                scores = np.where(at_upper, d, -d)
+                q = _select_entering_column(np.where(scores > EPS, scores, 0.0), weights, rule, pricing_state)
+            if q is None:
+                return "optimal", x_b
+            if stats is not None:
+                stats.lap("pricing")
+
+            # Приводим столбец входящей переменной к текущему базису;
+            # delta - изменение базисных переменных на единицу шага (переменная с верхней границы уменьшается)
+            a_q = self._column_revised(q)
+            column = factorization.ftran(a_q)
+            direction = -1.0 if at_upper[q] else 1.0
+            delta = direction * column
+
+            # Тест отношений: базисные переменные уменьшаются до нуля или увеличиваются до верхней границы
+            upper_b = upper[basis]
+            ratios = np.full(len(column), np.inf)
+            to_lower = delta > EPS
+            to_upper = (delta < -EPS) & (upper_b != np.inf)
+            np.divide(x_b, delta, out=ratios, where=to_lower)
+            np.divide(upper_b - x_b, -delta, out=ratios, where=to_upper)
+            r = int(np.argmin(ratios))
+
+            # Входящая переменная может раньше дойти до своей противоположной границы
+            if upper[q] <= ratios[r]:
+                if upper[q] == np.inf:
+                    return "unbounded", x_b
+                x_b -= upper[q] * delta
+                self._revised["rhs"] -= direction * upper[q] * a_q
+                at_upper[q] = not at_upper[q]
+                self.iterations += 1
+                degenerate_run = degenerate_run + 1 if upper[q] <= EPS else 0
+                if stats is not None:
+                    stats.lap("ratio_test")
+                    self._record_pivot(q, q, float(upper[q]), factorization.size())
+                continue
+
+            # При защите от зацикливания выбираем среди строк с минимальным отношением
+            # базисную переменную с наименьшим индексом (правило Бланда)
+            # или строку с лексикографически наименьшим отношением к разрешающему столбцу
+            # (строки B^-1 * B_0 в столбцах базиса B_0, действовавшего при включении защиты)
+            if anti_cycling:
+                tied = np.flatnonzero(ratios <= ratios[r] + EPS)
+                if self._anti_cycling == "bland":
+                    r = int(tied[np.argmin(np.asarray(basis)[tied])])
+                else:
+                    vectors = []
+                    for t in tied:
+                        e = np.zeros(len(basis))
+                        e[t] = 1
+                        vectors.append(self._row_revised(factorization.btran(e))[anti_cycling_basis] / delta[t])
+                    r = int(tied[_lexicographic_min(np.array(vectors))])
+            if ratios[r] <= EPS:
+                degenerate_run += 1
+            else:
+                degenerate_run = 0
+                anti_cycling_basis = None
+            if stats is not None:
+                stats.lap("ratio_test")
+
+            # Обновляем веса до замены базиса (нужна текущая факторизация)
+            leaving_j = basis[r]
+            if pricing in ("devex", "steepest_edge"):
+                self._update_weights_revised(factorization, weights, pricing, column, r, q, leaving_j)
+
+            # Обновляем значения базисных переменных
+            theta = max(ratios[r], 0.0)
+            x_b -= theta * delta
+            x_b[r] = upper[q] - theta if at_upper[q] else theta
+
+            # Обновляем признаки переменных на верхней границе и правую часть
+            if at_upper[q]:
+                at_upper[q] = False
+                self._revised["rhs"] += upper[q] * a_q
+            if to_upper[r]:
+                at_upper[leaving_j] = True
+                self._revised["rhs"] -= upper[leaving_j] * self._column_revised(leaving_j)
+
+            # Обновляем базис и факторизацию
+            basis[r] = q
+            factorization.update(r, column)
+            self.iterations += 1
+            if stats is not None:
+                stats.lap("pivoting")
+                self._record_pivot(q, leaving_j, theta, factorization.size())
+            if factorization.needs_refactor():
+                x_b = self._refactor_revised(factorization, basis)
+
+
+    def _update_weights_revised(self, factorization, weights, pricing, column, r, q, leaving_j):
+        """
+        Обновляет веса столбцов для правил "devex" и "steepest_edge" после выбора
+        входящей переменной q и выходящей строки r.
+        """
+        e = np.zeros(len(column))
+        e[r] = 1
+        ratio = self._row_revised(factorization.btran(e)) / column[r]
+
+        if pricing == "devex":
+            weight_q = weights[q]
+            np.maximum(weights, ratio ** 2 * weight_q, out=weights)
+        else:
+            # Рекуррентная формула Гольдфарба-Рида
+            weight_q = 1 + column @ column
+            tau = self._row_revised(factorization.btran(column))
+            np.maximum(weights - 2 * ratio * tau + ratio ** 2 * weight_q, 1 + ratio ** 2, out=weights)
+        weights[leaving_j] = max(weight_q / column[r] ** 2, 1.0)
+
+
+    def _drive_out_artificials_revised(self, factorization, basis, x_b):
+        """
+        Выводит из базиса искусственные переменные, оставшиеся на нулевом уровне после фазы I.
+        Если строка линейно зависима, искусственная переменная остаётся в базисе.
+        """
+        r = self._revised
+        for i in range(r["m"]):
+            if basis[i] < r["number_of_columns"]:
+                continue
+
+            # Строка i матрицы B^-1 * A (для исходных и дополнительных переменных)
+            e = np.zeros(r["m"])
+            e[i] = 1
+            row = factorization.btran(e)
+            values = np.concatenate([r["a"].T @ row, row[r["slack_rows"]]])
+            values[[j for j in basis if j < r["number_of_columns"]]] = 0
+
+            candidates = np.flatnonzero(np.abs(values) > EPS)
+            if len(candidates) > 0:
+                j = int(candidates[0])
+                a_j = self._column_revised(j)
+                column = factorization.ftran(a_j)
+                basis[i] = j
+                factorization.update(i, column)
+
+                # Переменная с верхней границы становится базисной
+                if r["at_upper"][j]:
+                    r["at_upper"][j] = False
+                    r["rhs"] += r["upper"][j] * a_j
+        return self._refactor_revised(factorization, basis)
+
+
+def _parametric_interval(values, slopes):
+    """
+    Возвращает отрезок [t_low, t_high] (t_low <= 0 <= t_high), на котором values + t * slopes >= 0
+    при неотрицательных values (малые отрицательные значения из-за погрешности считаются нулями).
+    """
+    values = np.maximum(values, 0.0)
+    t_low, t_high = -np.inf, np.inf
+    positive = slopes > EPS
+    negative = slopes < -EPS
+    if positive.any():
+        t_low = float(np.max(-values[positive] / slopes[positive]))
+    if negative.any():
+        t_high = float(np.min(-values[negative] / slopes[negative]))
+    return t_low, t_high
+
+
+def _copy_answer(answer):
+    """
+    Копирует ответ (вложенные списки чисел), чтобы изменения у вызывающего не портили кэш решений.
+    """
+    if isinstance(answer, list):
+        return [_copy_answer(x) for x in answer]
+    return answer
+
+
+def _check_senses(objective_sense, constraint_senses):
+    """
+    Проверяет направление оптимизации и типы ограничений.
+    """
+    if objective_sense not in ("max", "min"):
+        raise ValueError(f"Неизвестное направление оптимизации: {objective_sense}")
+    for sense in constraint_senses:
+        if sense not in ("<=", ">=", "="):
+            raise ValueError(f"Неизвестный тип ограничения: {sense}")
+
+
+def _variable_bounds(bounds, number_of_variables, variable_names):
+    """
+    Возвращает списки нижних и верхних границ переменных по словарю {индекс: [нижняя, верхняя]}
+    (переменные без нижней границы не поддерживаются).
+    """
+    lower_bounds = [0 for _ in range(number_of_variables)]
+    upper_bounds = [float("inf") for _ in range(number_of_variables)]
+    for index, (lower, upper) in (bounds or {}).items():
+        if lower == float("-inf"):
+            raise ValueError(f"Переменные без нижней границы не поддерживаются ({variable_names[index]})")
+        lower_bounds[index] = lower
+        upper_bounds[index] = upper
+    return lower_bounds, upper_bounds
+
+
+def _rows_from_data(constraint_matrix):
+    """
+    Переводит матрицу ограничений (список списков или словарей, массив NumPy или разреженную матрицу SciPy)
+    в строки формата {индекс: коэффициент} без нулевых коэффициентов.
+    """
+    if sp is not None and sp.issparse(constraint_matrix):
+        matrix = constraint_matrix.tocsr()
+        return [dict(zip(matrix.indices[start:end].tolist(), matrix.data[start:end].tolist()))
+                for start, end in zip(matrix.indptr[:-1], matrix.indptr[1:])]
+    if hasattr(constraint_matrix, "tolist"):
+        constraint_matrix = constraint_matrix.tolist()
+    return [dict(row) if isinstance(row, dict) else {j: a for j, a in enumerate(row) if a != 0}
+            for row in constraint_matrix]
+
+
+def _solve_one(solve_options, indexed_problem):
+    """
+    Решает одну ЗЛП в процессе пула и возвращает (номер задачи, статус, ответ).
+    При ошибке возвращается статус "error" и текст ошибки вместо ответа.
+    """
+    index, problem = indexed_problem
+    try:
+        if isinstance(problem, SimplexMethod):
+            sm = problem
+        else:
+            sm = SimplexMethod()
+            sm.load_problem(problem)
+        answer = sm.get_solution(**solve_options)
+        return index, sm.status, answer
+    except Exception as e:
+        return index, "error", f"{type(e).__name__}: {e}"
+
+
+def solve_many(problems, processes=None, chunksize=1, **solve_options):
+    """
+    Решает много независимых ЗЛП в пуле из `processes` процессов (по умолчанию - по числу ядер).
+    problems - итерируемый объект с путями до txt-файлов или экземплярами SimplexMethod с загруженной ЗЛП,
+    chunksize - число задач, передаваемых процессу за раз,
+    solve_options - параметры для `get_solution` (например, engine="numpy").
+
+    Результаты выдаются по мере готовности (не по порядку) в виде (номер задачи, статус, ответ),
+    где статус - "optimal", "unbounded", "infeasible" или "error".
+    """
+    with Pool(processes) as pool:
+        yield from pool.imap_unordered(partial(_solve_one, solve_options), enumerate(problems), chunksize)
+
+
+def solve_batch(problems, precision=8, anti_cycling="bland"):
+    """
+    Решает пакет ЗЛП одинаковой структуры (одинаковые размеры канонических таблиц и типы ограничений),
+    складывая их симплекс-таблицы в один трёхмерный массив и выполняя преобразования для всех задач сразу.
+    problems - список экземпляров SimplexMethod с загруженными ЗЛП.
+
+    Повторяет шаги движка "numpy" (правило "dantzig", прямой двухфазный метод, защита от зацикливания
+    anti_cycling), поэтому ответы совпадают с `get_solution(engine="numpy", method="primal")`. Задача исключается из пересчёта, как только найден её ответ
+    или доказано, что его нет. ЗЛП с границами переменных решаются этим движком по отдельности. Возвращает список ответов в формате `get_solution`;
+    статус, базис и число итераций сохраняются в каждом экземпляре.
+    """
+    if np is None:
+        raise ImportError("Для пакетного решения требуется установленный пакет numpy")
+    if anti_cycling is not None and anti_cycling not in ANTI_CYCLING_RULES:
+        raise ValueError(f"Неизвестное правило защиты от зацикливания: {anti_cycling}")
+    if len(problems) == 0:
+        return []
+
+    first = problems[0]
+    for sm in problems:
+        if sm.sparse or sm.canonical_basis_indexes != first.canonical_basis_indexes \
+                or len(sm.canonical_problem_table[0]) != len(first.canonical_problem_table[0]):
+            raise ValueError("Все ЗЛП в пакете должны иметь одинаковую структуру")
+
+    # ЗЛП с границами переменных решаются по отдельности движком "numpy" (его тест отношений учитывает границы),
+    # остальные - пакетом
+    if any(sm._has_bounds() for sm in problems):
+        answers = iter(solve_batch([sm for sm in problems if not sm._has_bounds()], precision, anti_cycling))
+        return [sm.get_solution(precision, "numpy", method="primal", anti_cycling=anti_cycling) if sm._has_bounds()
+                else next(answers) for sm in problems]
+
+    # Симплекс-таблицы (K x m x (n + 1)), коэффициенты целевых функций (K x n) и их цели
+    st = np.array([sm.canonical_problem_table[1:] for sm in problems], dtype=np.float64)
+    c = np.array([sm.canonical_problem_table[0][:-1] for sm in problems], dtype=np.float64)
+    maximize = np.array([sm.canonical_problem_table[0][-1] == "max" for sm in problems])
+    number_of_problems, m, _ = st.shape
+
+    # Базисы задач (-1 - в строке нет базисной переменной), статусы и счётчики итераций
+    basis = np.array([[-1 if bi is None else bi for bi in first.canonical_basis_indexes]] * number_of_problems)
+    basis = basis.reshape(number_of_problems, m)
+    status = np.array([None] * number_of_problems, dtype=object)
+    iterations = np.zeros(number_of_problems, dtype=np.int64)
+    all_problems = np.arange(number_of_problems)
+
+    def pivot(ks, rs, js):
+        """
+        Приводит элементы (rs[t], js[t]) задач ks[t] к единице, а остальные элементы их столбцов - к нулю.
+        """
+        pivot_rows = st[ks, rs, :] / st[ks, rs, js][:, None]
+        st[ks, rs, :] = pivot_rows
+        columns = st[ks, :, js]
+        columns[np.arange(len(ks)), rs] = 0
+        st[ks] -= columns[:, :, None] * pivot_rows[:, None, :]
+        basis[ks, rs] = js
+        iterations[ks] += 1
+        return pivot_rows
+
+    def calculate_deltas(ks, costs):
+        """
+        Рассчитывает дельты задач ks заново (строки без базисной переменной входят с нулевым коэффициентом).
+        """
+        coeffs = np.take_along_axis(costs[ks], np.maximum(basis[ks], 0), axis=1)
+        coeffs[basis[ks] < 0] = 0
+        deltas = np.einsum("km,kmn->kn", coeffs, st[ks, :, :-1]) - costs[ks]
+        return np.where(np.abs(deltas) < EPS, 0, deltas)
+
+    def optimize(active, costs, maximize, number_of_columns=None):
+        """
+        Цикл оптимизации с помощью дельт по задачам active, пока они не решены
+        (в базис входят только первые number_of_columns столбцов). Возвращает задачи,
+        в которых целевая функция не ограничена; в остальных базис становится оптимальным.
+        """
+        unbounded_problems = []
+        deltas = np.zeros_like(costs)
+        deltas[active] = calculate_deltas(active, costs)
+
+        # Число вырожденных итераций подряд в каждой задаче и базисы, действовавшие при включении защиты
+        degenerate_run = np.zeros(number_of_problems, dtype=np.int64)
+        anti_cycling_basis = {}
+        while len(active) > 0:
+            # Ищем разрешающие столбцы (при "max" улучшают решение отрицательные дельты, при "min" - положительные)
+            scores = np.where(maximize[active, None], -deltas[active], deltas[active])[:, :number_of_columns]
+            js = np.argmax(scores, axis=1)
+            finished = scores[np.arange(len(active)), js] <= 0
+            if finished.any():
+                # Перед выходом сверяемся с дельтами, рассчитанными заново
+                ks = active[finished]
+                deltas[ks] = calculate_deltas(ks, costs)
+                scores[finished] = np.where(maximize[ks, None], -deltas[ks], deltas[ks])[:, :number_of_columns]
+                js[finished] = np.argmax(scores[finished], axis=1)
+                optimal = scores[np.arange(len(active)), js] <= 0
+                active, js, scores = active[~optimal], js[~optimal], scores[~optimal]
+
+            # В задачах с длинной серией вырожденных итераций включаем защиту от зацикливания
+            # (по правилу Бланда входит первый столбец, улучшающий решение)
+            if anti_cycling is not None:
+                for t in np.flatnonzero(degenerate_run[active] >= ANTI_CYCLING_THRESHOLD):
+                    k = active[t]
+                    if k not in anti_cycling_basis:
+                        anti_cycling_basis[k] = basis[k][basis[k] >= 0]
+                    if anti_cycling == "bland":
+                        js[t] = np.flatnonzero(scores[t] > 0)[0]
+
+            # Ищем разрешающие строки по минимальному симплекс-отношению Q
+            columns = st[active, :, js]
+            positive = columns > EPS
+            q = np.full(columns.shape, np.inf)
+            np.divide(st[active, :, -1], columns, out=q, where=positive)
+            unbounded = ~positive.any(axis=1)
+            unbounded_problems.extend(active[unbounded])
+            active, js, q = active[~unbounded], js[~unbounded], q[~unbounded]
+            rs = np.argmin(q, axis=1)
+
+            # В задачах с длинной серией вырожденных итераций включена защита от зацикливания:
+            # среди строк с минимальным Q выбираем так же, как движок "numpy"
+            if anti_cycling is not None:
+                for t in np.flatnonzero(degenerate_run[active] >= ANTI_CYCLING_THRESHOLD):
+                    k = active[t]
+                    tied = np.flatnonzero(q[t] <= q[t, rs[t]] + EPS)
+                    if anti_cycling == "bland":
+                        rs[t] = tied[np.argmin(basis[k, tied])]
+                    else:
+                        vectors = st[k, tied][:, anti_cycling_basis[k]] / st[k, tied, js[t]][:, None]
+                        rs[t] = tied[_lexicographic_min(vectors)]
+                degenerate = q[np.arange(len(active)), rs] <= EPS
+                degenerate_run[active] = np.where(degenerate, degenerate_run[active] + 1, 0)
+                for k in active[~degenerate]:
+                    anti_cycling_basis.pop(k, None)
+
+            # Выполняем преобразования и пересчитываем дельты по разрешающим строкам
+            pivot_rows = pivot(active, rs, js)
+            deltas[active] -= deltas[active, js][:, None] * pivot_rows[:, :-1]
+            small = np.abs(deltas[active]) < EPS
+            deltas[active] = np.where(small, 0, deltas[active])
+        return np.array(unbounded_problems, dtype=np.int64)
+
+    # Фаза I: домножаем строки с отрицательным b на -1 и добавляем искусственные переменные
+    # в строки без базисной переменной (столбцы искусственных переменных общие для пакета:
+    # в задачах, где у строки есть базисная переменная, её столбец не используется)
+    width = c.shape[1]
+    tolerance = EPS * np.maximum(1, np.abs(st[:, :, -1]).max(axis=1))
+    negative = st[:, :, -1] < 0
+    signs = np.where(negative, -1.0, 1.0)
+    st[negative] *= -1
+    basis[negative] = -1
+    artificial_rows = np.flatnonzero((basis < 0).any(axis=0))
+    number_of_artificials = len(artificial_rows)
+    st = np.concatenate([st[:, :, :-1], np.zeros((number_of_problems, m, number_of_artificials)), st[:, :, -1:]], axis=2)
+    st[:, artificial_rows, width + np.arange(number_of_artificials)] = 1
+    ks, ts = np.nonzero(basis[:, artificial_rows] < 0)
+    basis[ks, artificial_rows[ts]] = width + ts
+    identity = basis.copy()
+
+    # Минимизируем сумму искусственных переменных (вернувшись из базиса, они в него больше не входят)
+    phase_one_cost = np.zeros((number_of_problems, width + number_of_artificials))
+    phase_one_cost[:, width:] = 1
+    optimize(all_problems, phase_one_cost, np.zeros(number_of_problems, dtype=bool), width)
+    artificial = basis >= width
+    infeasible = np.where(artificial, st[:, :, -1], 0).sum(axis=1) > tolerance
+    status[infeasible] = "infeasible"
+
+    # Двойственные оценки фазы I дают сертификаты недопустимости
+    certificates = {}
+    for k in np.flatnonzero(infeasible):
+        y = phase_one_cost[k, basis[k]] @ st[k][:, identity[k]]
+        certificates[k] = -signs[k] * y
+
+    # Выводим из базиса оставшиеся (нулевые) искусственные переменные
+    for k, i in zip(*np.nonzero(artificial & ~infeasible[:, None])):
+        nonzero = np.flatnonzero(np.abs(st[k, i, :width]) > EPS)
+        if len(nonzero) == 0:
+            # Строка линейно зависима от остальных: обнуляем её и оставляем без базисной переменной
+            st[k, i] = 0
+            basis[k, i] = -1
+        else:
+            pivot(np.array([k]), np.array([i]), nonzero[:1])
+    st = np.concatenate([st[:, :, :width], st[:, :, -1:]], axis=2)
+
+    # Фаза II: оптимизируем исходные целевые функции по всем допустимым задачам
+    active = all_problems[status == None]
+    status[optimize(active, c, maximize)] = "unbounded"
+    status[active[status[active] == None]] = "optimal"
+
+    # Формируем ответы и сохраняем результаты в экземплярах
+    answers = []
+    number_of_variables = len(first.objective_coefficients)
+    for k, sm in enumerate(problems):
+        sm.status = status[k]
+        sm.iterations = int(iterations[k])
+        sm.engine = "numpy"
+        sm.basis_indexes = [None if bi < 0 else int(bi) for bi in basis[k]]
+        # Симплекс-таблица задачи соответствует её базису (с неё продолжает `resolve`)
+        sm.st = st[k].copy()
+        sm.c = c[k].copy()
+        sm.obj = "max" if maximize[k] else "min"
+        sm.infeasibility_certificate = None
+        sm._row_scale = sm._column_scale = None
+        sm._upper = sm._flipped = None
+        if k in certificates:
+            sm._set_infeasibility_certificate(certificates[k])
+        if status[k] != "optimal":
+            answers.append(None)
+            continue
+        x = np.zeros(c.shape[1])
+        x[basis[k][basis[k] >= 0]] = st[k, basis[k] >= 0, -1]
+        answer = [x[:number_of_variables].tolist(), float(c[k] @ x)]
+        answers.append(sm._postsolve(sm._round_result(answer, precision), precision))
+    return answers
+
+
+# === ПРЕДВАРИТЕЛЬНАЯ ОБРАБОТКА ЗЛП ===
+
+def _divide(a, b):
+    """
+    Делит a на b, сохраняя целый результат для целых чисел, делящихся нацело.
+    """
+    if isinstance(a, int) and isinstance(b, int) and a % b == 0:
+        return a // b
+    return a / b
+
+
+def _presolve(objective, objective_sense, rows, constraint_senses, constraint_rhs, number_of_variables,
+              lower_bounds, upper_bounds):
+    """
+    Упрощает ЗЛП перед приведением к каноническому виду (objective и rows - строки вида {индекс: коэффициент}).
+    Повторяет, пока что-то меняется:
+    - удаляет пустые строки (проверяя, что 0 <знак> b выполняется);
+    - заменяет строки с одной переменной границами этой переменной (избыточные границы отбрасываются);
+      если нижняя и верхняя границы совпадают, переменная фиксируется;
+    - подставляет зафиксированные переменные в ограничения и целевую функцию;
+    - из одинаковых (с точностью до положительного множителя) ограничений оставляет самые сильные.
+    Затем фиксирует пустые столбцы: на нижней границе, если переменная не улучшает целевую функцию,
+    и на верхней, если улучшает.
+
+    Возвращает ((objective, rows, constraint_senses, constraint_rhs, number_of_variables,
+    lower_bounds, upper_bounds), info),
+    где info - словарь со сведениями для `SimplexMethod._postsolve`:
+    rows_removed, columns_removed, number_of_variables (в исходной ЗЛП), columns (исходные индексы
+    оставшихся переменных), fixed (пары [индекс, значение]), offset (вклад в целевую функцию) и status.
+    Если обнаружена недопустимость ЗЛП, вместо упрощённой ЗЛП возвращается None, а status = "infeasible".
+    """
+    info = {
+        "rows_removed": 0,
+        "columns_removed": 0,
+        "number_of_variables": number_of_variables,
+        "columns": list(range(number_of_variables)),
+        "fixed": [],
+        "offset": 0,
+        "status": None,
+    }
+
+    # Зафиксированные переменные в формате {индекс: значение} и границы переменных
+    fixed = {}
+    lower = list(lower_bounds)
+    upper = list(upper_bounds)
+
+    # Строки без нулевых коэффициентов
+    rows = [{j: a for j, a in row.items() if a != 0} for row in rows]
+    senses = list(constraint_senses)
+    rhs = list(constraint_rhs)
+
+    # На первом проходе проверяются границы всех переменных (в том числе заданные во входных данных),
+    # на следующих - только уточнённые по строкам с одной переменной
+    bounded = set(range(number_of_variables))
+    changed = True
+    while changed:
+        changed = False
+
+        # Подставляем зафиксированные переменные в ограничения
+        for i in range(len(rows)):
+            for j in [j for j in rows[i] if j in fixed]:
+                rhs[i] -= rows[i].pop(j) * fixed[j]
+
+        # Уточняем границы переменных по строкам с одной переменной, остальные строки оставляем
+        kept = []
+        for row, sense, b in zip(rows, senses, rhs):
+            # Пустая строка: 0 <знак> b
+            if not row:
+                if (sense == "<=" and b < -EPS) or (sense == ">=" and b > EPS) or (sense == "=" and abs(b) > EPS):
+                    info["status"] = "infeasible"
+                    return None, info
+                continue
+
+            if len(row) > 1:
+                kept.append((row, sense, b))
+                continue
+
+            # a * x <знак> b -> граница x (при a < 0 знак меняется на противоположный)
+            (j, a), = row.items()
+            value = _divide(b, a)
+            if sense == "=" or (sense == "<=") == (a > 0):
+                upper[j] = min(upper[j], value)
+            if sense == "=" or (sense == ">=") == (a > 0):
+                lower[j] = max(lower[j], value)
+            bounded.add(j)
+
+        rows, senses, rhs = [], [], []
+        for row, sense, b in kept:
+            rows.append(row)
+            senses.append(sense)
+            rhs.append(b)
+
+        # Проверяем уточнённые границы и фиксируем переменные с совпадающими границами
+        for j in sorted(bounded):
+            if lower[j] > upper[j] + EPS:
+                info["status"] = "infeasible"
+                return None, info
+            if j not in fixed and upper[j] - lower[j] <= EPS:
+                fixed[j] = lower[j]
+                changed = True
+        bounded = set()
+
+        # Объединяем одинаковые ограничения (строки приводятся к первому коэффициенту, равному по модулю 1)
+        groups = {}
+        for i in range(len(rows)):
+            scale = abs(rows[i][min(rows[i])])
+            key = tuple(sorted((j, a / scale) for j, a in rows[i].items()))
+            groups.setdefault(key, []).append((i, rhs[i] / scale))
+
+        if len(groups) < len(rows):
+            merged_rows, merged_senses, merged_rhs = [], [], []
+            for group in groups.values():
+                # Самые сильные ограничения "<=" и ">=" и все ограничения "="
+                le = min((g for g in group if senses[g[0]] == "<="), key=lambda g: g[1], default=None)
+                ge = max((g for g in group if senses[g[0]] == ">="), key=lambda g: g[1], default=None)
+                eq = [g for g in group if senses[g[0]] == "="]
+
+                if eq:
+                    value = eq[0][1]
+                    if any(abs(g[1] - value) > EPS * (1 + abs(value)) for g in eq) \
+                            or (le is not None and value > le[1] + EPS) or (ge is not None and value < ge[1] - EPS):
+                        info["status"] = "infeasible"
+                        return None, info
+                    chosen = [eq[0]]
+                elif le is not None and ge is not None and ge[1] > le[1] + EPS:
+                    info["status"] = "infeasible"
+                    return None, info
+                else:
+                    chosen = [g for g in (le, ge) if g is not None]
+
+                for i, _ in chosen:
+                    merged_rows.append(rows[i])
+                    merged_senses.append(senses[i])
+                    merged_rhs.append(rhs[i])
+            rows, senses, rhs = merged_rows, merged_senses, merged_rhs
+
+    # Пустые столбцы фиксируем на границе, лучшей для целевой функции
+    # (если улучшающая переменная не ограничена сверху, оставляем её решателю)
+    used = set()
+    for row in rows:
+        used.update(row)
+    for j in range(number_of_variables):
+        if j in used or j in fixed:
+            continue
+        coefficient = objective.get(j, 0)
+        if coefficient == 0 or (coefficient > 0) == (objective_sense == "min"):
+            fixed[j] = lower[j]
+        elif upper[j] != float("inf"):
+            fixed[j] = upper[j]
+
+    # Перенумеровываем оставшиеся переменные
+    columns = [j for j in range(number_of_variables) if j not in fixed]
+    new_indexes = {j: k for k, j in enumerate(columns)}
+    reduced_objective = {new_indexes[j]: a for j, a in objective.items() if j in new_indexes}
+    reduced_rows = [{new_indexes[j]: a for j, a in row.items()} for row in rows]
+
+    info["rows_removed"] = len(constraint_senses) - len(rows)
+    info["columns_removed"] = len(fixed)
+    info["columns"] = columns
+    info["fixed"] = [[j, fixed[j]] for j in sorted(fixed)]
+    info["offset"] = sum(objective.get(j, 0) * value for j, value in fixed.items())
+
+    reduced_lower = [lower[j] for j in columns]
+    reduced_upper = [upper[j] for j in columns]
+    return (reduced_objective, reduced_rows, senses, rhs, len(columns), reduced_lower, reduced_upper), info
+
+
+# === ДВОИЧНЫЙ КЭШ ЗЛП ===
+
+def _cache_entry_path(cache_dir, file_path, file_format):
+    """
+    Возвращает путь до записи кэша для файла ЗЛП в виде "<хэш пути и формата>-<хэш содержимого>".
+    В хэш содержимого входят также формат файла и версия формата кэша,
+    так что любое изменение файла приводит к новой записи.
+    """
+    path_hash = hashlib.sha256(f"{os.path.abspath(file_path)}:{file_format}".encode('utf-8')).hexdigest()[:16]
+
+    content_hash = hashlib.sha256(f"{file_format}:{CACHE_VERSION}:".encode('utf-8'))
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            content_hash.update(chunk)
+
+    return os.path.join(cache_dir, f"{path_hash}-{content_hash.hexdigest()[:32]}")
+
+
+def _evict_cache(cache_dir, max_bytes):
+    """
+    Удаляет давно не использованные записи кэша, пока их суммарный размер превышает max_bytes.
+    """
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.startswith(".") or not os.path.isdir(path):
+            continue
+        size = sum(entry.stat().st_size for entry in os.scandir(path))
+        entries.append((os.stat(path).st_mtime, size, path))
+        total += size
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+
+def _to_python_numbers(array, integer):
+    """
+    Переводит массив NumPy в (вложенный) список чисел Python: int, если integer=True, иначе float.
+    """
+    if integer:
+        return array.astype(np.int64).tolist()
+    return array.astype(np.float64).tolist()
+
+
+# === ЧТЕНИЕ ФАЙЛОВ В ФОРМАТАХ TXT, MPS И LP ===
+
+def _read_txt(f):
+    """
+    Читает ЗЛП в txt-формате из итератора строк за один проход:
+    каждая строка сразу превращается в разреженную строку вида {индекс: коэффициент}.
+    Возвращает словарь с параметрами для `SimplexMethod._set_problem`.
+    """
+    # Строка целевой функции в формате {индекс: коэффициент} и направление оптимизации
+    objective = None
+    objective_sense = None
+
+    # Строки ограничений в формате {индекс: коэффициент}, их типы и правые части
+    rows = []
+    constraint_senses = []
+    constraint_rhs = []
+
+    # Число значимых переменных (наибольший индекс X, встречающийся в ЗЛП)
+    number_of_variables = 0
+
+    # Границы переменных в формате {индекс: [нижняя, верхняя]}
+    bounds = {}
+
+    # Уже разобранные коэффициенты (в больших ЗЛП одни и те же коэффициенты встречаются многократно)
+    coefficients = {'': 1, '+': 1, '-': -1}
+
+    for line_number, line in enumerate(f, 1):
+        tokens = line.split()
+        if not tokens:
+            continue
+
+        # Границы переменной вида "<нижняя> <= x<номер> <= <верхняя>"
+        if len(tokens) == 5 and tokens[1] == tokens[3] == "<=":
+            prefix, x, index = tokens[2].partition('x')
+            if prefix or not x or not index.isdigit():
+                raise ValueError(f"Строка {line_number}: не удалось разобрать границы переменной '{tokens[2]}'")
+            index = int(index) - 1
+            bounds[index] = [_parse_number(tokens[0]), _parse_number(tokens[4])]
+            if index >= number_of_variables:
+                number_of_variables = index + 1
+            continue
+
+        # Первая непустая строка - целевая функция вида "<слагаемые> -> <max/min>",
+        # остальные - ограничения вида "<слагаемые> <знак> <правая часть>"
+        row = {}
+        for token in tokens[:-2]:
+            # Извлекаем коэффициент и индекс X из слагаемого.
+            # Примеры: "2x1" -> (2, 1), "+x3" -> (1, 3), "-x3" -> (-1, 3), "-5x4" -> (-5, 4)
+            coefficient, x, index = token.partition('x')
+            if not x or not index.isdigit():
+                raise ValueError(f"Строка {line_number}: не удалось разобрать слагаемое '{token}'")
+            if coefficient not in coefficients:
+                coefficients[coefficient] = _parse_number(coefficient)
+
+            # В Python индексы начинаются с нуля, так что используем (index - 1)
+            index = int(index) - 1
+            row[index] = coefficients[coefficient]
+            if index >= number_of_variables:
+                number_of_variables = index + 1
+
+        if objective is None:
+            objective = row
+            objective_sense = tokens[-1]
+        else:
+            rows.append(row)
+            constraint_senses.append(tokens[-2])
+            constraint_rhs.append(_parse_number(tokens[-1]))
+
+    return {
+        "objective": objective,
+        "objective_sense": objective_sense,
+        "rows": rows,
+        "constraint_senses": constraint_senses,
+        "constraint_rhs": constraint_rhs,
+        "number_of_variables": number_of_variables,
+        "bounds": bounds,
+    }
+
+
+def _read_mps(f):
+    """
+    Читает ЗЛП в свободном формате MPS из итератора строк.
+    Возвращает словарь с параметрами для `SimplexMethod._set_problem`.
+    """
+    # Текущая секция файла и направление оптимизации (по умолчанию в MPS - минимизация)
+    section = None
+    objective_sense = "min"
+
+    # Имя строки целевой функции и имена остальных строк без ограничений (тип N)
+    objective_row = None
+    free_rows = set()
+
+    # Номера строк ограничений по именам и номера переменных по именам
+    row_indexes = {}
+    column_indexes = {}
+
+    objective = {}
+    rows = []
+    constraint_senses = []
+    constraint_rhs = []
+    ranges = {}
+    bounds = {}
+
+    def pairs(tokens):
+        """
+        Разбивает элементы строки на пары (имя строки, значение).
+        """
+        return [(tokens[k], _parse_number(tokens[k + 1])) for k in range(0, len(tokens) - 1, 2)]
+
+    for line in f:
+        if not line.strip() or line.startswith('*'):
+            continue
+        tokens = line.split()
+
+        # Заголовки секций начинаются с первой позиции строки
+        if not line[0].isspace():
+            section = tokens[0].upper()
+            if section == "OBJSENSE" and len(tokens) > 1:
+                objective_sense = "max" if tokens[1].upper().startswith("MAX") else "min"
+            elif section == "ENDATA":
+                break
+            continue
+
+        if section == "OBJSENSE":
+            objective_sense = "max" if tokens[0].upper().startswith("MAX") else "min"
+
+        elif section == "ROWS":
+            kind, name = tokens[0].upper(), tokens[1]
+            if kind == "N":
+                if objective_row is None:
+                    objective_row = name
+                else:
+                    free_rows.add(name)
+                continue
+            row_indexes[name] = len(rows)
+            rows.append({})
+            constraint_senses.append({"L": "<=", "G": ">=", "E": "="}[kind])
+            constraint_rhs.append(0)
+
+        elif section == "COLUMNS":
+            # Маркеры целочисленных переменных пропускаем (целочисленность не поддерживается)
+            if "'MARKER'" in tokens:
+                continue
+            j = column_indexes.setdefault(tokens[0], len(column_indexes))
+            for row_name, value in pairs(tokens[1:]):
+                if row_name == objective_row:
+                    objective[j] = value
+                elif row_name in row_indexes:
+                    rows[row_indexes[row_name]][j] = value
+                elif row_name not in free_rows:
+                    raise ValueError(f"Неизвестная строка в секции COLUMNS: {row_name}")
+
+        elif section in ("RHS", "RANGES"):
+            # Имя набора значений может отсутствовать
+            values = pairs(tokens[1:] if len(tokens) % 2 == 1 else tokens)
+            for row_name, value in values:
+                if row_name not in row_indexes:
+                    # Правая часть строки целевой функции (константа) не учитывается
+                    continue
+                if section == "RHS":
+                    constraint_rhs[row_indexes[row_name]] = value
+                else:
+                    ranges[row_indexes[row_name]] = value
+
+        elif section == "BOUNDS":
+            # Строка вида "<тип> [<набор>] <переменная> [<значение>]"
+            # (у типов FR, MI, PL и BV значение необязательно и не используется)
+            kind = tokens[0].upper()
+            if kind in ("FR", "MI", "PL", "BV"):
+                # Из трёх элементов "<набор> <переменная>" и "<переменная> <значение>"
+                # различаем по тому, какой из них - переменная из секции COLUMNS
+                if len(tokens) == 4 or (len(tokens) == 3 and tokens[2] in column_indexes):
+                    name = tokens[2]
+                else:
+                    name = tokens[1]
+            else:
+                name, value = tokens[2 if len(tokens) == 4 else 1], _parse_number(tokens[-1])
+            if name not in column_indexes:
+                raise ValueError(f"Неизвестная переменная в секции BOUNDS: {name}")
+            j = column_indexes[name]
+            lower, upper = bounds.get(j, [0, float("inf")])
+            if kind in ("UP", "UI"):
+                upper = value
+            elif kind in ("LO", "LI"):
+                lower = value
+            elif kind == "FX":
+                lower = upper = value
+            elif kind == "BV":
+                upper = 1
+            elif kind in ("FR", "MI"):
+                lower = float("-inf")
+            bounds[j] = [lower, upper]
+
+    # Ограничения с диапазонами превращаем в пары ограничений
+    for i, r in ranges.items():
+        sense, rhs = constraint_senses[i], constraint_rhs[i]
+        if sense == "=":
+            constraint_senses[i] = ">=" if r > 0 else "<="
+            rows.append(dict(rows[i]))
+            constraint_senses.append("<=" if r > 0 else ">=")
+            constraint_rhs.append(rhs + r)
+        else:
+            rows.append(dict(rows[i]))
+            constraint_senses.append(">=" if sense == "<=" else "<=")
+            constraint_rhs.append(rhs - abs(r) if sense == "<=" else rhs + abs(r))
+
+    return {
+        "objective": objective,
+        "objective_sense": objective_sense,
+        "rows": rows,
+        "constraint_senses": constraint_senses,
+        "constraint_rhs": constraint_rhs,
+        "number_of_variables": len(column_indexes),
+        "variable_names": list(column_indexes),
+        "bounds": bounds,
+    }
+
+
+# Ключевые слова, с которых начинаются секции файла в формате CPLEX LP
+_LP_SECTIONS = [
+    (re.compile(r'^\s*(maximize|maximise|maximum|max)(?=\s|$)', re.I), "max"),
+    (re.compile(r'^\s*(minimize|minimise|minimum|min)(?=\s|$)', re.I), "min"),
+    (re.compile(r'^\s*(subject\s+to|such\s+that|s\.t\.|st)(?=\s|$)', re.I), "constraints"),
+    (re.compile(r'^\s*(bounds|bound)(?=\s|$)', re.I), "bounds"),
+    (re.compile(r'^\s*(generals|general|gen|integers|integer|binaries|binary|bin)(?=\s|$)', re.I), "integers"),
+    (re.compile(r'^\s*end(?=\s|$)', re.I), "end"),
+]
+
+# Элементы выражений в формате CPLEX LP: числа, знаки ограничений, знаки слагаемых, двоеточия и имена
+_LP_TOKEN = re.compile(
+    r'\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+    r'|(?P<sense><=|=<|>=|=>|<|>|=)'
+    r'|(?P<sign>[+-])'
+    r'|(?P<colon>:)'
+    r'|(?P<name>[A-Za-z_!"#$%&()/,;?@`\'{}|~][\w!"#$%&()/,.;?@`\'{}|~\[\]^]*))'
+)
+
+# Приведение знаков ограничений формата CPLEX LP к знакам txt-формата
+_LP_SENSES = {"<": "<=", "<=": "<=", "=<": "<=", ">": ">=", ">=": ">=", "=>": ">=", "=": "="}
+
+
+def _tokenize_lp(text):
+    """
+    Разбивает текст секции файла в формате CPLEX LP на элементы вида (тип, значение).
+    """
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        m = _LP_TOKEN.match(text, position)
+        if m is None or m.end() == position:
+            raise ValueError(f"Не удалось разобрать выражение: '{text[position:position + 20]}'")
+        tokens.append((m.lastgroup, m.group(m.lastgroup)))
+        position = m.end()
+    return tokens
+
+
+def _read_lp(f):
+    """
+    Читает ЗЛП в формате CPLEX LP из итератора строк.
+    Возвращает словарь с параметрами для `SimplexMethod._set_problem`.
+    """
+    # Собираем текст каждой секции (комментарии начинаются с '\')
+    objective_sense = None
+    sections = {"objective": [], "constraints": [], "bounds": []}
+    current = None
+    for line in f:
+        line = line.split('\\', 1)[0]
+        for pattern, section in _LP_SECTIONS:
+            m = pattern.match(line)
+            if m:
+                if section in ("max", "min"):
+                    objective_sense = section
+                    section = "objective"
+                current = section
+                line = line[m.end():]
+                break
+        if current == "end":
+            break
+        if current in sections:
+            sections[current].append(line)
+
+    if objective_sense is None:
+        raise ValueError("В файле нет секции Maximize или Minimize")
+
+    # Номера переменных по именам (в порядке первого появления)
+    column_indexes = {}
+
+    def parse_expression(tokens, k):
+        """
+        Читает линейное выражение, начиная с элемента k, до знака ограничения или конца.
+        Возвращает строку {индекс: коэффициент} и номер следующего элемента.
+        """
+        row = {}
+        coefficient = 1
+        while k < len(tokens) and tokens[k][0] != "sense":
+            kind, value = tokens[k]
+            # Имя, за которым следует двоеточие, - это имя следующего ограничения
+            if kind == "name" and k + 1 < len(tokens) and tokens[k + 1][0] == "colon":
+                break
+            if kind == "sign":
+                coefficient = -coefficient if value == "-" else coefficient
+            elif kind == "number":
+                coefficient *= _parse_number(value)
+            elif kind == "name":
+                j = column_indexes.setdefault(value, len(column_indexes))
+                row[j] = row.get(j, 0) + coefficient
+                coefficient = 1
+            k += 1
+        return row, k
+
+    def parse_value(tokens, k):
+        """
+        Читает число со знаком (в том числе бесконечность) начиная с элемента k.
+        Возвращает число (или None, если там не число) и номер следующего элемента.
+        """
+        sign = 1
+        while k < len(tokens) and tokens[k][0] == "sign":
+            sign = -sign if tokens[k][1] == "-" else sign
+            k += 1
+        if k < len(tokens) and tokens[k][0] == "number":
+            return sign * _parse_number(tokens[k][1]), k + 1
+        if k < len(tokens) and tokens[k][0] == "name" and tokens[k][1].lower() in ("inf", "infinity"):
+            return sign * float("inf"), k + 1
+        return None, k
+
+    # Целевая функция (имя вида "obj:" пропускаем)
+    tokens = _tokenize_lp(" ".join(sections["objective"]))
+    if len(tokens) > 1 and tokens[1][0] == "colon":
+        tokens = tokens[2:]
+    objective, _ = parse_expression(tokens, 0)
+
+    # Ограничения вида "[имя:] <выражение> <знак> <правая часть>"
+    rows = []
+    constraint_senses = []
+    constraint_rhs = []
+    tokens = _tokenize_lp(" ".join(sections["constraints"]))
+    k = 0
+    while k < len(tokens):
+        if tokens[k][0] == "name" and k + 1 < len(tokens) and tokens[k + 1][0] == "colon":
+            k += 2
+        row, k = parse_expression(tokens, k)
+        if k >= len(tokens):
+            raise ValueError("Ограничение без знака и правой части")
+        sense = _LP_SENSES[tokens[k][1]]
+        rhs, k = parse_value(tokens, k + 1)
+        if rhs is None:
+            raise ValueError("Ограничение без правой части")
+        rows.append(row)
+        constraint_senses.append(sense)
+        constraint_rhs.append(rhs)
+
+    # Границы вида "x <= 5", "2 <= x <= 5", "x = 3", "x free"
+    bounds = {}
+    tokens = _tokenize_lp(" ".join(sections["bounds"]))
+    k = 0
+    while k < len(tokens):
+        left, k = parse_value(tokens, k)
+        if left is not None:
+            sense = _LP_SENSES[tokens[k][1]]
+            name = tokens[k + 1][1]
+            k += 2
+        else:
+            name = tokens[k][1]
+            k += 1
+            sense = None
+        j = column_indexes.setdefault(name, len(column_indexes))
+        lower, upper = bounds.get(j, [0, float("inf")])
+
+        if k < len(tokens) and tokens[k][0] == "name" and tokens[k][1].lower() == "free":
+            lower = float("-inf")
+            k += 1
+        if left is not None:
+            # Граница слева от имени: "l <= x", "u >= x" или "v = x"
+            if sense == "<=":
+                lower = left
+            elif sense == ">=":
+                upper = left
+            else:
+                lower = upper = left
+        if k < len(tokens) and tokens[k][0] == "sense":
+            sense = _LP_SENSES[tokens[k][1]]
+            right, k = parse_value(tokens, k + 1)
+            if sense == "<=":
+                upper = right
+            elif sense == ">=":
+                lower = right
+            else:
+                lower = upper = right
+        bounds[j] = [lower, upper]
+
+    return {
+        "objective": objective,
+        "objective_sense": objective_sense,
+        "rows": rows,
+        "constraint_senses": constraint_senses,
+        "constraint_rhs": constraint_rhs,
+        "number_of_variables": len(column_indexes),
+        "variable_names": list(column_indexes),
+        "bounds": bounds,
+    }
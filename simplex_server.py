@@ -0,0 +1,475 @@
+# Долгоживущий сервер решения ЗЛП: принимает запросы в формате JSON Lines через stdin/stdout
+# или локальный сокет и решает их в пуле заранее запущенных процессов.
+# Запуск: python simplex_server.py --workers 4                (stdin/stdout)
+#         python simplex_server.py --port 8765                 (TCP на 127.0.0.1)
+#         python simplex_server.py --unix /tmp/simplex.sock    (Unix-сокет)
+
+import argparse
+import io
+import json
+import os
+import queue
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from functools import partial
+from multiprocessing import Pool
+
+from simplex_method import SimplexMethod, SolutionCache
+
+# Наибольшее число запросов и суммарная длина их JSON-строк (в символах) в одном пакете,
+# передаваемом процессу пула (большой запрос отправляется отдельно)
+BATCH_SIZE = 32
+BATCH_BYTES = 64 * 1024
+
+# Сколько секунд ждать пополнения пакета, если все процессы пула заняты
+BATCH_DELAY = 0.002
+
+# Наибольшее число принятых, но ещё не решённых запросов (дальше чтение запросов приостанавливается)
+MAX_PENDING = 1024
+
+# Число последних запросов, по которым считаются перцентили задержки
+LATENCY_WINDOW = 10000
+
+# Кэш решений процесса пула (создаётся в `_init_worker`, если задан размер кэша)
+_worker_cache = None
+
+# Признак остановки потока сборки пакетов
+_STOP = object()
+
+
+def _init_worker(cache_size):
+    """
+    Инициализирует процесс пула: модуль simplex_method уже импортирован, остаётся создать кэш решений.
+    """
+    global _worker_cache
+    _worker_cache = SolutionCache(cache_size) if cache_size else None
+
+
+def _int_keys(value):
+    """
+    Переводит ключи словаря {индекс: значение} из строк JSON в целые числа.
+    """
+    return {int(key): item for key, item in value.items()} if isinstance(value, dict) else value
+
+
+def _load_request(request):
+    """
+    Загружает ЗЛП из запроса: "problem" - параметры `SimplexMethod.from_data`,
+    "text" - текст ЗЛП в формате "format" ("txt", "mps" или "lp"), "path" - путь до файла с ЗЛП.
+    Параметры "sparse" и "presolve" передаются при загрузке.
+    """
+    sparse = request.get("sparse", False)
+    presolve = request.get("presolve", False)
+    file_format = request.get("format", "txt")
+    if "problem" in request:
+        problem = dict(request["problem"])
+        problem["objective"] = _int_keys(problem["objective"])
+        problem["constraint_matrix"] = [_int_keys(row) for row in problem["constraint_matrix"]]
+        if "bounds" in problem:
+            problem["bounds"] = _int_keys(problem["bounds"])
+        problem.setdefault("sparse", sparse)
+        problem.setdefault("presolve", presolve)
+        return SimplexMethod.from_data(**problem)
+    if "text" in request:
+        return SimplexMethod.from_text(request["text"], file_format, sparse, presolve)
+    if "path" in request:
+        loaders = {"txt": SimplexMethod.load_problem, "mps": SimplexMethod.load_mps, "lp": SimplexMethod.load_lp}
+        if file_format not in loaders:
+            raise ValueError(f"Неизвестный формат ЗЛП: {file_format}")
+        sm = SimplexMethod()
+        loaders[file_format](sm, request["path"], sparse=sparse, presolve=presolve)
+        return sm
+    raise ValueError("Запрос должен содержать \"problem\", \"text\" или \"path\"")
+
+
+def _solve_request(request):
+    """
+    Решает один запрос в процессе пула и возвращает ответ сервера:
+    номер запроса "id", статус, ответ `get_solution`, число итераций и время решения в секундах.
+    При ошибке возвращается статус "error" и текст ошибки в "error".
+    """
+    response = {"id": request.get("id")}
+    start = time.perf_counter()
+    try:
+        sm = _load_request(request)
+        options = dict(request.get("options") or {})
+        if _worker_cache is not None:
+            options.setdefault("cache", _worker_cache)
+        answer = sm.get_solution(**options)
+        if options.get("stats"):
+            answer, stats = answer
+            response["stats"] = {"iterations": stats.iterations, "times": stats.times,
+                                 "degenerate_pivots": stats.degenerate_pivots,
+                                 "peak_table_size": stats.peak_table_size}
+        response.update(status=sm.status, answer=answer, iterations=sm.iterations)
+    except Exception as e:
+        response.update(status="error", error=f"{type(e).__name__}: {e}")
+    response["solve_time"] = time.perf_counter() - start
+    return response
+
+
+def _solve_requests(requests):
+    """
+    Решает пакет запросов в процессе пула (одна передача данных между процессами на весь пакет).
+    """
+    return [_solve_request(request) for request in requests]
+
+
+class _Connection:
+    """
+    Поток ответов одного клиента: сериализует запись строк JSON и считает запросы без ответа,
+    чтобы соединение закрывалось только после отправки всех ответов.
+    """
+    def __init__(self, output_stream):
+        """
+        Метод для инициализации класса.
+        """
+        self.output_stream = output_stream
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+
+    def send(self, response):
+        """
+        Записывает ответ в поток (ошибки записи означают, что клиент отключился, и игнорируются).
+        """
+        text = json.dumps(response, ensure_ascii=False) + "\n"
+        with self._lock:
+            try:
+                self.output_stream.write(text)
+                self.output_stream.flush()
+            except (OSError, ValueError):
+                pass
+
+    def accept(self):
+        """
+        Учитывает принятый запрос, на который ещё нужно ответить.
+        """
+        with self._lock:
+            self.pending += 1
+
+    def reply(self, response):
+        """
+        Отправляет ответ на принятый запрос и уменьшает число запросов без ответа.
+        """
+        self.send(response)
+        with self._lock:
+            self.pending -= 1
+            self._done.notify_all()
+
+    def wait(self):
+        """
+        Ждёт ответов на все принятые запросы.
+        """
+        with self._lock:
+            while self.pending:
+                self._done.wait()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    """
+    TCP-сервер `SolveServer.socket_server`: потоки соединений не мешают завершению процесса,
+    а порт можно занять снова сразу после остановки.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        """
+        Сервер Unix-сокета `SolveServer.socket_server` (с теми же настройками, что и `_TCPServer`).
+        """
+        daemon_threads = True
+        allow_reuse_address = True
+
+
+class SolveServer:
+    """
+    Сервер решения ЗЛП с пулом заранее запущенных процессов ("тёплых": модуль simplex_method
+    и numpy уже импортированы, поэтому на каждый запрос не тратится запуск интерпретатора).
+
+    Запросы - JSON-объекты (по одному в строке) с номером "id", ЗЛП (см. `_load_request`)
+    и параметрами `get_solution` в "options". Ответы выдаются по мере готовности (не по порядку)
+    с тем же "id", статусом ("optimal", "unbounded", "infeasible", статусом ограничения решения
+    или "error"), ответом "answer", числом итераций, временем решения "solve_time" и задержкой "latency"
+    (от приёма запроса до готовности ответа, в секундах). Запрос {"command": "stats"} возвращает счётчики (см. `stats`).
+
+    Мелкие запросы собираются в пакеты (до batch_size запросов и batch_bytes символов JSON): пока есть
+    свободные процессы, пакет отправляется сразу из уже пришедших запросов, иначе пополняется до batch_delay
+    секунд. Если без ответа остаётся max_pending запросов, приём новых приостанавливается (обратное давление):
+    клиент, пишущий в stdin или сокет, блокируется, пока сервер не освободится.
+    cache_size - размер кэша решений SolutionCache в каждом процессе пула (0 - без кэша).
+    """
+    def __init__(self, workers=None, batch_size=BATCH_SIZE, batch_bytes=BATCH_BYTES, batch_delay=BATCH_DELAY,
+                 max_pending=MAX_PENDING, cache_size=0):
+        """
+        Метод для инициализации класса: запускает процессы пула и поток сборки пакетов.
+        """
+        if batch_size < 1 or max_pending < 1:
+            raise ValueError("batch_size и max_pending должны быть положительными")
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+
+        # Счётчики принятых, решённых и ошибочных запросов, пакетов и ожиданий из-за обратного давления
+        self.received = 0
+        self.completed = 0
+        self.errors = 0
+        self.batches = 0
+        self.backpressure_waits = 0
+        self._in_flight = 0
+        self._batches_in_flight = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._solve_times = deque(maxlen=LATENCY_WINDOW)
+        self._started = time.perf_counter()
+
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._queue = queue.Queue()
+        self._pool = Pool(self.workers, initializer=_init_worker, initargs=(cache_size,))
+        self._batcher = threading.Thread(target=self._collect_batches, daemon=True)
+        self._batcher.start()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    def submit(self, request, reply, size=0):
+        """
+        Принимает запрос (словарь) на решение. reply - функция, которой будет передан ответ (из другого потока),
+        size - длина JSON-строки запроса (для ограничения размера пакета).
+        Если без ответа уже max_pending запросов, блокируется до освобождения места.
+        """
+        received = time.perf_counter()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.backpressure_waits += 1
+            self._slots.acquire()
+        with self._lock:
+            self.received += 1
+            self._in_flight += 1
+        self._queue.put((request, reply, size, received))
+
+
+    def _collect_batches(self):
+        """
+        Поток сборки пакетов: забирает запросы из очереди и отправляет их в пул пакетами.
+        """
+        item = None
+        while True:
+            if item is None:
+                item = self._queue.get()
+            if item is _STOP:
+                return
+            batch, size = [item], item[2]
+            item = None
+
+            # Если есть свободные процессы, берём только уже пришедшие запросы, иначе ждём пополнения пакета
+            with self._lock:
+                busy = self._batches_in_flight >= self.workers
+            deadline = time.perf_counter() + (self.batch_delay if busy else 0)
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+                    break
+                if item is _STOP or size + item[2] > self.batch_bytes:
+                    break
+                batch.append(item)
+                size += item[2]
+                item = None
+            self._dispatch(batch)
+
+
+    def _dispatch(self, batch):
+        """
+        Отправляет пакет в пул; ответы обрабатываются в `_complete` (в потоке результатов пула).
+        """
+        with self._lock:
+            self.batches += 1
+            self._batches_in_flight += 1
+        self._pool.apply_async(_solve_requests, ([request for request, _, _, _ in batch],),
+                               callback=partial(self._complete, batch), error_callback=partial(self._fail, batch))
+
+
+    def _fail(self, batch, error):
+        """
+        Отвечает ошибкой на все запросы пакета, который не удалось решить (например, передать в процесс).
+        """
+        self._complete(batch, [{"id": request.get("id"), "status": "error", "error": f"{type(error).__name__}: {error}",
+                                "solve_time": 0} for request, _, _, _ in batch])
+
+
+    def _complete(self, batch, responses):
+        """
+        Отправляет ответы на запросы пакета и обновляет счётчики.
+        """
+        now = time.perf_counter()
+        for (_, reply, _, received), response in zip(batch, responses):
+            response["latency"] = now - received
+            try:
+                reply(response)
+            finally:
+                self._slots.release()
+
+        with self._lock:
+            self.completed += len(batch)
+            self.errors += sum(response["status"] == "error" for response in responses)
+            self._latencies.extend(response["latency"] for response in responses)
+            self._solve_times.extend(response["solve_time"] for response in responses)
+            self._in_flight -= len(batch)
+            self._batches_in_flight -= 1
+            self._idle.notify_all()
+
+
+    def drain(self):
+        """
+        Ждёт ответов на все принятые запросы.
+        """
+        with self._lock:
+            while self._in_flight:
+                self._idle.wait()
+
+
+    def close(self):
+        """
+        Дожидается ответов на принятые запросы и останавливает поток сборки пакетов и процессы пула.
+        """
+        self.drain()
+        self._queue.put(_STOP)
+        self._batcher.join()
+        self._pool.close()
+        self._pool.join()
+
+
+    def stats(self):
+        """
+        Возвращает счётчики сервера: время работы, число процессов, принятых, решённых и ошибочных запросов,
+        запросов без ответа и пакетов, средний размер пакета, число ожиданий из-за обратного давления,
+        пропускную способность (решённых запросов в секунду) и задержку и время решения
+        (среднее, медиана, 95-й и 99-й перцентили и максимум по последним LATENCY_WINDOW запросам, в секундах).
+        """
+        with self._lock:
+            uptime = time.perf_counter() - self._started
+            return {
+                "uptime": uptime,
+                "workers": self.workers,
+                "received": self.received,
+                "completed": self.completed,
+                "errors": self.errors,
+                "in_flight": self._in_flight,
+                "batches": self.batches,
+                "average_batch_size": self.completed / self.batches if self.batches else 0,
+                "backpressure_waits": self.backpressure_waits,
+                "throughput": self.completed / uptime if uptime > 0 else 0,
+                "latency": _summary(self._latencies),
+                "solve_time": _summary(self._solve_times),
+            }
+
+
+    def serve_stream(self, input_stream, output_stream):
+        """
+        Обслуживает одного клиента: читает запросы из текстового потока input_stream (по одному JSON-объекту
+        в строке) и пишет ответы в output_stream. Возвращается после конца входного потока и отправки
+        всех ответов. Некорректные строки и неизвестные команды получают ответ со статусом "error" сразу.
+        """
+        connection = _Connection(output_stream)
+        for line in input_stream:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("запрос должен быть JSON-объектом")
+            except ValueError as e:
+                connection.send({"id": None, "status": "error", "error": f"Некорректный запрос: {e}"})
+                continue
+
+            command = request.get("command")
+            if command == "stats":
+                connection.send({"id": request.get("id"), "stats": self.stats()})
+            elif command is not None:
+                connection.send({"id": request.get("id"), "status": "error",
+                                 "error": f"Неизвестная команда: {command}"})
+            else:
+                connection.accept()
+                self.submit(request, connection.reply, len(line))
+        connection.wait()
+
+
+    def socket_server(self, address):
+        """
+        Создаёт сервер локального сокета (не запуская его): address - путь до Unix-сокета
+        или пара (хост, порт) для TCP. Каждое соединение обслуживается в своём потоке (см. `serve_stream`).
+        Запуск - методом serve_forever() полученного объекта, остановка - shutdown() и server_close().
+        """
+        solve_server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                input_stream = io.TextIOWrapper(self.rfile, encoding="utf-8")
+                output_stream = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+                solve_server.serve_stream(input_stream, output_stream)
+
+        if isinstance(address, str):
+            return _UnixServer(address, Handler)
+        return _TCPServer(address, Handler)
+
+
+def _summary(values):
+    """
+    Сводка по выборке: среднее, медиана, 95-й и 99-й перцентили и максимум (None для пустой выборки).
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    return {"mean": sum(values) / len(values), "p50": values[len(values) // 2],
+            "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+            "p99": values[min(len(values) - 1, int(len(values) * 0.99))], "max": values[-1]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сервер решения ЗЛП (JSON Lines через stdin/stdout или сокет)")
+    parser.add_argument("--workers", type=int, help="число процессов пула (по умолчанию - по числу ядер)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--batch-bytes", type=int, default=BATCH_BYTES)
+    parser.add_argument("--batch-delay", type=float, default=BATCH_DELAY)
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING)
+    parser.add_argument("--cache-size", type=int, default=0, help="размер кэша решений в каждом процессе")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="порт TCP (по умолчанию - stdin/stdout)")
+    parser.add_argument("--unix", help="путь до Unix-сокета (по умолчанию - stdin/stdout)")
+    args = parser.parse_args(argv)
+
+    with SolveServer(args.workers, args.batch_size, args.batch_bytes, args.batch_delay,
+                     args.max_pending, args.cache_size) as server:
+        try:
+            if args.port is None and args.unix is None:
+                server.serve_stream(sys.stdin, sys.stdout)
+            else:
+                with server.socket_server(args.unix or (args.host, args.port)) as socket_server:
+                    socket_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Итоговые счётчики выводим в stderr, чтобы не смешивать их с ответами
+            print(json.dumps(server.stats(), ensure_ascii=False), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
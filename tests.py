@@ -1,4 +1,22 @@
-from simplex_method import SimplexMethod
+import asyncio
+import io
+import json
+import os
+import pickle
+import socket
+import socketserver
+import threading
+import tracemalloc
+from array import array
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+import benchmark
+from simplex_method import (ANTI_CYCLING_RULES, SCALING_METHODS, CancellationToken, SimplexMethod, SolutionCache,
+                            solve_batch, solve_many)
+from simplex_server import SolveServer
 
 def test_1():
     sm = SimplexMethod()
@@ -151,3 +169,604 @@ def test_25():
     sm.load_problem('tests_txt/test_25.txt')
     answer = sm.get_solution()
     assert answer == [[12, 0, 0, 8], 116]
+
+def test_26():
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_26.txt')
+    answer = sm.get_solution()
+    # Целевая функция не ограничена сверху
+    assert answer is None
+    assert sm.status == "unbounded"
+
+def test_27():
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_27.txt')
+    answer = sm.get_solution()
+    # Ограничения несовместны
+    assert answer is None
+    assert sm.status == "infeasible"
+
+def test_numpy_engine():
+    # Движок "numpy" должен давать те же ответы, что и движок по умолчанию
+    for i in range(1, 26):
+        sm = SimplexMethod()
+        sm.load_problem(f'tests_txt/test_{i}.txt')
+        assert sm.get_solution(engine="numpy") == sm.get_solution()
+
+def test_revised_engine():
+    # Движок "revised" может найти другую оптимальную вершину (как в test_16),
+    # поэтому сравниваем значения целевой функции
+    for i in range(1, 26):
+        sm = SimplexMethod()
+        sm.load_problem(f'tests_txt/test_{i}.txt')
+        assert sm.get_solution(engine="revised")[1] == sm.get_solution()[1]
+
+def test_sparse_problem():
+    # Разреженное представление должно давать тот же ответ, что и плотное
+    for i in range(1, 26):
+        dense = SimplexMethod()
+        dense.load_problem(f'tests_txt/test_{i}.txt')
+        sparse = SimplexMethod()
+        sparse.load_problem(f'tests_txt/test_{i}.txt', sparse=True)
+        assert sparse.get_solution(engine="revised") == dense.get_solution(engine="revised")
+
+def test_pricing_rules():
+    # Все правила ценообразования должны приводить к одному значению целевой функции
+    for engine in ["numpy", "revised"]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_25.txt')
+        for pricing in ["dantzig", "partial", "devex", "steepest_edge"]:
+            assert sm.get_solution(engine=engine, pricing=pricing) == [[12, 0, 0, 8], 116]
+        assert set(sm.compare_pricing_rules(engine)) == {"dantzig", "partial", "devex", "steepest_edge"}
+
+def test_resolve():
+    # Повторное решение с базиса прошлого ответа должно совпадать с решением с нуля
+    changes = [
+        ('tests_txt/test_23.txt', {"rhs": [10, 16, 5, 4]}),
+        ('tests_txt/test_24.txt', {"objective_coefficients": [1, 4, 0]}),
+        ('tests_txt/test_23.txt', {"constraint": ([1, 1], "<=", 7)}),
+        ('tests_txt/test_23.txt', {"constraint": ([1, -1], "=", 1)}),
+    ]
+    for file_path, change in changes:
+        sm = SimplexMethod()
+        sm.load_problem(file_path)
+        sm.get_solution(engine="numpy")
+        warm = sm.resolve(**change)
+
+        cold_sm = SimplexMethod()
+        cold_sm.load_problem(file_path)
+        cold = cold_sm.resolve(**change)
+        assert warm == cold
+
+def test_solve_many():
+    # Ответы из пула процессов должны совпадать с последовательным решением
+    problems = [f'tests_txt/test_{i}.txt' for i in range(1, 28)] + ['tests_txt/missing.txt']
+    results = {i: (status, answer) for i, status, answer in solve_many(problems, processes=2, chunksize=4)}
+    for i in range(27):
+        sm = SimplexMethod()
+        sm.load_problem(problems[i])
+        answer = sm.get_solution()
+        assert results[i] == (sm.status, answer)
+    assert results[27][0] == "error"
+
+def test_solve_batch():
+    # Задачи 1-20 имеют одинаковую структуру, поэтому их можно решить одним пакетом
+    problems = []
+    for i in range(1, 21):
+        sm = SimplexMethod()
+        sm.load_problem(f'tests_txt/test_{i}.txt')
+        problems.append(sm)
+    answers = solve_batch(problems)
+    for sm, answer in zip(problems, answers):
+        assert answer == sm.get_solution(engine="numpy", method="primal")
+
+    # Повторное решение после пакетного продолжает с симплекс-таблицы пакета,
+    # а не с таблицы прошлого решения экземпляра
+    for i, sm in enumerate(problems, start=1):
+        sm.get_solution(engine="numpy", pricing="steepest_edge")
+        solve_batch([sm])
+        objective_coefficients = [j % 3 - 1 for j in range(len(sm.objective_coefficients))]
+        warm = sm.resolve(objective_coefficients=objective_coefficients)
+        cold_sm = SimplexMethod()
+        cold_sm.load_problem(f'tests_txt/test_{i}.txt')
+        cold = cold_sm.resolve(objective_coefficients=objective_coefficients)
+        assert sm.status == cold_sm.status and (warm is None or warm[1] == cold[1])
+
+def test_mps_and_lp_formats():
+    # Задача из test_1.txt, записанная в форматах MPS и CPLEX LP
+    for load in ["load_mps", "load_lp"]:
+        sm = SimplexMethod()
+        getattr(sm, load)('tests_txt/test_1.' + load[5:])
+        assert sm.variable_names == ['x1', 'x2', 'x3', 'x4']
+        assert sm.get_solution() == [[0, 0, 1, 9], 37]
+
+    # Границы BV со значением и без имени набора; граница неизвестной переменной - ошибка
+    with open('tests_txt/test_1.mps', 'r', encoding='utf-8') as f:
+        text = f.read()
+    bounds = "BOUNDS\n BV BND x1 1\n BV x2\n UP x4 5\nENDATA\n"
+    sm = SimplexMethod.from_text(text.replace("ENDATA\n", bounds), file_format="mps")
+    assert sm.variable_names == ['x1', 'x2', 'x3', 'x4']
+    assert sm.upper_bounds == [1, 1, float("inf"), 5]
+    with pytest.raises(ValueError):
+        SimplexMethod.from_text(text.replace("ENDATA\n", "BOUNDS\n UP BND y 5\nENDATA\n"), file_format="mps")
+
+def test_problem_cache(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    problem_path = tmp_path / "problem.txt"
+    problem_path.write_text(open('tests_txt/test_1.txt', encoding='utf-8').read(), encoding='utf-8')
+
+    # Первая загрузка создаёт запись в кэше, вторая читает её
+    for sparse, engine in [(False, "python"), (False, "python"), (True, "revised")]:
+        sm = SimplexMethod()
+        sm.load_problem(str(problem_path), sparse=sparse, cache_dir=cache_dir)
+        assert sm.get_solution(engine=engine) == [[0, 0, 1, 9], 37]
+    assert len(os.listdir(cache_dir)) == 1
+
+    # После изменения файла старая запись удаляется
+    problem_path.write_text("x1 +x2 -> max\nx1 +x2 <= 3\n", encoding='utf-8')
+    sm = SimplexMethod()
+    sm.load_problem(str(problem_path), cache_dir=cache_dir)
+    assert sm.get_solution()[1] == 3
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Повреждённая запись (meta.json без поля) загружается заново из файла и перезаписывается
+    entry = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    with open(os.path.join(entry, "meta.json"), 'w', encoding='utf-8') as f:
+        json.dump({"objective_sense": "max"}, f)
+    for _ in range(2):
+        sm = SimplexMethod()
+        sm.load_problem(str(problem_path), cache_dir=cache_dir)
+        assert sm.get_solution()[1] == 3
+    with open(os.path.join(entry, "meta.json"), 'r', encoding='utf-8') as f:
+        assert "integer" in json.load(f)
+
+    # Если отметить использование записи нельзя (кэш только для чтения), запись всё равно читается
+    def utime(*args, **kwargs):
+        raise PermissionError("read-only")
+    monkeypatch.setattr(os, "utime", utime)
+    sm = SimplexMethod()
+    sm.load_problem(str(problem_path), cache_dir=cache_dir)
+    assert sm.get_solution()[1] == 3
+    monkeypatch.undo()
+
+    # Записи, не помещающиеся в заданный размер кэша, вытесняются
+    sm = SimplexMethod()
+    sm.load_mps('tests_txt/test_1.mps', cache_dir=cache_dir, cache_max_bytes=0)
+    assert sm.get_solution() == [[0, 0, 1, 9], 37]
+    assert os.listdir(cache_dir) == []
+
+def test_presolve():
+    # Задача из test_1.txt с ослабленной копией ограничения, фиксированной переменной x5,
+    # пустой строкой и избыточной границей x4 >= 0
+    for sparse, engine in [(False, "python"), (False, "numpy"), (True, "revised")]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_28.txt', sparse=sparse, presolve=True)
+        assert sm.presolve_info["rows_removed"] == 4
+        assert sm.presolve_info["columns_removed"] == 1
+        assert sm.get_solution(engine=engine) == [[0, 0, 1, 9, 2], 39]
+
+    # Противоречие между ограничениями с одинаковыми коэффициентами обнаруживается ещё при предварительной обработке
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_27.txt', presolve=True)
+    assert sm.get_solution() is None
+    assert sm.status == "infeasible"
+
+    # Противоречивые границы переменной, не входящей в ограничения
+    sm = SimplexMethod.from_data([1, 1], [[1, 0]], "<=", [4], bounds={1: (3, 1)}, presolve=True)
+    assert sm.get_solution() is None
+    assert sm.status == "infeasible"
+
+    # Переменная с совпадающими входными границами подставляется в ограничения
+    sm = SimplexMethod.from_data([1, 1], [[1, 1]], "<=", [4], bounds={1: (2, 2)}, presolve=True)
+    assert [1, 2] in sm.presolve_info["fixed"]
+    assert sm.get_solution() == [[2, 2], 4]
+
+def test_scaling():
+    # Задача из test_1.txt после замены x1 = 1000y1, x4 = 0.001y4 и умножения первого ограничения на 10000
+    for engine in ["python", "numpy", "revised"]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_29.txt')
+        sm.get_solution(engine=engine)
+        unscaled_iterations = sm.iterations
+        for scaling in SCALING_METHODS:
+            assert sm.get_solution(engine=engine, scaling=scaling) == [[0, 0, 1, 9000], 37]
+            assert sm.iterations <= unscaled_iterations
+
+def test_variable_bounds():
+    # Задача из test_1.txt с границами 0 <= x4 <= 5 и -1 <= x1 <= 3
+    for sparse, engine in [(False, "python"), (False, "numpy"), (False, "revised"), (True, "revised")]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_30.txt', sparse=sparse)
+        assert sm.lower_bounds == [-1, 0, 0, 0]
+        assert sm.upper_bounds == [3, float("inf"), float("inf"), 5]
+        assert sm.get_solution(engine=engine) == [[-1, 5.5, 0.5, 5], 35]
+
+    # Та же задача в формате CPLEX LP: границы не превращаются в ограничения
+    sm = SimplexMethod()
+    sm.load_lp('tests_txt/test_30.lp')
+    assert len(sm.constraint_rhs) == 3
+    assert sm.get_solution(engine="revised") == [[-1, 5.5, 0.5, 5], 35]
+
+def test_bounds_without_extra_rows():
+    # Верхние границы учитываются в тесте отношений: рабочая таблица остаётся размером с каноническую
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_30.txt')
+    for engine in ["python", "numpy"]:
+        for method in ["primal", "auto"]:
+            assert sm.get_solution(engine=engine, method=method) == [[-1, 5.5, 0.5, 5], 35]
+            assert len(sm.st) == len(sm.constraint_rhs)
+            assert len(sm.st[0]) == len(sm.canonical_problem_table[0])
+
+    # Повторное решение продолжает с таблицы последнего ответа, а не решает ЗЛП с границами заново
+    assert sm.resolve(rhs=[11, 9, 6]) == [[-1, 6.5, 0.5, 5], 38]
+    assert sm.iterations == 0
+    assert sm.resolve(constraint=([0, 1], "<=", 5)) == [[0, 5, 1, 5], 36]
+    assert sm.st.shape == (4, len(sm.canonical_problem_table[0]))
+
+    # В пакете задачи с границами решаются движком "numpy" по отдельности
+    problems = []
+    for bounds in [None, [(-1, 3), None, None, (0, 5)]]:
+        problems.append(SimplexMethod.from_data([2, 3, 1, 4], [[1, 1, 1, 1], [2, 1, -1, 1], [0, 1, 2, 1]],
+                                                ["<=", "=", ">="], [10, 8, 5], bounds=bounds, objective_sense="max"))
+    answers = solve_batch(problems)
+    assert answers[1] == [[-1, 5.5, 0.5, 5], 35]
+    assert answers[0] == SimplexMethod.from_data([2, 3, 1, 4], [[1, 1, 1, 1], [2, 1, -1, 1], [0, 1, 2, 1]],
+                                                 ["<=", "=", ">="], [10, 8, 5],
+                                                 objective_sense="max").get_solution(engine="numpy", method="primal")
+
+def test_two_phase():
+    # Второе ограничение-равенство повторяет первое: строка линейно зависима и отбрасывается в фазе I
+    for sparse, engine in [(False, "python"), (False, "numpy"), (True, "revised")]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_31.txt', sparse=sparse)
+        assert sm.get_solution(engine=engine) == [[0, 4, 3], 7]
+        assert sm.infeasibility_certificate is None
+
+    # Сертификат недопустимости: сумма ограничений с множителями mu даёт g * x <= h, где g >= 0, h < 0
+    for engine in ["python", "numpy", "revised"]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_27.txt')
+        assert sm.get_solution(engine=engine) is None
+        assert sm.status == "infeasible"
+        mu = sm.infeasibility_certificate
+        assert mu[0] >= 0 and mu[1] <= 0
+        g = [sum(m * row[j] for m, row in zip(mu, sm.constraint_matrix)) for j in range(2)]
+        h = sum(m * b for m, b in zip(mu, sm.constraint_rhs))
+        assert all(value >= -1e-9 for value in g) and h < 0
+
+def test_dual_simplex():
+    # Минимизация с ограничениями ">=": начальный базис двойственно допустим, но все b отрицательны
+    for sparse, engine in [(False, "python"), (False, "numpy"), (False, "revised"), (True, "revised")]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_32.txt', sparse=sparse)
+        assert sm.get_solution(engine=engine, method="primal") == [[0, 7, 3, 0], 19]
+        primal_iterations = sm.iterations
+        for method in ["dual", "auto"]:
+            assert sm.get_solution(engine=engine, method=method) == [[0, 7, 3, 0], 19]
+            assert sm.iterations < primal_iterations
+
+    # В задаче с ограничением "=" нет начального базиса из дополнительных переменных
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_1.txt')
+    with pytest.raises(ValueError):
+        sm.get_solution(method="dual")
+    assert sm.get_solution(method="auto") == [[0, 0, 1, 9], 37]
+
+def test_anti_cycling():
+    # Пример Била: без защиты от зацикливания симплекс-метод с правилом "dantzig" зацикливается
+    for engine in ["python", "numpy", "revised"]:
+        for anti_cycling in ANTI_CYCLING_RULES:
+            sm = SimplexMethod()
+            sm.load_problem('tests_txt/test_33.txt')
+            assert sm.get_solution(engine=engine, anti_cycling=anti_cycling) == [[1, 0, 1, 0], 1.25]
+
+    for anti_cycling in ANTI_CYCLING_RULES:
+        problems = []
+        for _ in range(2):
+            sm = SimplexMethod()
+            sm.load_problem('tests_txt/test_33.txt')
+            problems.append(sm)
+        assert solve_batch(problems, anti_cycling=anti_cycling) == [[[1, 0, 1, 0], 1.25]] * 2
+
+
+def test_solve_stats():
+    for engine in ["python", "numpy", "revised"]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_1.txt')
+        events = []
+        answer, stats = sm.get_solution(engine=engine, stats=True, callback=events.append)
+        assert answer == [[0, 0, 1, 9], 37]
+        assert stats is sm.stats
+        assert sum(stats.iterations.values()) == sm.iterations == len(events)
+        assert stats.iterations["phase_one"] > 0 and stats.iterations["phase_two"] > 0
+        assert [event["iteration"] for event in events] == list(range(1, sm.iterations + 1))
+        for key in ["parsing", "canonicalization", "phase_one", "phase_two", "pricing"]:
+            assert stats.times[key] >= 0
+        assert stats.peak_table_size > 0
+
+        # Без сбора статистики возвращается только ответ
+        assert sm.get_solution(engine=engine) == [[0, 0, 1, 9], 37]
+        assert sm.stats is None
+
+    # Задача о покрытии решается двойственным симплекс-методом
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_32.txt')
+    _, stats = sm.get_solution(stats=True)
+    assert stats.iterations == {"phase_one": 0, "dual": 3, "phase_two": 0, "interior": 0, "crossover": 0}
+
+
+def test_benchmark_generators(tmp_path):
+    for result in benchmark.run_benchmark(sizes=[4], repeat=1):
+        assert result["correct"], result
+        assert result["peak_memory"] > 0
+
+    # Сгенерированная ЗЛП, сохранённая в txt-файл, решается так же, как загруженная из памяти
+    problem = benchmark.random_feasible(6, seed=1)
+    benchmark.write_problem(problem, tmp_path / "random.txt")
+    sm = SimplexMethod()
+    sm.load_problem(str(tmp_path / "random.txt"))
+    assert sm.get_solution() == benchmark.load(problem).get_solution()
+
+    answer = benchmark.load(benchmark.klee_minty(6)).get_solution()
+    assert answer[1] == 5 ** 6
+
+    # Ограничение итераций записывается статусом, а замедление короче REGRESSION_MIN_DELTA считается шумом
+    result = benchmark.run_case(benchmark.klee_minty(12), "numpy", repeat=1, max_iterations=100)
+    assert result["status"] == "iteration_limit" and not result["correct"]
+    case = {"generator": "random", "size": 10, "engine": "numpy", "iterations": 8, "correct": True}
+    assert benchmark.compare([dict(case, time=0.004, median_time=0.005)], [dict(case, time=0.001, median_time=0.001)]) == []
+    assert benchmark.compare([dict(case, time=0.1, median_time=0.2)], [dict(case, time=0.1, median_time=0.1)]) != []
+
+
+def test_solve_limits():
+    for engine in ["python", "numpy", "revised"]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_1.txt')
+
+        # Ограничение сработало в фазе I: допустимого базиса ещё нет
+        assert sm.get_solution(engine=engine, max_iterations=1) is None
+        assert (sm.status, sm.iterations) == ("iteration_limit", 1)
+
+        # Ограничение сработало в фазе II: возвращается допустимое решение в последнем базисе
+        assert sm.get_solution(engine=engine, max_iterations=3) == [[1.5, 0, 0, 5], 23]
+        assert sm.status == "iteration_limit"
+
+        assert sm.get_solution(engine=engine, max_iterations=100) == [[0, 0, 1, 9], 37]
+        assert sm.status == "optimal"
+
+        # Решение, отменённое до первой итерации, останавливается в начальном базисе
+        sm = benchmark.load(benchmark.klee_minty(10))
+        token = CancellationToken()
+        token.cancel()
+        assert sm.get_solution(engine=engine, cancel=token) == [[0] * 10, 0]
+        assert (sm.status, sm.iterations) == ("cancelled", 0)
+
+        sm.get_solution(engine=engine, time_limit=0)
+        assert sm.status == "time_limit"
+
+
+def test_get_solution_async():
+    async def solve():
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_1.txt')
+        events = []
+        callback_events = []
+        answer = await sm.get_solution_async(progress=events.append, progress_interval=0, engine="numpy",
+                                             callback=callback_events.append)
+        await asyncio.sleep(0)
+        return answer, len(events), len(callback_events), sm.iterations
+
+    # callback вызывается вместе с progress, а не заменяется им
+    answer, number_of_events, number_of_callback_events, iterations = asyncio.run(solve())
+    assert answer == [[0, 0, 1, 9], 37]
+    assert number_of_events == number_of_callback_events == iterations
+
+
+def test_from_data():
+    # ЗЛП из tests_txt/test_1.txt в разных представлениях
+    objective = [2, 3, 1, 4]
+    matrix = [[1, 1, 1, 1], [2, 1, -1, 1], [0, 1, 2, 1]]
+    senses = ["<=", "=", ">="]
+    rhs = [10, 8, 5]
+    variants = [
+        (objective, matrix),
+        (dict(enumerate(objective)), [{j: a for j, a in enumerate(row) if a != 0} for row in matrix]),
+        (np.array(objective), np.array(matrix)),
+        (np.array(objective, dtype=float), sp.csr_matrix(np.array(matrix, dtype=float))),
+    ]
+    for objective_data, matrix_data in variants:
+        for presolve in [False, True]:
+            sm = SimplexMethod.from_data(objective_data, matrix_data, senses, rhs, "max", presolve=presolve)
+            engine = "revised" if sm.sparse else "python"
+            assert sm.get_solution(engine=engine) == [[0, 0, 1, 9], 37]
+
+    # Разреженная матрица в формате CSR хранится без копирования
+    csr = sp.csr_matrix(np.array(matrix, dtype=float))
+    sm = SimplexMethod.from_data(objective, csr, senses, rhs)
+    assert sm.sparse and sm.constraint_matrix is csr
+
+    sm = SimplexMethod.from_data(objective, matrix, senses, rhs, bounds=[None, None, (0, 0.5), None])
+    assert sm.get_solution() == [[0, 0, 0.5, 8.5], 34.5]
+
+    with pytest.raises(ValueError):
+        SimplexMethod.from_data(objective, matrix, senses, [10, 8])
+    with pytest.raises(ValueError):
+        SimplexMethod.from_data(objective, matrix, "<", rhs)
+
+
+def test_solution_cache():
+    cache = SolutionCache(max_size=2)
+    results = []
+    for name in ["test_1", "test_1", "test_2", "test_1", "test_3", "test_2"]:
+        sm = SimplexMethod()
+        sm.load_problem(f'tests_txt/{name}.txt')
+        results.append((sm.get_solution(cache=cache), sm.status, sm.basis_indexes, sm.iterations))
+    assert results[0] == results[1] == results[3]
+    assert results[2] == results[5]
+    assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (2, 4, 2, 2)
+
+    # Другие параметры решения - другой ключ; изменение ответа вызывающим не портит кэш
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_1.txt')
+    answer = sm.get_solution(engine="numpy", cache=cache)
+    assert cache.misses == 5
+    answer[0][0] = 100
+    assert sm.get_solution(engine="numpy", cache=cache) == [[0, 0, 1, 9], 37]
+
+    # Недопустимая ЗЛП: из кэша восстанавливается и сертификат недопустимости
+    sm = SimplexMethod()
+    sm.load_problem('tests_txt/test_27.txt')
+    sm.get_solution(cache=cache)
+    certificate = sm.infeasibility_certificate
+    assert sm.get_solution(cache=cache) is None
+    assert (sm.status, sm.infeasibility_certificate) == ("infeasible", certificate)
+
+    cache = SolutionCache(ttl=0)
+    sm.get_solution(cache=cache)
+    sm.get_solution(cache=cache)
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 2, 1)
+
+    # ЗЛП, отличающиеся только целевой функцией или её целью, имеют разные ключи
+    cache = SolutionCache()
+    for sparse in [False, True]:
+        problems = [({0: 1, 1: 2}, "max", [[0, 4], 8]), ({0: 3, 1: 1}, "max", [[4, 0], 12]),
+                    ({0: 3, 1: 1}, "min", [[0, 0], 0])]
+        for objective, objective_sense, expected in problems:
+            sm = SimplexMethod.from_data(objective, [{0: 1, 1: 1}], ['<='], [4], objective_sense, sparse=sparse)
+            engine = "revised" if sparse else "python"
+            assert sm.get_solution(engine=engine, cache=cache) == expected
+
+
+def test_sensitivity():
+    for engine in ["python", "numpy", "revised"]:
+        sm = SimplexMethod()
+        sm.load_problem('tests_txt/test_1.txt')
+        sm.get_solution(engine=engine)
+        assert sm.sensitivity() == {
+            "shadow_prices": [2.5, 1.5, 0],
+            "reduced_costs": [-3.5, -1, 0, 0],
+            "rhs_ranges": [[8, float("inf")], [-10, 10], [float("-inf"), 11]],
+            "objective_ranges": [[float("-inf"), 5.5], [float("-inf"), 4], [-4, 8], [3, float("inf")]],
+        }
+
+    # Уменьшаем правую часть первого ограничения: при t = 2 меняется базис, после t = 3.5 решений нет
+    segments = sm.parametric(rhs_direction=[-1, 0, 0])
+    assert [(s["t_from"], s["t_to"], s["status"]) for s in segments] == [
+        (0, 2, "optimal"), (2, 3.5, "optimal"), (3.5, float("inf"), "infeasible")]
+    assert segments[1]["x"] == [0, 0, 0, 8] and segments[1]["objective"] == 32
+    assert segments[1]["objective_slope"] == -6
+
+    # Увеличиваем коэффициент при x1: после t = 3.5 выгоднее решение [6, 0, 4, 0]
+    segments = sm.parametric(objective_direction=[1, 0, 0, 0], t_max=10)
+    assert [(s["t_from"], s["t_to"]) for s in segments] == [(0, 3.5), (3.5, 10)]
+    assert segments[1]["x"] == [6, 0, 4, 0] and segments[1]["objective_slope"] == 6
+
+    sm.get_solution(max_iterations=1)
+    with pytest.raises(ValueError):
+        sm.sensitivity()
+
+
+def test_interior_point():
+    # С переходом к базису ответ - оптимальная вершина (в test_24 - другая, с тем же значением),
+    # без него - внутренняя точка оптимальной грани с тем же значением целевой функции
+    for i in range(1, 34):
+        sm = SimplexMethod()
+        sm.load_problem(f'tests_txt/test_{i}.txt')
+        expected = sm.get_solution(engine="numpy")
+        answer = sm.get_solution(engine="interior")
+        assert sm.status == ("unbounded" if i == 26 else "infeasible" if i == 27 else "optimal")
+        if expected is None:
+            assert answer is None
+            continue
+        assert answer[1] == expected[1]
+        assert i == 24 or answer == expected
+        assert sm.get_solution(engine="interior", crossover=False)[1] == pytest.approx(expected[1], abs=1e-6)
+        assert all(j is None for j in sm.basis_indexes)
+
+    # На кубе Кли-Минти метод внутренней точки не обходит вершины
+    sm = benchmark.load(benchmark.klee_minty(8))
+    answer, stats = sm.get_solution(engine="interior", stats=True)
+    assert answer[1] == 5 ** 8 and stats.iterations["interior"] < 2 ** 8 - 1
+    sm.sensitivity()
+
+    sm.get_solution(engine="interior", crossover=False)
+    with pytest.raises(ValueError):
+        sm.sensitivity()
+
+
+def test_solve_server():
+    with open('tests_txt/test_1.txt', 'r', encoding='utf-8') as f:
+        text = f.read()
+    lines = [json.dumps({"id": i, "text": text, "options": {"engine": "numpy"}}) for i in range(20)]
+    lines += [
+        json.dumps({"id": "data", "problem": {"objective": {"0": 3, "1": 2}, "constraint_matrix": [[1, 1], [1, -1]],
+                                              "constraint_senses": "<=", "constraint_rhs": [4, 2]}}),
+        json.dumps({"id": "lp", "path": 'tests_txt/test_1.lp', "format": "lp"}),
+        json.dumps({"id": "bad", "text": text, "options": {"engine": "unknown"}}),
+        "не JSON",
+    ]
+
+    # Ограничение на число запросов без ответа меньше числа запросов: чтение приостанавливается
+    with SolveServer(workers=2, batch_size=4, max_pending=3) as server:
+        output = io.StringIO()
+        server.serve_stream(io.StringIO("\n".join(lines) + "\n"), output)
+        responses = {response["id"]: response for response in map(json.loads, output.getvalue().splitlines())}
+        assert all(responses[i]["answer"] == [[0, 0, 1, 9], 37] for i in range(20))
+        assert responses["data"]["answer"] == [[3, 1], 11] and responses["lp"]["status"] == "optimal"
+        assert responses["bad"]["status"] == "error" and responses[None]["status"] == "error"
+
+        stats = server.stats()
+        assert stats["received"] == stats["completed"] == 23 and stats["errors"] == 1
+        assert stats["in_flight"] == 0 and stats["backpressure_waits"] > 0
+        assert stats["batches"] <= 23 and stats["latency"]["max"] >= stats["latency"]["p50"]
+
+        # Те же запросы через TCP-сокет
+        socket_server = server.socket_server(("127.0.0.1", 0))
+        thread = threading.Thread(target=socket_server.serve_forever)
+        thread.start()
+        try:
+            with socket.create_connection(socket_server.server_address) as client:
+                stream = client.makefile("rw", encoding="utf-8")
+                stream.write(lines[0] + "\n" + json.dumps({"id": "stats", "command": "stats"}) + "\n")
+                stream.flush()
+                client.shutdown(socket.SHUT_WR)
+                responses = {response["id"]: response for response in map(json.loads, stream)}
+        finally:
+            socket_server.shutdown()
+            socket_server.server_close()
+            thread.join()
+        assert responses[0]["answer"] == [[0, 0, 1, 9], 37] and responses["stats"]["stats"]["workers"] == 2
+
+    # Настройки сервера не меняют классы стандартной библиотеки
+    assert not socketserver.ThreadingTCPServer.daemon_threads
+    assert not socketserver.ThreadingTCPServer.allow_reuse_address
+
+
+def test_repeatable_solves():
+    # У экземпляров нет __dict__, строки канонической таблицы - массивы array("d")
+    sm = benchmark.load(benchmark.random_feasible(100))
+    assert not hasattr(sm, "__dict__")
+    assert all(isinstance(row, array) and row.typecode == "d" for row in sm.canonical_problem_table[1:])
+    canonical = [list(row) for row in sm.canonical_problem_table[1:]]
+
+    for engine in ["python", "numpy"]:
+        first = sm.get_solution(engine=engine)
+        st = sm.st
+        assert sm.get_solution(engine=engine) == first
+        assert [list(row) for row in sm.canonical_problem_table[1:]] == canonical
+
+        # Повторное решение работает в тех же буферах, что и первое
+        if engine == "numpy":
+            assert np.shares_memory(sm.st, st)
+            tracemalloc.start()
+            sm.get_solution(engine=engine)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert peak < sm.st.nbytes / 4
+        else:
+            assert all(a is b for a, b in zip(sm.st, st))
+
+    # Рабочие буферы не передаются при pickle (например, в процессы solve_many)
+    copy = pickle.loads(pickle.dumps(sm))
+    assert copy._row_buffers == [] and copy._numpy_buffers == {}
+    assert copy.get_solution(engine="numpy") == first
@@ -0,0 +1,21 @@
+NAME          TEST1
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  c1
+ E  c2
+ G  c3
+COLUMNS
+    x1        obj       2          c1        1
+    x1        c2        2
+    x2        obj       3          c1        1
+    x2        c2        1          c3        1
+    x3        obj       1          c1        1
+    x3        c2        -1         c3        2
+    x4        obj       4          c1        1
+    x4        c2        1          c3        1
+RHS
+    RHS       c1        10         c2        8
+    RHS       c3        5
+ENDATA